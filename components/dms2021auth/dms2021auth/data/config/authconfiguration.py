@@ -1,6 +1,7 @@
 """ AuthConfiguration class module.
 """
 
+from typing import Optional
 from dms2021core.data.config import Configuration
 
 
@@ -80,3 +81,144 @@ class AuthConfiguration(Configuration):
         """
 
         return str(self.get_value('salt') or '')
+
+    def get_password_hashing_algorithm(self) -> str:
+        """ Gets the algorithm the new password hashes are calculated with.
+        ---
+        Returns:
+            A string with the algorithm name (`pbkdf2_sha256` or `scrypt`).
+            Defaults to `pbkdf2_sha256`.
+        Throws:
+            - TypeError: if the password_hashing parameter is not a dictionary.
+        """
+
+        return str(self._get_optional_dict_value('password_hashing').get(
+            'algorithm', 'pbkdf2_sha256'
+        ))
+
+    def get_password_hashing_cost(self) -> Optional[int]:
+        """ Gets the cost of the new password hashes.
+        ---
+        Returns:
+            An integer with the number of iterations for `pbkdf2_sha256` or the
+            CPU/memory cost (N) for `scrypt`, or None to use the algorithm default.
+        Throws:
+            - TypeError: if the password_hashing parameter is not a dictionary.
+        """
+
+        cost = self._get_optional_dict_value('password_hashing').get('cost')
+        return int(str(cost)) if cost is not None else None
+
+    def get_password_hashing_workers(self) -> int:
+        """ Gets the number of processes the password hashes are calculated in.
+        ---
+        Returns:
+            An integer with the number of processes, 0 to calculate them in the
+            request thread. Defaults to 2.
+        Throws:
+            - TypeError: if the password_hashing parameter is not a dictionary.
+        """
+
+        return int(str(self._get_optional_dict_value('password_hashing').get('workers', 2)))
+
+    def get_capability_token_key(self) -> Optional[str]:
+        """ Gets the key used to sign the capability tokens.
+        ---
+        Returns:
+            A string with the key, or None if no tokens are to be issued.
+        Throws:
+            - TypeError: if the capability_tokens parameter is not a dictionary.
+        """
+
+        key = self._get_optional_dict_value('capability_tokens').get('key')
+        return str(key) if key else None
+
+    def get_capability_token_ttl(self) -> float:
+        """ Gets the time a capability token is valid for.
+        ---
+        Returns:
+            A float with the number of seconds. Defaults to 300.
+        Throws:
+            - TypeError: if the capability_tokens parameter is not a dictionary.
+        """
+
+        return float(str(self._get_optional_dict_value('capability_tokens').get('ttl', 300)))
+
+    def get_session_cache_capacity(self) -> int:
+        """ Gets the maximum number of active session tokens kept in memory.
+        ---
+        Returns:
+            An integer with the number of tokens, 0 to disable the cache. Defaults to 1024.
+        Throws:
+            - TypeError: if the session_cache parameter is not a dictionary.
+        """
+
+        return int(str(self._get_optional_dict_value('session_cache').get('capacity', 1024)))
+
+    def get_rights_snapshot_enabled(self) -> bool:
+        """ Gets whether the user rights are kept in memory or not.
+        ---
+        Returns:
+            A boolean with the value of the enabled flag. Defaults to True.
+        Throws:
+            - TypeError: if the rights_snapshot parameter is not a dictionary.
+        """
+
+        return bool(self._get_optional_dict_value('rights_snapshot').get('enabled', True))
+
+    def get_session_ttl(self) -> float:
+        """ Gets the time a session is valid for since the last login.
+        ---
+        Returns:
+            A float with the number of seconds, 0 if sessions do not expire. Defaults to 0.
+        Throws:
+            - TypeError: if the sessions parameter is not a dictionary.
+        """
+
+        return float(str(self._get_optional_dict_value('sessions').get('ttl', 0)))
+
+    def get_session_touch_interval(self) -> float:
+        """ Gets the interval between two writes of the update times of the reused sessions.
+        ---
+        Returns:
+            A float with the number of seconds, 0 to write them on every login.
+            Defaults to 1.
+        Throws:
+            - TypeError: if the sessions parameter is not a dictionary.
+        """
+
+        return float(str(self._get_optional_dict_value('sessions').get('touch_interval', 1)))
+
+    def get_session_sweep_interval(self) -> float:
+        """ Gets the interval between two deletions of the dead sessions.
+        ---
+        Returns:
+            A float with the number of seconds, 0 to disable the deletion. Defaults to 60.
+        Throws:
+            - TypeError: if the sessions parameter is not a dictionary.
+        """
+
+        return float(str(self._get_optional_dict_value('sessions').get('sweep_interval', 60)))
+
+    def get_session_sweep_batch_size(self) -> int:
+        """ Gets the maximum number of expired sessions deleted in a single transaction.
+        ---
+        Returns:
+            An integer with the number of sessions. Defaults to 500.
+        Throws:
+            - TypeError: if the sessions parameter is not a dictionary.
+        """
+
+        return int(str(self._get_optional_dict_value('sessions').get('sweep_batch_size', 500)))
+
+    def get_single_process(self) -> bool:
+        """ Gets whether the service runs in a single process or not.
+        ---
+        Returns:
+            False if the service is run by several production server workers;
+            True otherwise.
+        Throws:
+            - TypeError: if the server parameter is not a dictionary.
+        """
+
+        return self.get_server_mode() != 'production' or self.get_server_options()['workers'] <= 1
@@ -4,3 +4,4 @@
 from .user import User
 from .usersession import UserSession
 from .userright import UserRight
+from .lease import Lease
@@ -39,7 +39,7 @@ class User(ResultBase):
             'users',
             metadata,
             Column('username', String(32), primary_key=True),
-            Column('password', String(64), nullable=False)
+            Column('password', String(256), nullable=False)
         )
 
     @staticmethod
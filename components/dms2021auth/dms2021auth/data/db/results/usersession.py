@@ -2,10 +2,12 @@
 """
 
 from datetime import datetime
-from sqlalchemy import Table, MetaData, Column, ForeignKey  # type: ignore
+from typing import Optional
+from sqlalchemy import Table, MetaData, Column, ForeignKey, Index  # type: ignore
 from sqlalchemy import String, Boolean, DateTime  # type: ignore
 from sqlalchemy.orm import Session  # type: ignore
 from dms2021auth.data.db.results.resultbase import ResultBase
+from dms2021auth.data.db.sessiontokencache import SessionTokenCache
 
 
 class UserSession(ResultBase):
@@ -49,30 +51,40 @@ class UserSession(ResultBase):
                    ForeignKey('users.username'), nullable=False),
             Column('active', Boolean, nullable=False, default=True),
             Column('created', DateTime, nullable=False),
-            Column('updated', DateTime, nullable=False)
+            Column('updated', DateTime, nullable=False),
+            # Serves the lookup of the active session of a user on login
+            Index('ix_user_sessions_username_active', 'username', 'active'),
+            # Serves the sweeper lookups of the closed and the expired sessions
+            Index('ix_user_sessions_active_updated', 'active', 'updated')
         )
 
     def touch(self, session: Session, timestamp: datetime):
         """ Updates the update time.
         ---
         Note:
-            Any existing transaction will be committed.
+            Any existing transaction will be committed. The new update time is
+            stored in the session token cache, extending the session validity.
         Parameters:
             - session: The Session object that was used to retrieve this UserSession.
             - timestamp: A datetime with the timestamp to use.
         """
+        cache = SessionTokenCache.of(session)
+        stamp: Optional[int] = cache.stamp() if cache is not None else None
         try:
             self.updated = timestamp
             session.commit()
         except:
             session.rollback()
             raise
+        if cache is not None and self.active:
+            cache.put(self.token, self.username, timestamp, stamp)
 
     def deactivate(self, session: Session):
         """ Deactivates the session.
         ---
         Note:
-            Any existing transaction will be committed.
+            Any existing transaction will be committed. The token is removed from
+            the session token cache.
         Parameters:
             - session: The Session object that was used to retrieve this UserSession.
         """
@@ -82,3 +94,6 @@ class UserSession(ResultBase):
         except:
             session.rollback()
             raise
+        cache = SessionTokenCache.of(session)
+        if cache is not None:
+            cache.remove(self.token)
@@ -4,3 +4,4 @@
 from .users import Users
 from .usersessions import UserSessions
 from .userrights import UserRights
+from .leases import Leases
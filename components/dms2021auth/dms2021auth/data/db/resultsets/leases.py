@@ -0,0 +1,30 @@
+""" Leases class module.
+"""
+
+from datetime import timedelta
+from sqlalchemy.orm.session import Session  # type: ignore
+from dms2021core.data.db import LeaseStore
+from dms2021auth.data.db.results import Lease
+
+
+class Leases():
+    """ Class responsible of table-level lease operations.
+    """
+
+    @staticmethod
+    def acquire(session: Session, name: str, holder: str, ttl: timedelta) -> bool:
+        """ Takes or renews a lease.
+
+        See `LeaseStore.acquire`.
+        ---
+        Note:
+            Any existing transaction will be committed.
+        Parameters:
+            - session: The session object.
+            - name: The lease name.
+            - holder: A string identifying the requestor.
+            - ttl: Time after its last heartbeat a lease is considered abandoned.
+        Returns:
+            True if the requestor holds the lease; False otherwise.
+        """
+        return LeaseStore.acquire(session, Lease, name, holder, ttl)
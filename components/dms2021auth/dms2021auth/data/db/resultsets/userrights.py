@@ -1,13 +1,18 @@
 """ UserRights class module.
 """
 
-from typing import Optional
+from datetime import datetime
+from typing import List, Optional, Set, Tuple
+from sqlalchemy import and_  # type: ignore
 from sqlalchemy.orm import Session  # type: ignore
 from sqlalchemy.exc import IntegrityError  # type: ignore
 from sqlalchemy.orm.exc import NoResultFound  # type: ignore
 from dms2021core.data import UserRightName
-from dms2021auth.data.db.results import UserRight
+from dms2021auth.data.db.results import UserRight, UserSession
+from dms2021auth.data.db.rightssnapshot import RightsSnapshot
+from dms2021auth.data.db.sessiontokencache import SessionTokenCache
 from dms2021auth.data.db.exc import UserNotFoundError
+from dms2021auth.data.db.resultsets.usersessions import UserSessions
 
 
 class UserRights():
@@ -31,6 +36,27 @@ class UserRights():
         """
         if not username or not right:
             raise ValueError('A username and a right name are required.')
+        snapshot: Optional[RightsSnapshot] = RightsSnapshot.of(session)
+        if snapshot is None:
+            return UserRights.__store_grant(session, username, right)
+        with snapshot.writing():
+            user_right: UserRight = UserRights.__store_grant(session, username, right)
+            snapshot.grant(username, right)
+            return user_right
+
+    @staticmethod
+    def __store_grant(session: Session, username: str, right: UserRightName) -> UserRight:
+        """ Stores a right granted to a user, if not stored already.
+        ---
+        Parameters:
+            - session: The session object.
+            - username: The user name string.
+            - right: The right name.
+        Returns:
+            The UserRight result.
+        Throws:
+            - UserNotFoundError: If the user granted the right does not exist.
+        """
         user_right: Optional[UserRight] = UserRights.find_right(session, username, right)
         if user_right is not None:
             return user_right
@@ -61,6 +87,23 @@ class UserRights():
         """
         if not username or not right:
             raise ValueError('A username and a right name are required.')
+        snapshot: Optional[RightsSnapshot] = RightsSnapshot.of(session)
+        if snapshot is None:
+            UserRights.__store_revoke(session, username, right)
+            return
+        with snapshot.writing():
+            UserRights.__store_revoke(session, username, right)
+            snapshot.revoke(username, right)
+
+    @staticmethod
+    def __store_revoke(session: Session, username: str, right: UserRightName):
+        """ Deletes a right from a user, if stored.
+        ---
+        Parameters:
+            - session: The session object.
+            - username: The user name string.
+            - right: The right name.
+        """
         user_right: Optional[UserRight] = UserRights.find_right(session, username, right)
         if user_right is None:
             return
@@ -94,3 +137,125 @@ class UserRights():
             return query.one()
         except NoResultFound:
             return None
+
+    @staticmethod
+    def has_right(session: Session, username: str, right: UserRightName) -> bool:
+        """ Determines whether a user has a right, reading the rights snapshot if enabled.
+        ---
+        Parameters:
+            - session: The session object.
+            - username: The user name string.
+            - right: The right name.
+        Returns:
+            True if the user has the given right; false otherwise.
+        Throws:
+            - ValueError: If either the username or the right name is missing.
+        """
+        if not username or not right:
+            raise ValueError('A username and a right name are required.')
+        snapshot: Optional[RightsSnapshot] = RightsSnapshot.of(session)
+        if snapshot is not None:
+            return snapshot.has_right(username, right)
+        return UserRights.find_right(session, username, right) is not None
+
+    @staticmethod
+    def get_rights(session: Session, username: str) -> List[UserRightName]:
+        """ Gets every right of a user.
+        ---
+        Parameters:
+            - session: The session object.
+            - username: The user name string.
+        Returns:
+            A list with the names of the rights of the user. Empty if the user
+            does not exist.
+        Throws:
+            - ValueError: If the username is missing.
+        """
+        if not username:
+            raise ValueError('A username is required.')
+        snapshot: Optional[RightsSnapshot] = RightsSnapshot.of(session)
+        if snapshot is not None:
+            return snapshot.get_rights(username)
+        query = session.query(getattr(UserRight, 'right')).filter_by(username=username)
+        return [row.right for row in query]
+
+    @staticmethod
+    def find_rights(session: Session,
+                    checks: List[Tuple[str, UserRightName]]) -> Set[Tuple[str, UserRightName]]:
+        """ Finds which of several (user, right) pairs exist, in a single query.
+        ---
+        Parameters:
+            - session: The session object.
+            - checks: A list of (user name, right name) tuples.
+        Returns:
+            The set of the given pairs for which the user has the right.
+        """
+        if not checks:
+            return set()
+        snapshot: Optional[RightsSnapshot] = RightsSnapshot.of(session)
+        if snapshot is not None:
+            return {check for check in checks if snapshot.has_right(*check)}
+        usernames: Set[str] = {username for username, _ in checks}
+        rights: Set[UserRightName] = {right for _, right in checks}
+        right_username = getattr(UserRight, 'username')
+        right_name = getattr(UserRight, 'right')
+        query = session.query(right_username, right_name).filter(
+            right_username.in_(usernames),
+            right_name.in_(rights)
+        )
+        found: Set[Tuple[str, UserRightName]] = {(row.username, row.right) for row in query}
+        return found.intersection(checks)
+
+    @staticmethod
+    def find_session_rights(session: Session, session_token: str,
+                            rights: List[UserRightName]) -> Optional[Set[UserRightName]]:
+        """ Finds which of several rights the owner of an active session has, in a single query.
+
+        If the token is in the session token cache only the rights of its owner
+        are read, from the rights snapshot if enabled. Otherwise the session is
+        outer-joined to the requested rights of its user, so an existing session
+        is told apart from a user without any of the rights, and its owner is
+        cached.
+        ---
+        Parameters:
+            - session: The session object.
+            - session_token: The token of the user session.
+            - rights: A list of right names.
+        Returns:
+            The set of the given rights the session owner has, or None if there is
+            no active, unexpired session with that token.
+        """
+        cache = SessionTokenCache.of(session)
+        if cache is not None:
+            username: Optional[str] = cache.get(session_token)
+            if username is not None:
+                snapshot: Optional[RightsSnapshot] = RightsSnapshot.of(session)
+                if snapshot is not None:
+                    return {right for right in rights if snapshot.has_right(username, right)}
+                right_name = getattr(UserRight, 'right')
+                query = session.query(right_name).filter(
+                    getattr(UserRight, 'username') == username, right_name.in_(rights)
+                )
+                return {row.right for row in query.all()}
+        stamp: Optional[int] = cache.stamp() if cache is not None else None
+        right_username = getattr(UserRight, 'username')
+        right_name = getattr(UserRight, 'right')
+        session_username = getattr(UserSession, 'username')
+        query = session.query(
+            session_username, getattr(UserSession, 'updated'), right_name
+        ).outerjoin(
+            UserRight,
+            and_(right_username == session_username, right_name.in_(rights))
+        ).filter(
+            getattr(UserSession, 'token') == session_token,
+            getattr(UserSession, 'active').is_(True)
+        )
+        cutoff: Optional[datetime] = UserSessions.get_expiry_cutoff(session)
+        if cutoff is not None:
+            query = query.filter(getattr(UserSession, 'updated') >= cutoff)
+        rows = query.all()
+        if not rows:
+            return None
+        if cache is not None:
+            cache.put(session_token, rows[0].username, rows[0].updated, stamp)
+        return {row.right for row in rows if row.right is not None}
@@ -2,10 +2,13 @@
 """
 
 import hashlib
+from typing import List, Optional, Set, Tuple
 from sqlalchemy.exc import IntegrityError  # type: ignore
 from sqlalchemy.orm.session import Session  # type: ignore
 from sqlalchemy.orm.exc import NoResultFound  # type: ignore
-from dms2021auth.data.db.results import User
+from dms2021core.data import UserRightName
+from dms2021auth.data.db.results import User, UserRight
+from dms2021auth.data.db.rightssnapshot import RightsSnapshot
 from dms2021auth.data.db.exc import UserExistsError
 
 
@@ -40,6 +43,74 @@ class Users():
                 'A user with name ' + username + ' already exists.'
                 ) from ex
 
+    @staticmethod
+    def find_existing(session: Session, usernames: List[str]) -> Set[str]:
+        """ Finds which of several users exist, in a single query.
+        ---
+        Parameters:
+            - session: The session object.
+            - usernames: A list of user name strings.
+        Returns:
+            The set of the given user names that already exist.
+        """
+        if not usernames:
+            return set()
+        user_username = getattr(User, 'username')
+        query = session.query(user_username).filter(user_username.in_(set(usernames)))
+        return {row.username for row in query}
+
+    @staticmethod
+    def create_many(session: Session,
+                    users: List[Tuple[str, str, List[UserRightName]]]) -> None:
+        """ Creates several users and grants them their rights in a single transaction.
+        ---
+        Note:
+            Any existing transaction will be committed.
+        Parameters:
+            - session: The session object.
+            - users: A list of (user name, password hash, right names) tuples.
+        Throws:
+            - ValueError: If any username or password hash is empty.
+            - UserExistsError: If any of the users already exists. No user is
+              created in that case.
+        """
+        if not all(username and password_hash for username, password_hash, _ in users):
+            raise ValueError('A username and a password hash are required.')
+        if not users:
+            return
+        snapshot: Optional[RightsSnapshot] = RightsSnapshot.of(session)
+        try:
+            if snapshot is None:
+                Users.__store_many(session, users)
+                return
+            with snapshot.writing():
+                Users.__store_many(session, users)
+                for username, _, rights in users:
+                    for right in rights:
+                        snapshot.grant(username, right)
+        except IntegrityError as ex:
+            raise UserExistsError('Some of the users already exist.') from ex
+
+    @staticmethod
+    def __store_many(session: Session, users: List[Tuple[str, str, List[UserRightName]]]):
+        """ Stores several users and their rights in a single transaction.
+        ---
+        Parameters:
+            - session: The session object.
+            - users: A list of (user name, password hash, right names) tuples.
+        """
+        try:
+            session.add_all([User(username, password_hash) for username, password_hash, _ in users])
+            # The users must be inserted before the rights referencing them
+            session.flush()
+            session.add_all([
+                UserRight(username, right) for username, _, rights in users for right in set(rights)
+            ])
+            session.commit()
+        except:
+            session.rollback()
+            raise
+
     @staticmethod
     def user_exists(session: Session, username: str, password_hash: str) -> bool:
         """ Determines whether a user exists or not.
@@ -58,9 +129,49 @@ class Users():
             return False
         return True
 
+    @staticmethod
+    def get_password_hash(session: Session, username: str) -> Optional[str]:
+        """ Gets the stored password hash of a user.
+        ---
+        Parameters:
+            - session: The session object.
+            - username: The user name string.
+        Returns:
+            A string with the password hash, or None if the user does not exist.
+        """
+        row = session.query(getattr(User, 'password')).filter_by(username=username).one_or_none()
+        return row.password if row is not None else None
+
+    @staticmethod
+    def update_password_hash(session: Session, username: str, password_hash: str) -> None:
+        """ Replaces the stored password hash of a user.
+        ---
+        Note:
+            Any existing transaction will be committed.
+        Parameters:
+            - session: The session object.
+            - username: The user name string.
+            - password_hash: The new password hash string.
+        Throws:
+            - ValueError: If either the username or the password_hash is empty.
+        """
+        if not username or not password_hash:
+            raise ValueError('A username and a password hash are required.')
+        try:
+            session.query(User).filter_by(username=username).update(
+                {'password': password_hash}, synchronize_session=False
+            )
+            session.commit()
+        except:
+            session.rollback()
+            raise
+
     @staticmethod
     def hash_password(password: str, suffix: str = '', salt: str = '') -> str:
-        """ A password hashing function compatible with the schema.
+        """ The legacy password hashing function, a single SHA-256.
+
+        New hashes are calculated by the password hashers of the logic layer; this
+        one is only used to verify the hashes stored before them.
         ---
         Parameters:
             - password: The password string.
@@ -2,23 +2,41 @@
 """
 
 import uuid
-from typing import Optional
-from datetime import datetime
+from typing import Dict, List, Optional
+from datetime import datetime, timedelta
 from sqlalchemy.orm.session import Session  # type: ignore
 from sqlalchemy.orm.exc import NoResultFound  # type: ignore
 from dms2021auth.data.db.exc import SessionNotFoundError
 from dms2021auth.data.db.results import UserSession
+from dms2021auth.data.db.sessiontokencache import SessionTokenCache
 
 
 class UserSessions():
     """ Class responsible of table-level user sessions operations.
     """
+    TTL_INFO_KEY: str = 'session_ttl'
+
+    @staticmethod
+    def get_expiry_cutoff(session: Session) -> Optional[datetime]:
+        """ Gets the oldest update time of a session that has not expired.
+        ---
+        Parameters:
+            - session: The session object.
+        Returns:
+            A datetime, or None if sessions do not expire.
+        """
+        ttl: Optional[timedelta] = session.info.get(UserSessions.TTL_INFO_KEY)
+        if ttl is None:
+            return None
+        return datetime.now() - ttl
+
     @staticmethod
     def create(session: Session, username: str) -> UserSession:
         """ Creates a new user session record.
         ---
         Note:
-            Any existing transaction will be committed.
+            Any existing transaction will be committed. The token is stored in the
+            session token cache.
         Parameters:
             - session: The session object.
             - username: The user name string.
@@ -37,10 +55,14 @@ class UserSessions():
             )
             session.add(new_user_session)
             session.commit()
-            return new_user_session
         except Exception as ex:
             session.rollback()
             raise ex
+        cache = SessionTokenCache.of(session)
+        if cache is not None:
+            cache.put(new_user_session.token, new_user_session.username,
+                      new_user_session.updated)
+        return new_user_session
 
     @staticmethod
     def find_session_for_user(session: Session, username: str) -> Optional[UserSession]:
@@ -50,14 +72,16 @@ class UserSessions():
             - session: The session object.
             - username: The user name string.
         Returns:
-            The UserSession found, or None if no active session existed.
+            The UserSession found, the most recently updated one if several were
+            found, or None if no active, unexpired session existed.
         """
-        try:
-            query = session.query(UserSession)
-            query = query.filter_by(username=username, active=True)
-            return query.one()
-        except NoResultFound:
-            return None
+        session_updated = getattr(UserSession, 'updated')
+        query = session.query(UserSession)
+        query = query.filter_by(username=username, active=True)
+        cutoff: Optional[datetime] = UserSessions.get_expiry_cutoff(session)
+        if cutoff is not None:
+            query = query.filter(session_updated >= cutoff)
+        return query.order_by(session_updated.desc()).first()
 
     @staticmethod
     def find_session_by_token(session: Session, session_token: str, active_only: bool = True):
@@ -66,7 +90,8 @@ class UserSessions():
         Parameters:
             - session: The session object.
             - session_token: The session token.
-            - active_only: Whether only active sessions (default) should be retrieved or not.
+            - active_only: Whether only active, unexpired sessions (default) should be
+                           retrieved or not.
         Returns:
             The UserSession found, or None if no matching session was found.
         """
@@ -75,6 +100,9 @@ class UserSessions():
             query = query.filter_by(token=session_token)
             if active_only:
                 query = query.filter_by(active=True)
+                cutoff: Optional[datetime] = UserSessions.get_expiry_cutoff(session)
+                if cutoff is not None:
+                    query = query.filter(getattr(UserSession, 'updated') >= cutoff)
             return query.one()
         except NoResultFound:
             return None
@@ -88,11 +116,91 @@ class UserSessions():
         Returns:
             The requested UserSession result.
         Throws:
-            - SessionNotFound: When the provided session was not found or is inactive.
+            - SessionNotFound: When the provided session was not found, is inactive or
+                               has expired.
         """
+        cache = SessionTokenCache.of(session)
+        stamp: Optional[int] = cache.stamp() if cache is not None else None
         user_session: Optional[UserSession] = UserSessions.find_session_by_token(
             session, session_token, active_only=True
         )
         if user_session is None:
             raise SessionNotFoundError()
+        if cache is not None:
+            cache.put(user_session.token, user_session.username, user_session.updated, stamp)
         return user_session
+
+    @staticmethod
+    def touch_cached(session: Session, user_session: UserSession, timestamp: datetime) -> None:
+        """ Stores a new update time of a session in the session token cache only.
+
+        Meant for the touches that are written to the database later on.
+        ---
+        Parameters:
+            - session: The session object.
+            - user_session: The UserSession touched.
+            - timestamp: A datetime with the new update time.
+        """
+        cache = SessionTokenCache.of(session)
+        if cache is not None and user_session.active:
+            cache.put(user_session.token, user_session.username, timestamp)
+
+    @staticmethod
+    def touch_many(session: Session, touches: Dict[str, datetime]) -> None:
+        """ Updates the update time of several sessions in a single transaction.
+        ---
+        Note:
+            Any existing transaction will be committed.
+        Parameters:
+            - session: The session object.
+            - touches: A dictionary with the new update time of every session token.
+        """
+        if not touches:
+            return
+        try:
+            session.bulk_update_mappings(UserSession, [
+                {'token': token, 'updated': updated} for token, updated in touches.items()
+            ])
+            session.commit()
+        except:
+            session.rollback()
+            raise
+
+    @staticmethod
+    def delete_dead_sessions(session: Session, batch_size: int) -> int:
+        """ Deletes a batch of closed sessions and, if sessions expire, of expired ones.
+        ---
+        Note:
+            Any existing transaction will be committed.
+        Parameters:
+            - session: The session object.
+            - batch_size: Maximum number of sessions deleted.
+        Returns:
+            The number of sessions deleted.
+        """
+        batch_size = max(1, batch_size)
+        session_token = getattr(UserSession, 'token')
+        session_active = getattr(UserSession, 'active')
+        tokens: List[str] = [row.token for row in session.query(session_token).filter(
+            session_active.is_(False)
+        ).limit(batch_size)]
+        cutoff: Optional[datetime] = UserSessions.get_expiry_cutoff(session)
+        if cutoff is not None and len(tokens) < batch_size:
+            tokens += [row.token for row in session.query(session_token).filter(
+                session_active.is_(True), getattr(UserSession, 'updated') < cutoff
+            ).limit(batch_size - len(tokens))]
+        if not tokens:
+            return 0
+        try:
+            session.query(UserSession).filter(session_token.in_(tokens)).delete(
+                synchronize_session=False
+            )
+            session.commit()
+        except:
+            session.rollback()
+            raise
+        cache = SessionTokenCache.of(session)
+        if cache is not None:
+            for token in tokens:
+                cache.remove(token)
+        return len(tokens)
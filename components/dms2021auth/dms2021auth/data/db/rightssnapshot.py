@@ -0,0 +1,135 @@
+""" RightsSnapshot class module.
+"""
+
+from contextlib import contextmanager
+from threading import Lock, RLock
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from sqlalchemy.orm.session import Session  # type: ignore
+from dms2021core.data import UserRightName
+
+
+class RightsSnapshot():
+    """ In-memory copy of every user right, stored as a bitmask per user.
+
+    Rights are only granted and revoked by the auth service, so once loaded the
+    snapshot is kept up to date by writing through it and the rights can be
+    checked without reading the database.
+    """
+
+    INFO_KEY: str = 'rights_snapshot'
+
+    def __init__(self, user_rights: Iterable[Tuple[str, UserRightName]]):
+        """ Constructor method.
+
+        Initializes the snapshot with the rights currently stored.
+        ---
+        Parameters:
+            - user_rights: An iterable of (user name, right name) tuples.
+        """
+        self.__masks: Dict[str, int] = {}
+        self.__write_lock: RLock = RLock()
+        self.__metrics_lock: Lock = Lock()
+        self.__metrics: Dict[str, float] = {
+            'lookups': 0,
+            'grants': 0,
+            'revokes': 0
+        }
+        for username, right in user_rights:
+            self.__masks[username] = self.__masks.get(username, 0) | self.__bit(right)
+
+    @staticmethod
+    def of(session: Session) -> Optional['RightsSnapshot']:
+        """ Gets the snapshot attached to a database session.
+        ---
+        Parameters:
+            - session: The session object.
+        Returns:
+            The RightsSnapshot of the schema the session belongs to, or None if
+            it is disabled.
+        """
+        return session.info.get(RightsSnapshot.INFO_KEY)
+
+    @staticmethod
+    def __bit(right: UserRightName) -> int:
+        """ Gets the bit representing a right in the masks.
+        ---
+        Parameters:
+            - right: The right name.
+        Returns:
+            An integer with only the bit of the right set.
+        """
+        return 1 << right.value
+
+    @contextmanager
+    def writing(self) -> Iterator[None]:
+        """ Serializes the rights changes, so the snapshot is updated in the same
+        order the changes are committed.
+        """
+        with self.__write_lock:
+            yield
+
+    def has_right(self, username: str, right: UserRightName) -> bool:
+        """ Determines whether a given user has a certain right or not.
+        ---
+        Parameters:
+            - username: The user name string.
+            - right: The right name.
+        Returns:
+            True if the user has the given right; false otherwise.
+        """
+        with self.__metrics_lock:
+            self.__metrics['lookups'] += 1
+        return bool(self.__masks.get(username, 0) & self.__bit(right))
+
+    def get_rights(self, username: str) -> List[UserRightName]:
+        """ Gets every right of a user.
+        ---
+        Parameters:
+            - username: The user name string.
+        Returns:
+            A list with the names of the rights of the user.
+        """
+        with self.__metrics_lock:
+            self.__metrics['lookups'] += 1
+        mask: int = self.__masks.get(username, 0)
+        return [right for right in UserRightName if mask & self.__bit(right)]
+
+    def grant(self, username: str, right: UserRightName) -> None:
+        """ Records a right granted to a user.
+        ---
+        Parameters:
+            - username: The user name string.
+            - right: The right name.
+        """
+        with self.__write_lock:
+            self.__masks[username] = self.__masks.get(username, 0) | self.__bit(right)
+        with self.__metrics_lock:
+            self.__metrics['grants'] += 1
+
+    def revoke(self, username: str, right: UserRightName) -> None:
+        """ Records a right revoked from a user.
+        ---
+        Parameters:
+            - username: The user name string.
+            - right: The right name.
+        """
+        with self.__write_lock:
+            mask: int = self.__masks.get(username, 0) & ~self.__bit(right)
+            if mask:
+                self.__masks[username] = mask
+            else:
+                self.__masks.pop(username, None)
+        with self.__metrics_lock:
+            self.__metrics['revokes'] += 1
+
+    def get_metrics(self) -> Dict[str, float]:
+        """ Gets the snapshot metrics.
+        ---
+        Returns:
+            A dictionary with the number of lookups, grants and revokes, and the
+            number of users with any right.
+        """
+        with self.__metrics_lock:
+            metrics: Dict[str, float] = dict(self.__metrics)
+        metrics['users'] = len(self.__masks)
+        return metrics
@@ -1,13 +1,20 @@
 """ Schema class module.
 """
 
-from sqlalchemy import create_engine, event  # type: ignore
+import logging
+from datetime import timedelta
+from typing import Dict, Optional
+from sqlalchemy import event  # type: ignore
 from sqlalchemy.engine import Engine  # type: ignore
 from sqlalchemy.ext.declarative import declarative_base  # type: ignore
 from sqlalchemy.orm import sessionmaker  # type: ignore
 from sqlalchemy.orm.session import Session  # type: ignore
+from dms2021core.data.db import SchemaSetup
 from dms2021auth.data.config import AuthConfiguration
-from dms2021auth.data.db.results import User, UserSession, UserRight
+from dms2021auth.data.db.results import User, UserSession, UserRight, Lease
+from dms2021auth.data.db.resultsets import UserSessions
+from dms2021auth.data.db.rightssnapshot import RightsSnapshot
+from dms2021auth.data.db.sessiontokencache import SessionTokenCache
 
 
 # Required for SQLite to enforce FK integrity when supported
@@ -41,13 +48,81 @@ class Schema():
                 'A value for the configuration parameter `db_connection_string` is needed.'
             )
         db_connection_string: str = config.get_db_connection_string() or ''
-        self.__create_engine = create_engine(db_connection_string)
-        self.__session_maker = sessionmaker(bind=self.__create_engine)
+        self.__create_engine = SchemaSetup.new_engine(
+            db_connection_string, config.get_db_pool_options()
+        )
+        self.__sqlite_pragmas: Dict[str, str] = {}
+        if self.__create_engine.dialect.name == 'sqlite':
+            self.__sqlite_pragmas = config.get_sqlite_pragmas()
+            SchemaSetup.set_sqlite_pragmas(self.__create_engine, self.__sqlite_pragmas)
+        session_ttl: Optional[timedelta] = None
+        if config.get_session_ttl() > 0:
+            session_ttl = timedelta(seconds=config.get_session_ttl())
+        # The in-memory caches cannot be kept coherent between several worker processes
+        single_process: bool = config.get_single_process()
+        self.__session_token_cache: Optional[SessionTokenCache] = None
+        session_cache_capacity: int = config.get_session_cache_capacity()
+        if single_process and session_cache_capacity > 0:
+            self.__session_token_cache = SessionTokenCache(session_cache_capacity, session_ttl)
 
         User.map(self.__declarative_base.metadata)
         UserSession.map(self.__declarative_base.metadata)
         UserRight.map(self.__declarative_base.metadata)
+        Lease.map(self.__declarative_base.metadata)
         self.__declarative_base.metadata.create_all(self.__create_engine)
+        SchemaSetup.create_missing_indexes(self.__create_engine, self.__declarative_base.metadata)
+
+        self.__rights_snapshot: Optional[RightsSnapshot] = None
+        if single_process and config.get_rights_snapshot_enabled():
+            self.__rights_snapshot = self.__load_rights_snapshot()
+
+        # The caches and settings travel with every session so the resultsets can use them
+        self.__session_maker = sessionmaker(
+            bind=self.__create_engine,
+            info={
+                UserSessions.TTL_INFO_KEY: session_ttl,
+                SessionTokenCache.INFO_KEY: self.__session_token_cache,
+                RightsSnapshot.INFO_KEY: self.__rights_snapshot
+            }
+        )
+
+        logging.getLogger(__name__).info('Database settings: %s', self.get_db_settings())
+
+    def get_db_settings(self) -> Dict[str, str]:
+        """ Gets the effective settings of the database connections.
+        ---
+        Returns:
+            A dictionary with the connection pool status and, for SQLite
+            databases, the value of the configured pragmas as read back from a
+            connection.
+        """
+        settings: Dict[str, str] = {'pool': self.__create_engine.pool.status()}
+        if self.__sqlite_pragmas:
+            connection = self.__create_engine.raw_connection()
+            try:
+                cursor = connection.cursor()
+                for name in self.__sqlite_pragmas:
+                    cursor.execute('PRAGMA ' + name + ';')
+                    row = cursor.fetchone()
+                    # In-memory databases do not report every pragma (e.g. mmap_size)
+                    settings[name] = str(row[0]) if row is not None else 'unsupported'
+                cursor.close()
+            finally:
+                connection.close()
+        return settings
+
+    def __load_rights_snapshot(self) -> RightsSnapshot:
+        """ Loads every stored user right into memory.
+        ---
+        Returns:
+            A new RightsSnapshot object.
+        """
+        session: Session = Session(bind=self.__create_engine)
+        try:
+            query = session.query(getattr(UserRight, 'username'), getattr(UserRight, 'right'))
+            return RightsSnapshot((row.username, row.right) for row in query)
+        finally:
+            session.close()
 
     def new_session(self) -> Session:
         """ Constructs a new session.
@@ -56,3 +131,29 @@ class Schema():
             A new `Session` object.
         """
         return self.__session_maker()
+
+    def dispose(self) -> None:
+        """ Closes every pooled database connection.
+
+        Must be called in a forked process before using the schema, so the
+        connections opened by the parent process are not shared.
+        """
+        self.__create_engine.dispose()
+
+    def get_session_token_cache(self) -> Optional[SessionTokenCache]:
+        """ Gets the cache of the active session tokens.
+        ---
+        Returns:
+            The SessionTokenCache shared by the sessions of this schema, or None if
+            it is disabled.
+        """
+        return self.__session_token_cache
+
+    def get_rights_snapshot(self) -> Optional[RightsSnapshot]:
+        """ Gets the in-memory copy of the user rights.
+        ---
+        Returns:
+            The RightsSnapshot shared by the sessions of this schema, or None if
+            it is disabled.
+        """
+        return self.__rights_snapshot
@@ -0,0 +1,136 @@
+""" SessionTokenCache class module.
+"""
+
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import Dict, Optional, Tuple
+from sqlalchemy.orm.session import Session  # type: ignore
+
+
+class SessionTokenCache():
+    """ Bounded LRU cache mapping the tokens of the active sessions to their usernames.
+
+    The auth service is the only writer of the user sessions, so the cache is
+    kept coherent by writing through it whenever a session is created or
+    deactivated. Tokens missing from the cache are looked up in the database.
+    Sessions not updated within the TTL are considered expired.
+    """
+
+    INFO_KEY: str = 'session_token_cache'
+
+    def __init__(self, capacity: int = 1024, ttl: Optional[timedelta] = None):
+        """ Constructor method.
+
+        Initializes an empty cache.
+        ---
+        Parameters:
+            - capacity: Maximum number of tokens kept.
+            - ttl: Time a session is valid for since its last update, or None if
+                   sessions do not expire.
+        """
+        self.__capacity: int = max(1, capacity)
+        self.__ttl: Optional[timedelta] = ttl
+        self.__entries: OrderedDict = OrderedDict()
+        self.__lock: Lock = Lock()
+        self.__invalidations: int = 0
+        self.__metrics: Dict[str, float] = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'expired': 0,
+            'invalidations': 0
+        }
+
+    @staticmethod
+    def of(session: Session) -> Optional['SessionTokenCache']:
+        """ Gets the cache attached to a database session.
+        ---
+        Parameters:
+            - session: The session object.
+        Returns:
+            The SessionTokenCache of the schema the session belongs to, or None
+            if caching is disabled.
+        """
+        return session.info.get(SessionTokenCache.INFO_KEY)
+
+    def get(self, token: str) -> Optional[str]:
+        """ Gets the username owning an active session.
+        ---
+        Parameters:
+            - token: The session token.
+        Returns:
+            The username, or None if the token is not cached.
+        """
+        with self.__lock:
+            entry: Optional[Tuple[str, datetime]] = self.__entries.get(token)
+            if entry is None:
+                self.__metrics['misses'] += 1
+                return None
+            username, updated = entry
+            if self.__ttl is not None and updated < datetime.now() - self.__ttl:
+                del self.__entries[token]
+                self.__metrics['expired'] += 1
+                self.__metrics['misses'] += 1
+                return None
+            self.__entries.move_to_end(token)
+            self.__metrics['hits'] += 1
+            return username
+
+    def stamp(self) -> int:
+        """ Gets a stamp to be passed to `put` when caching a token read from the database.
+
+        The stamp must be taken before the database is read, so a session
+        deactivated in between is not cached again.
+        ---
+        Returns:
+            An integer identifying the current state of the cache.
+        """
+        with self.__lock:
+            return self.__invalidations
+
+    def put(self, token: str, username: str, updated: datetime,
+            stamp: Optional[int] = None) -> None:
+        """ Stores the owner of an active session, evicting the least recently used if full.
+        ---
+        Parameters:
+            - token: The session token.
+            - username: The username owning the session.
+            - updated: The datetime of the last update of the session.
+            - stamp: The value of `stamp` taken before reading the session from the
+                     database, or None if the session was just created.
+        """
+        with self.__lock:
+            if stamp is not None and stamp != self.__invalidations:
+                return
+            self.__entries[token] = (username, updated)
+            self.__entries.move_to_end(token)
+            while len(self.__entries) > self.__capacity:
+                self.__entries.popitem(last=False)
+                self.__metrics['evictions'] += 1
+
+    def remove(self, token: str) -> None:
+        """ Forgets a session that is no longer active.
+        ---
+        Parameters:
+            - token: The session token.
+        """
+        with self.__lock:
+            self.__entries.pop(token, None)
+            self.__invalidations += 1
+            self.__metrics['invalidations'] += 1
+
+    def get_metrics(self) -> Dict[str, float]:
+        """ Gets the cache metrics.
+        ---
+        Returns:
+            A dictionary with the hits, misses, evictions, expirations, invalidations,
+            hit rate and size.
+        """
+        with self.__lock:
+            metrics: Dict[str, float] = dict(self.__metrics)
+            metrics['size'] = len(self.__entries)
+        metrics['capacity'] = self.__capacity
+        lookups: float = metrics['hits'] + metrics['misses']
+        metrics['hit_rate'] = metrics['hits'] / lookups if lookups else 0.0
+        return metrics
@@ -5,3 +5,5 @@ from .usermanager import UserManager
 from .usersessionmanager import UserSessionManager
 from .userrightmanager import UserRightManager
 from .userrightvalidator import UserRightValidator
+from .sessiontoucher import SessionToucher
+from .sessionsweeper import SessionSweeper
@@ -0,0 +1,5 @@
+""" Password hashers package
+"""
+from .basepasswordhasher import BasePasswordHasher
+from .pbkdf2passwordhasher import PBKDF2PasswordHasher
+from .scryptpasswordhasher import ScryptPasswordHasher
@@ -0,0 +1,62 @@
+""" Base password hasher module
+"""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class BasePasswordHasher(ABC):
+    """ A base class for the password hashers.
+
+    Hashes are encoded as strings made of the algorithm name followed by its
+    parameters, salt and digest, separated by `$`, so they can be verified even
+    after the configured algorithm or cost changes.
+    """
+    ALGORITHM: str = ''
+
+    @staticmethod
+    def algorithm_of(password_hash: str) -> Optional[str]:
+        """ Gets the algorithm a password hash was calculated with.
+        ---
+        Parameters:
+            - password_hash: The encoded password hash.
+        Returns:
+            A string with the algorithm name, or None if the hash is not encoded by
+            any hasher (i.e., it is a legacy hash).
+        """
+        if '$' not in password_hash:
+            return None
+        return password_hash.split('$', 1)[0]
+
+    @abstractmethod
+    def hash(self, password: str) -> str:
+        """ Calculates the hash of a password with a new random salt.
+        ---
+        Parameters:
+            - password: The password string.
+        Returns:
+            A string with the encoded password hash.
+        """
+
+    @abstractmethod
+    def verify(self, password: str, password_hash: str) -> bool:
+        """ Determines whether a password matches a hash calculated by this algorithm.
+
+        The cost parameters stored in the hash are used, not the configured ones.
+        ---
+        Parameters:
+            - password: The password string.
+            - password_hash: The encoded password hash.
+        Returns:
+            True if the password matches; false otherwise.
+        """
+
+    @abstractmethod
+    def needs_rehash(self, password_hash: str) -> bool:
+        """ Determines whether a hash was calculated with other algorithm or cost.
+        ---
+        Parameters:
+            - password_hash: The encoded password hash.
+        Returns:
+            True if the hash should be calculated again; false otherwise.
+        """
@@ -0,0 +1,79 @@
+""" PBKDF2PasswordHasher class module.
+"""
+
+import hashlib
+import hmac
+import os
+from dms2021auth.logic.passwordhashers.basepasswordhasher import BasePasswordHasher
+
+
+class PBKDF2PasswordHasher(BasePasswordHasher):
+    """ Password hasher based on PBKDF2 with HMAC-SHA256.
+
+    Hashes are encoded as `pbkdf2_sha256$<iterations>$<salt>$<digest>`.
+    """
+    ALGORITHM: str = 'pbkdf2_sha256'
+
+    def __init__(self, iterations: int = 260000):
+        """ Constructor method.
+        ---
+        Parameters:
+            - iterations: The number of iterations (the cost) of new hashes.
+        """
+        self.__iterations: int = max(1, iterations)
+
+    def hash(self, password: str) -> str:
+        """ Calculates the hash of a password with a new random salt.
+        ---
+        Parameters:
+            - password: The password string.
+        Returns:
+            A string with the encoded password hash.
+        """
+        salt: str = os.urandom(16).hex()
+        return self.__encode(password, salt, self.__iterations)
+
+    def verify(self, password: str, password_hash: str) -> bool:
+        """ Determines whether a password matches a PBKDF2 hash.
+        ---
+        Parameters:
+            - password: The password string.
+            - password_hash: The encoded password hash.
+        Returns:
+            True if the password matches; false otherwise.
+        """
+        try:
+            algorithm, iterations, salt, _ = password_hash.split('$')
+            if algorithm != self.ALGORITHM:
+                return False
+            expected: str = self.__encode(password, salt, int(iterations))
+        except ValueError:
+            return False
+        return hmac.compare_digest(expected, password_hash)
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        """ Determines whether a hash was calculated with other algorithm or iterations.
+        ---
+        Parameters:
+            - password_hash: The encoded password hash.
+        Returns:
+            True if the hash should be calculated again; false otherwise.
+        """
+        fields = password_hash.split('$')
+        return len(fields) != 4 or fields[0] != self.ALGORITHM \
+            or fields[1] != str(self.__iterations)
+
+    def __encode(self, password: str, salt: str, iterations: int) -> str:
+        """ Calculates and encodes a hash.
+        ---
+        Parameters:
+            - password: The password string.
+            - salt: The salt string.
+            - iterations: The number of iterations.
+        Returns:
+            A string with the encoded password hash.
+        """
+        digest: bytes = hashlib.pbkdf2_hmac(
+            'sha256', password.encode('utf-8'), salt.encode('utf-8'), iterations
+        )
+        return '$'.join([self.ALGORITHM, str(iterations), salt, digest.hex()])
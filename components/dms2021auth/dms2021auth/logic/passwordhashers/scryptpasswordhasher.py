@@ -0,0 +1,89 @@
+""" ScryptPasswordHasher class module.
+"""
+
+import hashlib
+import hmac
+import os
+from dms2021auth.logic.passwordhashers.basepasswordhasher import BasePasswordHasher
+
+
+class ScryptPasswordHasher(BasePasswordHasher):
+    """ Password hasher based on scrypt.
+
+    Hashes are encoded as `scrypt$<n>$<r>$<p>$<salt>$<digest>`.
+    """
+    ALGORITHM: str = 'scrypt'
+
+    def __init__(self, n: int = 16384, r: int = 8, p: int = 1):
+        """ Constructor method.
+        ---
+        Parameters:
+            - n: The CPU/memory cost of new hashes. Must be a power of 2.
+            - r: The block size of new hashes.
+            - p: The parallelization factor of new hashes.
+        """
+        if n < 2 or n & (n - 1):
+            raise ValueError('The scrypt cost must be a power of 2 greater than 1.')
+        self.__n: int = n
+        self.__r: int = max(1, r)
+        self.__p: int = max(1, p)
+
+    def hash(self, password: str) -> str:
+        """ Calculates the hash of a password with a new random salt.
+        ---
+        Parameters:
+            - password: The password string.
+        Returns:
+            A string with the encoded password hash.
+        """
+        salt: str = os.urandom(16).hex()
+        return self.__encode(password, salt, self.__n, self.__r, self.__p)
+
+    def verify(self, password: str, password_hash: str) -> bool:
+        """ Determines whether a password matches a scrypt hash.
+        ---
+        Parameters:
+            - password: The password string.
+            - password_hash: The encoded password hash.
+        Returns:
+            True if the password matches; false otherwise.
+        """
+        try:
+            algorithm, n, r, p, salt, _ = password_hash.split('$')
+            if algorithm != self.ALGORITHM:
+                return False
+            expected: str = self.__encode(password, salt, int(n), int(r), int(p))
+        except ValueError:
+            return False
+        return hmac.compare_digest(expected, password_hash)
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        """ Determines whether a hash was calculated with other algorithm or cost.
+        ---
+        Parameters:
+            - password_hash: The encoded password hash.
+        Returns:
+            True if the hash should be calculated again; false otherwise.
+        """
+        fields = password_hash.split('$')
+        return len(fields) != 6 or fields[0] != self.ALGORITHM \
+            or fields[1:4] != [str(self.__n), str(self.__r), str(self.__p)]
+
+    def __encode(self, password: str, salt: str, n: int, r: int, p: int) -> str:
+        """ Calculates and encodes a hash.
+        ---
+        Parameters:
+            - password: The password string.
+            - salt: The salt string.
+            - n: The CPU/memory cost.
+            - r: The block size.
+            - p: The parallelization factor.
+        Returns:
+            A string with the encoded password hash.
+        """
+        # OpenSSL needs 128 * r * (n + p + 2) bytes, and checks it with some overhead
+        digest: bytes = hashlib.scrypt(
+            password.encode('utf-8'), salt=salt.encode('utf-8'), n=n, r=r, p=p,
+            maxmem=128 * r * (n + p + 2) + 1024 * 1024, dklen=32
+        )
+        return '$'.join([self.ALGORITHM, str(n), str(r), str(p), salt, digest.hex()])
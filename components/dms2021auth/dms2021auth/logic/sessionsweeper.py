@@ -0,0 +1,128 @@
+""" SessionSweeper class module.
+"""
+
+import logging
+import os
+import socket
+import time
+import uuid
+from datetime import timedelta
+from threading import Thread, Event, Lock
+from typing import Dict, Optional
+from sqlalchemy.orm.session import Session  # type: ignore
+from dms2021auth.data.db import Schema
+from dms2021auth.data.db.resultsets import Leases, UserSessions
+from dms2021auth.logic.sessiontoucher import SessionToucher
+
+
+class SessionSweeper(Thread):
+    """ Background thread deleting the closed and expired user sessions.
+
+    Sessions are deleted in batches, each in its own transaction, so the
+    database is never locked for long. When several processes share the
+    database, only the holder of the sweeper lease deletes them; the lease is
+    renewed on every sweep and taken by another process if its holder has not
+    swept for `LEASE_INTERVALS` intervals.
+    """
+
+    LEASE_NAME: str = 'session_sweeper'
+    LEASE_INTERVALS: int = 3
+
+    def __init__(self, schema: Schema, interval: float = 60.0, batch_size: int = 500,
+                 toucher: Optional[SessionToucher] = None):
+        """ Constructor method.
+
+        Initializes the sweeper. Nothing is deleted until the thread is started.
+        ---
+        Parameters:
+            - schema: The database schema instance to use.
+            - interval: Seconds between two sweeps.
+            - batch_size: Maximum number of sessions deleted in a single transaction.
+            - toucher: The SessionToucher whose pending touches are written before
+                       every sweep, if any, so reused sessions are not deleted.
+        """
+        Thread.__init__(self, name='SessionSweeper', daemon=True)
+        self.__schema: Schema = schema
+        self.__interval: float = max(0.1, interval)
+        self.__batch_size: int = max(1, batch_size)
+        self.__toucher: Optional[SessionToucher] = toucher
+        self.__holder: str = socket.gethostname() + ':' + str(os.getpid()) + ':' \
+            + uuid.uuid4().hex[:8]
+        self.__stopping: Event = Event()
+        self.__lock: Lock = Lock()
+        self.__metrics: Dict[str, float] = {
+            'sweeps': 0,
+            'skipped': 0,
+            'batches': 0,
+            'deleted': 0,
+            'failed': 0,
+            'last_deleted': 0,
+            'last_sweep_seconds': 0.0,
+            'max_sweep_seconds': 0.0
+        }
+
+    def run(self):
+        """ Runs the thread
+        """
+        while not self.__stopping.wait(self.__interval):
+            self.sweep()
+
+    def stop(self) -> None:
+        """ Requests the thread to stop.
+        """
+        self.__stopping.set()
+
+    def sweep(self) -> int:
+        """ Deletes every dead session, one batch after another.
+
+        Nothing is deleted if another process holds the sweeper lease.
+        ---
+        Returns:
+            The number of sessions deleted.
+        """
+        started: float = time.monotonic()
+        deleted: int = 0
+        batches: int = 0
+        failed: bool = False
+        if self.__toucher is not None:
+            self.__toucher.flush()
+        session: Session = self.__schema.new_session()
+        try:
+            if not Leases.acquire(session, self.LEASE_NAME, self.__holder,
+                                  timedelta(seconds=self.__interval * self.LEASE_INTERVALS)):
+                with self.__lock:
+                    self.__metrics['skipped'] += 1
+                return 0
+            while not self.__stopping.is_set():
+                batch: int = UserSessions.delete_dead_sessions(session, self.__batch_size)
+                batches += 1
+                deleted += batch
+                if batch < self.__batch_size:
+                    break
+        except Exception:  # pylint: disable=broad-except
+            failed = True
+            logging.getLogger(__name__).exception('Dead sessions could not be deleted')
+        finally:
+            session.close()
+        elapsed: float = time.monotonic() - started
+        with self.__lock:
+            self.__metrics['sweeps'] += 1
+            self.__metrics['batches'] += batches
+            self.__metrics['deleted'] += deleted
+            self.__metrics['failed'] += 1 if failed else 0
+            self.__metrics['last_deleted'] = deleted
+            self.__metrics['last_sweep_seconds'] = elapsed
+            self.__metrics['max_sweep_seconds'] = max(self.__metrics['max_sweep_seconds'],
+                                                      elapsed)
+        return deleted
+
+    def get_metrics(self) -> Dict[str, float]:
+        """ Gets the sweeper metrics.
+        ---
+        Returns:
+            A dictionary with the number of sweeps, sweeps skipped because another
+            process holds the lease, batches and sessions deleted, and the
+            duration of the sweeps.
+        """
+        with self.__lock:
+            return dict(self.__metrics)
@@ -0,0 +1,122 @@
+""" SessionToucher class module.
+"""
+
+import logging
+import time
+from datetime import datetime
+from threading import Thread, Event, Lock
+from typing import Dict
+from sqlalchemy.orm.session import Session  # type: ignore
+from dms2021auth.data.db import Schema
+from dms2021auth.data.db.resultsets import UserSessions
+
+
+class SessionToucher(Thread):
+    """ Background thread storing the update time of the reused sessions.
+
+    Touches are kept in memory, where repeated touches of the same session are
+    coalesced, and written together every `interval` seconds, so a burst of
+    logins does not turn into a burst of commits. The stored update times are
+    at most `interval` seconds behind.
+    """
+
+    def __init__(self, schema: Schema, interval: float = 1.0):
+        """ Constructor method.
+
+        Initializes the toucher. Nothing is written until the thread is started.
+        ---
+        Parameters:
+            - schema: The database schema instance to use.
+            - interval: Seconds between two writes of the pending touches.
+        """
+        Thread.__init__(self, name='SessionToucher', daemon=True)
+        self.__schema: Schema = schema
+        self.__interval: float = max(0.01, interval)
+        self.__pending: Dict[str, datetime] = {}
+        self.__stopping: Event = Event()
+        self.__lock: Lock = Lock()
+        self.__flush_lock: Lock = Lock()
+        self.__metrics: Dict[str, float] = {
+            'touches': 0,
+            'coalesced': 0,
+            'flushes': 0,
+            'rows_written': 0,
+            'rows_failed': 0,
+            'last_flush_seconds': 0.0,
+            'max_flush_seconds': 0.0
+        }
+
+    def touch(self, token: str, timestamp: datetime) -> None:
+        """ Queues the update of the update time of a session.
+        ---
+        Parameters:
+            - token: The session token.
+            - timestamp: A datetime with the timestamp to use.
+        """
+        with self.__lock:
+            self.__metrics['touches'] += 1
+            if token in self.__pending:
+                self.__metrics['coalesced'] += 1
+            self.__pending[token] = max(timestamp, self.__pending.get(token, timestamp))
+
+    def run(self):
+        """ Runs the thread
+        """
+        while not self.__stopping.wait(self.__interval):
+            self.flush()
+
+    def stop(self) -> None:
+        """ Writes every pending touch and stops the thread.
+        """
+        self.__stopping.set()
+        if self.is_alive():
+            self.join()
+        self.flush()
+
+    def flush(self) -> None:
+        """ Writes every pending touch in a single transaction.
+
+        If the write fails the touches are kept, unless newer ones were queued
+        in the meantime, so they are retried on the next flush.
+        """
+        with self.__flush_lock:
+            with self.__lock:
+                pending: Dict[str, datetime] = self.__pending
+                self.__pending = {}
+            if not pending:
+                return
+            started: float = time.monotonic()
+            written: int = 0
+            session: Session = self.__schema.new_session()
+            try:
+                UserSessions.touch_many(session, pending)
+                written = len(pending)
+            except Exception:  # pylint: disable=broad-except
+                logging.getLogger(__name__).exception(
+                    '%d session touches could not be stored', len(pending)
+                )
+                with self.__lock:
+                    for token, timestamp in pending.items():
+                        self.__pending.setdefault(token, timestamp)
+            finally:
+                session.close()
+            elapsed: float = time.monotonic() - started
+            with self.__lock:
+                self.__metrics['flushes'] += 1
+                self.__metrics['rows_written'] += written
+                self.__metrics['rows_failed'] += len(pending) - written
+                self.__metrics['last_flush_seconds'] = elapsed
+                self.__metrics['max_flush_seconds'] = max(self.__metrics['max_flush_seconds'],
+                                                          elapsed)
+
+    def get_metrics(self) -> Dict[str, float]:
+        """ Gets the toucher metrics.
+        ---
+        Returns:
+            A dictionary with the number of touches queued, coalesced and written,
+            the pending ones and the duration of the writes.
+        """
+        with self.__lock:
+            metrics: Dict[str, float] = dict(self.__metrics)
+            metrics['pending'] = len(self.__pending)
+        return metrics
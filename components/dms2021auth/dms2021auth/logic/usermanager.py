@@ -1,16 +1,65 @@
 """ UserManager class module.
 """
 
+import hmac
+import json
+from concurrent.futures import Executor
+from typing import Callable, Dict, List, Optional, Set, Tuple
+import yaml  # type: ignore
 from dms2021core.data import UserRightName
+from dms2021auth.data.config import AuthConfiguration
+from dms2021auth.data.db import Schema
 from dms2021auth.data.db.resultsets import Users
+from dms2021auth.data.db.exc import UserExistsError
 from dms2021auth.logic.managerbase import ManagerBase
 from dms2021auth.logic.userrightvalidator import UserRightValidator
+from dms2021auth.logic.passwordhashers import (
+    BasePasswordHasher, PBKDF2PasswordHasher, ScryptPasswordHasher
+)
 
 
 class UserManager(ManagerBase):
     """ Class responsible of the user management logic.
     """
 
+    def __init__(self, config: AuthConfiguration, schema: Schema):
+        """ Constructor method.
+
+        Initializes the manager.
+        ---
+        Parameters:
+            - config: An AuthConfiguration instance with the manager configurable parameters.
+            - schema: The database schema instance to use.
+        Throws:
+            - ValueError: If the configured password hashing algorithm is not supported.
+        """
+        super().__init__(config, schema)
+        # Verifiers of the hashes calculated with each algorithm, whatever their cost
+        self.__verifiers: Dict[str, BasePasswordHasher] = {
+            PBKDF2PasswordHasher.ALGORITHM: PBKDF2PasswordHasher(),
+            ScryptPasswordHasher.ALGORITHM: ScryptPasswordHasher()
+        }
+        algorithm: str = config.get_password_hashing_algorithm()
+        cost: Optional[int] = config.get_password_hashing_cost()
+        self.__hasher: BasePasswordHasher
+        if algorithm == PBKDF2PasswordHasher.ALGORITHM:
+            self.__hasher = PBKDF2PasswordHasher() if cost is None else PBKDF2PasswordHasher(cost)
+        elif algorithm == ScryptPasswordHasher.ALGORITHM:
+            self.__hasher = ScryptPasswordHasher() if cost is None else ScryptPasswordHasher(cost)
+        else:
+            raise ValueError('Unsupported password hashing algorithm: ' + algorithm)
+        self.__executor: Optional[Executor] = None
+        self.__dummy_hash: Optional[str] = None
+
+    def set_executor(self, executor: Optional[Executor]) -> None:
+        """ Sets the executor the password hashes are calculated in.
+        ---
+        Parameters:
+            - executor: An executor (usually a process pool), or None to calculate
+                        the hashes in the calling thread.
+        """
+        self.__executor = executor
+
     def create_user(
         self,
         username: str,
@@ -40,11 +89,150 @@ class UserManager(ManagerBase):
         session = self.get_schema().new_session()
         if not superuser:
             right_validator.enforce_rights(session_token, [UserRightName.AdminUsers])
-        password_hash = self.__calculate_password_hash(username, password)
+        password_hash = self.__run(self.__hasher.hash, self.__pepper(password))
         Users.create(session, username, password_hash)
 
+    @staticmethod
+    def parse_user_list(content: str, ndjson: bool = False) -> List[dict]:
+        """ Parses a list of users to be created in bulk.
+
+        The list is either a YAML sequence or, if `ndjson` is set, a JSON object
+        per line. Every user is a dictionary with the `username`, the `password`
+        and, optionally, a list with the names of its `rights`.
+        ---
+        Parameters:
+            - content: The list contents.
+            - ndjson: Whether the list is in NDJSON format or in YAML format.
+        Returns:
+            A list of dictionaries, one per user. They are not validated.
+        Throws:
+            - ValueError: If the content cannot be parsed or is not a list of dictionaries.
+        """
+        try:
+            if ndjson:
+                rows = [json.loads(line) for line in content.splitlines() if line.strip()]
+            else:
+                rows = yaml.load(content, Loader=yaml.SafeLoader) or []
+        except (json.JSONDecodeError, yaml.YAMLError) as ex:
+            raise ValueError('The user list could not be parsed.') from ex
+        if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+            raise ValueError('The user list must be a list of dictionaries.')
+        return rows
+
+    def create_users(
+        self,
+        rows: List[dict],
+        session_token: str,
+        right_validator: UserRightValidator,
+        superuser: bool = False
+    ) -> List[dict]:
+        """ Creates several users and grants them their rights in a single transaction.
+
+        Invalid rows and rows of users that already exist (or appear earlier in
+        the list) are reported and skipped, without aborting the others.
+        ---
+        Parameters:
+            - rows: A list of dictionaries with the `username`, the `password` and,
+                    optionally, the names of the `rights` of every user.
+            - session_token: The token of the session, used to verify that
+                             the requestor has sufficient rights.
+            - right_validator: The user right validator to use.
+            - superuser: If set, will not validate the requestor rights.
+                         Use ONLY for administrative purposes.
+        Returns:
+            A list with, for every row and in the same order, a dictionary with the
+            `username` and the `status` (`created`, `conflict` or `invalid`), plus
+            the `reason` if the user was not created.
+        Throws:
+            - InsufficientRightsError: If the requestor does not have the required rights.
+            - UserExistsError: If the users could not be created for a reason other
+              than some of them being created by another request meanwhile, which
+              are reported as conflicts. No user is created in that case.
+        """
+        session = self.get_schema().new_session()
+        if not superuser:
+            required: List[UserRightName] = [UserRightName.AdminUsers]
+            if any(row.get('rights') for row in rows):
+                required.append(UserRightName.AdminRights)
+            right_validator.enforce_rights(session_token, required)
+        results: List[dict] = []
+        valid: List[Tuple[int, str, str, List[UserRightName]]] = []
+        for index, row in enumerate(rows):
+            username = row.get('username')
+            results.append({'username': username, 'status': 'created'})
+            try:
+                valid.append((index, *self.__validate_user_row(row)))
+            except ValueError as ex:
+                results[index].update({'status': 'invalid', 'reason': str(ex)})
+        existing: Set[str] = Users.find_existing(session, [entry[1] for entry in valid])
+        seen: Set[str] = set()
+        accepted: List[Tuple[int, str, str, List[UserRightName]]] = []
+        for entry in valid:
+            if entry[1] in existing or entry[1] in seen:
+                results[entry[0]].update({
+                    'status': 'conflict', 'reason': 'The user already exists.'
+                })
+            else:
+                seen.add(entry[1])
+                accepted.append(entry)
+        peppered: List[str] = [self.__pepper(password) for _, _, password, _ in accepted]
+        if self.__executor is None:
+            password_hashes: List[str] = [self.__hasher.hash(password) for password in peppered]
+        else:
+            password_hashes = list(self.__executor.map(self.__hasher.hash, peppered))
+        pending: List[Tuple[int, str, str, List[UserRightName]]] = [
+            (index, username, password_hash, rights)
+            for (index, username, _, rights), password_hash in zip(accepted, password_hashes)
+        ]
+        while True:
+            try:
+                Users.create_many(session, [entry[1:] for entry in pending])
+                return results
+            except UserExistsError:
+                # Another request created some of the users meanwhile; skip them and retry
+                existing = Users.find_existing(session, [entry[1] for entry in pending])
+                if not existing:
+                    raise
+                for entry in pending:
+                    if entry[1] in existing:
+                        results[entry[0]].update({
+                            'status': 'conflict', 'reason': 'The user already exists.'
+                        })
+                pending = [entry for entry in pending if entry[1] not in existing]
+
+    @staticmethod
+    def __validate_user_row(row: dict) -> Tuple[str, str, List[UserRightName]]:
+        """ Validates a row of a bulk user creation.
+        ---
+        Parameters:
+            - row: A dictionary with the `username`, the `password` and, optionally,
+                   the names of the `rights` of the user.
+        Returns:
+            A (user name, password, right names) tuple.
+        Throws:
+            - ValueError: If the row is not valid.
+        """
+        username = row.get('username')
+        password = row.get('password')
+        right_names = row.get('rights') or []
+        if not isinstance(username, str) or not username:
+            raise ValueError('A non-empty username is required.')
+        if not isinstance(password, str) or not password:
+            raise ValueError('A non-empty password is required.')
+        if not isinstance(right_names, list):
+            raise ValueError('The rights must be a list of right names.')
+        try:
+            rights: List[UserRightName] = [UserRightName[str(name)] for name in right_names]
+        except KeyError as ex:
+            raise ValueError('Unknown right name: ' + str(ex)) from ex
+        return username, password, rights
+
     def user_exists(self, username: str, password: str) -> bool:
         """ Verifies whether a user with the given credentials exists or not.
+
+        If the credentials are correct but the stored hash was calculated with
+        the legacy hashing function or with another algorithm or cost, the hash
+        is calculated again and replaced.
         ---
         Parameters:
             - username: The user name string.
@@ -53,11 +241,64 @@ class UserManager(ManagerBase):
             True if the user exists and the credentials are correct; false otherwise.
         """
         session = self.get_schema().new_session()
-        password_hash = self.__calculate_password_hash(username, password)
-        return Users.user_exists(session, username, password_hash)
+        password_hash: Optional[str] = Users.get_password_hash(session, username)
+        if password_hash is None:
+            # Take as long as a wrong password would, so the response time does not
+            # tell which users exist
+            self.__run(self.__hasher.verify, self.__pepper(password), self.__get_dummy_hash())
+            return False
+        algorithm: Optional[str] = BasePasswordHasher.algorithm_of(password_hash)
+        if algorithm is None:
+            legacy_hash: str = self.__calculate_legacy_password_hash(username, password)
+            if not hmac.compare_digest(legacy_hash, password_hash):
+                return False
+        else:
+            verifier: Optional[BasePasswordHasher] = self.__verifiers.get(algorithm)
+            if verifier is None or not self.__run(
+                    verifier.verify, self.__pepper(password), password_hash):
+                return False
+        if algorithm is None or self.__hasher.needs_rehash(password_hash):
+            Users.update_password_hash(
+                session, username, self.__run(self.__hasher.hash, self.__pepper(password))
+            )
+        return True
+
+    def __get_dummy_hash(self) -> str:
+        """ Gets a hash calculated with the configured algorithm and cost, to verify
+            the passwords of the users that do not exist against.
+        ---
+        Returns:
+            A string with the password hash.
+        """
+        if self.__dummy_hash is None:
+            self.__dummy_hash = self.__run(self.__hasher.hash, self.__pepper(''))
+        return self.__dummy_hash
+
+    def __run(self, function: Callable, *args):
+        """ Runs a hashing function in the executor, or in this thread if there is none.
+        ---
+        Parameters:
+            - function: The function to run.
+            - args: The function arguments.
+        Returns:
+            The value returned by the function.
+        """
+        if self.__executor is None:
+            return function(*args)
+        return self.__executor.submit(function, *args).result()
+
+    def __pepper(self, password: str) -> str:
+        """ Appends the configured salt to a password before hashing it.
+        ---
+        Parameters:
+            - password: The password itself.
+        Returns:
+            A string with the password followed by the configured salt.
+        """
+        return password + self.get_configuration().get_password_salt()
 
-    def __calculate_password_hash(self, username: str, password: str) -> str:
-        """ Calculates the password hash of a user.
+    def __calculate_legacy_password_hash(self, username: str, password: str) -> str:
+        """ Calculates the legacy password hash of a user.
         ---
         Parameters:
             - username: The username (it is used as a suffix to the password)
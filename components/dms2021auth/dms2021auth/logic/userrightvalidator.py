@@ -1,12 +1,12 @@
 """ UserRightValidator class module.
 """
 
-from typing import Optional, List
+from typing import Optional, List, Set, Tuple
 from sqlalchemy.orm import Session  # type: ignore
 from dms2021core.data import UserRightName
 from dms2021auth.data.db import Schema
-from dms2021auth.data.db.results import UserRight, UserSession
-from dms2021auth.data.db.resultsets import UserRights, UserSessions
+from dms2021auth.data.db.resultsets import UserRights
+from dms2021auth.data.db.exc import SessionNotFoundError
 from dms2021auth.logic.exc import InsufficientRightsError
 
 
@@ -34,11 +34,7 @@ class UserRightValidator():
             True if the user has the given right; false otherwise.
         """
         session: Session = self.get_schema().new_session()
-        user_right: Optional[UserRight] = UserRights.find_right(
-            session, username, right)
-        if user_right is not None:
-            return True
-        return False
+        return UserRights.has_right(session, username, right)
 
     def enforce_rights(self, session_token: str, rights: List[UserRightName]):
         """ Raises an error if the owner of session identified by the token
@@ -48,16 +44,43 @@ class UserRightValidator():
             - session_token: The session token string.
             - rights: A list of user right names.
         Throws:
+            - SessionNotFoundError: If the session was not found or is inactive.
             - InsufficientRightsError: If the user lacks any of the rights.
         """
         session: Session = self.get_schema().new_session()
-        user_session: UserSession = UserSessions.get_active_user_session(
-            session, session_token
+        user_rights: Optional[Set[UserRightName]] = UserRights.find_session_rights(
+            session, session_token, rights
         )
+        if user_rights is None:
+            raise SessionNotFoundError()
         for right in rights:
-            if not self.has_right(user_session.username, right):
+            if right not in user_rights:
                 raise InsufficientRightsError()
 
+    def get_rights(self, username: str) -> List[UserRightName]:
+        """ Gets every right of a given user.
+        ---
+        Parameters:
+            - username: The user name string.
+        Returns:
+            A list with the names of the rights of the user.
+        """
+        session: Session = self.get_schema().new_session()
+        return UserRights.get_rights(session, username)
+
+    def check_rights(self, checks: List[Tuple[str, UserRightName]]) -> List[bool]:
+        """ Determines whether several users have several rights or not.
+        ---
+        Parameters:
+            - checks: A list of (user name, right name) tuples.
+        Returns:
+            A list with, for every check and in the same order, True if the user
+            has the right; false otherwise.
+        """
+        session: Session = self.get_schema().new_session()
+        found: Set[Tuple[str, UserRightName]] = UserRights.find_rights(session, checks)
+        return [check in found for check in checks]
+
     def get_schema(self) -> Schema:
         """ Gets the schema being used by this instance.
         ---
@@ -2,14 +2,16 @@
 """
 
 from typing import Optional
-from datetime import datetime
+from datetime import datetime, timedelta
 from sqlalchemy.orm import Session  # type: ignore
+from dms2021core.data import CapabilityToken
 from dms2021auth.data.config import AuthConfiguration
 from dms2021auth.data.db import Schema
-from dms2021auth.data.db.resultsets import UserSessions
+from dms2021auth.data.db.resultsets import UserRights, UserSessions
 from dms2021auth.data.db.results import UserSession
 from dms2021auth.logic.managerbase import ManagerBase
 from dms2021auth.logic.usermanager import UserManager
+from dms2021auth.logic.sessiontoucher import SessionToucher
 from dms2021auth.logic.exc import InvalidCredentialsError
 
 
@@ -29,10 +31,23 @@ class UserSessionManager(ManagerBase):
         """
         super().__init__(config, schema)
         self.__set_user_manager(user_manager)
+        self.__toucher: Optional[SessionToucher] = None
+
+    def set_toucher(self, toucher: Optional[SessionToucher]) -> None:
+        """ Sets the toucher the update of the reused sessions is queued to.
+        ---
+        Parameters:
+            - toucher: A running SessionToucher, or None to update every session as
+                       it is reused.
+        """
+        self.__toucher = toucher
 
     def login(self, username: str, password: str) -> str:
         """ Logs a user in. I.e., creates or reuses a session if the credentials are correct.
         ---
+        Note:
+            If a toucher is set, the update time of a reused session is only queued,
+            unless the session could expire before the toucher writes it.
         Parameters:
             - username: The user name string.
             - password: The user password string.
@@ -50,11 +65,70 @@ class UserSessionManager(ManagerBase):
         token: str
         if user_session is None:
             token = UserSessions.create(session, username).token
+        elif self.__toucher is not None and not self.__may_expire_before_touch(user_session):
+            token = user_session.token
+            now: datetime = datetime.now()
+            self.__toucher.touch(token, now)
+            UserSessions.touch_cached(session, user_session, now)
         else:
             user_session.touch(session, datetime.now())
             token = user_session.token
         return token
 
+    def __may_expire_before_touch(self, user_session: UserSession) -> bool:
+        """ Checks whether a session could expire before a queued touch of it is written.
+
+        Until then the database keeps the previous update time, so the session
+        would be considered expired (and could even be deleted) in the meantime.
+        ---
+        Parameters:
+            - user_session: The UserSession to check.
+        Returns:
+            True if the session expires within two touch intervals.
+        """
+        ttl: float = self.get_configuration().get_session_ttl()
+        if ttl <= 0:
+            return False
+        margin: float = 2 * self.get_configuration().get_session_touch_interval()
+        return user_session.updated < datetime.now() - timedelta(seconds=ttl - margin)
+
+    def create_capability_token(self, username: str) -> Optional[str]:
+        """ Issues a signed token carrying the current rights of a user.
+
+        Services sharing the signing key can check the rights in the token
+        instead of asking this service.
+        ---
+        Parameters:
+            - username: The user name string.
+        Returns:
+            The token string, or None if no signing key is configured.
+        """
+        key: Optional[str] = self.get_configuration().get_capability_token_key()
+        if key is None:
+            return None
+        session: Session = self.get_schema().new_session()
+        rights = [right.name for right in UserRights.get_rights(session, username)]
+        return CapabilityToken.issue(
+            key, username, rights, self.get_configuration().get_capability_token_ttl()
+        )
+
+    def refresh_capability_token(self, session_token: str) -> Optional[str]:
+        """ Issues a new capability token for the owner of an active session.
+        ---
+        Parameters:
+            - session_token: The token of the user session.
+        Returns:
+            The token string, or None if no signing key is configured.
+        Throws:
+            - SessionNotFound: When the provided session was not found, is inactive or
+                               has expired.
+        """
+        session: Session = self.get_schema().new_session()
+        user_session: UserSession = UserSessions.get_active_user_session(
+            session, session_token
+        )
+        return self.create_capability_token(user_session.username)
+
     def logout(self, session_token: str):
         """ Logs a user out. I.e., deactivates the given session.
         ---
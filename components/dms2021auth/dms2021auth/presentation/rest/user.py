@@ -1,6 +1,7 @@
 """ User class module.
 """
 
+import json
 from dms2021core.data.rest import RestResponse
 from dms2021auth.logic import UserManager, UserRightValidator
 from dms2021auth.data.db.exc import UserExistsError
@@ -76,3 +77,32 @@ class User():
         except UserExistsError:
             return RestResponse(code=409, mime_type='text/plain')
         return RestResponse(mime_type='text/plain')
+
+    def create_many(self, content: str, ndjson: bool, token: str) -> RestResponse:
+        """ Creates several users and grants them their rights in a single transaction.
+        ---
+        Parameters:
+            - content: The list of users, in YAML or NDJSON format.
+            - ndjson: Whether the list is in NDJSON format or in YAML format.
+            - token: The session token string.
+        Returns:
+            A RestResponse object holding the result of every user.
+        """
+        try:
+            rows = self.get_user_manager().parse_user_list(content, ndjson)
+            results = self.get_user_manager().create_users(
+                rows, token, self.get_user_right_validator()
+            )
+        except ValueError:
+            return RestResponse(code=400, mime_type='text/plain')
+        except InsufficientRightsError:
+            return RestResponse(code=401, mime_type='text/plain')
+        except UserExistsError:
+            return RestResponse(code=409, mime_type='text/plain')
+        json_content = {
+            'results': results,
+            'created': sum(1 for result in results if result['status'] == 'created'),
+            'conflicts': sum(1 for result in results if result['status'] == 'conflict'),
+            'invalid': sum(1 for result in results if result['status'] == 'invalid')
+        }
+        return RestResponse(json.dumps(json_content), mime_type='application/json')
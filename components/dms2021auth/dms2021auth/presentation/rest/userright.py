@@ -1,6 +1,8 @@
 """ UserRight class module.
 """
 
+import json
+from typing import List, Optional, Tuple
 from dms2021core.data import UserRightName
 from dms2021core.data.rest import RestResponse
 from dms2021auth.data.db.exc import UserNotFoundError, SessionNotFoundError
@@ -127,3 +129,41 @@ class UserRight():
             return RestResponse(code=404, mime_type='text/plain')
         except UserNotFoundError:
             return RestResponse(code=404, mime_type='text/plain')
+
+    def get_rights(self, username: str) -> RestResponse:
+        """ Gets every right of a user.
+        ---
+        Parameters:
+            - username: The name of the user.
+        Returns:
+            A RestResponse object with the request response.
+        """
+        rights: List[UserRightName] = self.get_user_right_validator().get_rights(username)
+        return RestResponse(json.dumps([right.name for right in rights]),
+                            mime_type='application/json')
+
+    def check_rights(self, checks_json: str) -> RestResponse:
+        """ Gets whether several users have several rights or not.
+        ---
+        Parameters:
+            - checks_json: A JSON list of objects with a `username` and a `right`.
+        Returns:
+            A RestResponse object with the request response.
+        """
+        try:
+            checks: list = json.loads(checks_json)
+            if not isinstance(checks, list):
+                raise ValueError()
+            pairs: List[Tuple[str, Optional[UserRightName]]] = [
+                (str(check['username']), UserRightName.__members__.get(str(check['right'])))
+                for check in checks
+            ]
+        except (ValueError, TypeError, KeyError):
+            return RestResponse(code=400, mime_type='text/plain')
+        known: List[Tuple[str, UserRightName]] = [
+            (username, right) for username, right in pairs if right is not None
+        ]
+        granted = iter(self.get_user_right_validator().check_rights(known))
+        results: List[bool] = [next(granted) if right is not None else False
+                               for _, right in pairs]
+        return RestResponse(json.dumps(results), mime_type='application/json')
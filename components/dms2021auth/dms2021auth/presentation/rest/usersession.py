@@ -50,11 +50,33 @@ class UserSession():
             res_content = {
                 'session_id': session_id
             }
+            capability_token = self.get_user_session_manager().create_capability_token(username)
+            if capability_token is not None:
+                res_content['capability_token'] = capability_token
             res_content_json = json.dumps(res_content, separators=(',', ':'))
             return RestResponse(res_content_json, mime_type='application/json')
         except InvalidCredentialsError:
             return RestResponse(code=401, mime_type='text/plain')
 
+    def refresh_capability_token(self, token: str) -> RestResponse:
+        """ Issues a new capability token for the owner of a session.
+        ---
+        Parameters:
+            - token: The session token string.
+        Returns:
+            A RestResponse object with the request response.
+        """
+        try:
+            capability_token = self.get_user_session_manager().refresh_capability_token(token)
+        except SessionNotFoundError:
+            return RestResponse(code=401, mime_type='text/plain')
+        if capability_token is None:
+            return RestResponse(code=404, mime_type='text/plain')
+        res_content_json = json.dumps(
+            {'capability_token': capability_token}, separators=(',', ':')
+        )
+        return RestResponse(res_content_json, mime_type='application/json')
+
     def logout(self, token: str) -> RestResponse:
         """ Logs out a user/session.
         ---
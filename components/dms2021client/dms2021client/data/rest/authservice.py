@@ -2,8 +2,12 @@
 """
 
 import json
-from urllib.parse import urlencode
-from http.client import HTTPConnection, HTTPResponse, HTTPException
+import time
+from typing import List, Optional
+from urllib.parse import urlencode, quote
+from http.client import HTTPException
+from dms2021core.data import CapabilityToken
+from dms2021core.data.rest import HTTPConnectionPool, PooledResponse
 from dms2021client.data.rest.exc import BadRequestError, ConflictError, InvalidCredentialsError
 from dms2021client.data.rest.exc import NotFoundError, UnauthorizedError
 
@@ -12,7 +16,10 @@ class AuthService():
     """ REST client to connect to the authentication service.
     """
 
-    def __init__(self, host: str, port: int):
+    # Seconds before it expires that a capability token is replaced
+    CAPABILITY_TOKEN_REFRESH_MARGIN: float = 30.0
+
+    def __init__(self, host: str, port: int, pool: Optional[HTTPConnectionPool] = None):
         """ Constructor method.
 
         Initializes the client.
@@ -20,17 +27,28 @@ class AuthService():
         Parameters:
             - host: The authentication service host string.
             - port: The authentication service port number.
+            - pool: The connection pool to use, or None to use a pool of its own.
         """
         self.__host: str = host
         self.__port: int = port
+        self.__pool: HTTPConnectionPool = pool or HTTPConnectionPool()
+        self.__session_id: Optional[str] = None
+        self.__capability_token: Optional[str] = None
+        self.__capability_token_expiry: float = 0.0
 
-    def __get_connection(self) -> HTTPConnection:
-        """ Creates a new connection to the authentication server.
+    def __request(self, method: str, url: str, body: Optional[str] = None,
+                  headers: Optional[dict] = None) -> PooledResponse:
+        """ Sends a request to the authentication server through the connection pool.
         ---
+        Parameters:
+            - method: The HTTP method.
+            - url: The request path.
+            - body: The request body, if any.
+            - headers: A dictionary with the request headers, if any.
         Returns:
-            The connection object.
+            The fully read response.
         """
-        return HTTPConnection(self.__host, self.__port)
+        return self.__pool.request(self.__host, self.__port, method, url, body, headers)
 
     def is_running(self) -> bool:
         """ Tests whether the authentication service is running or not.
@@ -39,9 +57,7 @@ class AuthService():
             True if the authentication service could be contacted successfully; false otherwise.
         """
         try:
-            connection: HTTPConnection = self.__get_connection()
-            connection.request('GET', '/')
-            response: HTTPResponse = connection.getresponse()
+            response: PooledResponse = self.__request('GET', '/')
             if response.status == 200:
                 return True
             return False
@@ -66,12 +82,12 @@ class AuthService():
         headers: dict = {
             'Content-type': 'application/x-www-form-urlencoded'
         }
-        connection: HTTPConnection = self.__get_connection()
-        connection.request('POST', '/sessions', form, headers)
-        response: HTTPResponse = connection.getresponse()
+        response: PooledResponse = self.__request('POST', '/sessions', form, headers)
         if response.status == 200:
             response_data_json = response.read()
             response_data = json.loads(response_data_json)
+            self.__session_id = response_data['session_id']
+            self.__set_capability_token(response_data.get('capability_token'))
             return response_data['session_id']
         if response.status == 401:
             raise InvalidCredentialsError()
@@ -79,6 +95,70 @@ class AuthService():
             raise HTTPException('Server error')
         return ''
 
+    def get_capability_token(self) -> Optional[str]:
+        """ Gets the capability token of the logged in user.
+
+        A token about to expire is replaced by a new one first.
+        ---
+        Returns:
+            The token string, or None if the server did not issue one or it has
+            expired and could not be refreshed.
+        """
+        if self.__capability_token is None or self.__session_id is None:
+            return None
+        if time.time() >= self.__capability_token_expiry - self.CAPABILITY_TOKEN_REFRESH_MARGIN:
+            try:
+                self.refresh_capability_token(self.__session_id)
+            except (HTTPException, OSError, UnauthorizedError):
+                pass
+        if self.__capability_token is None or time.time() >= self.__capability_token_expiry:
+            return None
+        return self.__capability_token
+
+    def refresh_capability_token(self, session_id: str) -> Optional[str]:
+        """ Asks the authentication server for a new capability token.
+        ---
+        Parameters:
+            - session_id: The session id string.
+        Returns:
+            The token string, or None if the server does not issue them.
+        Throws:
+            - UnauthorizedError: If the provided session is incorrect or closed.
+            - HTTPException: On an unhandled 500 error.
+        """
+        form: str = urlencode({'session_id': session_id})
+        headers: dict = {
+            'Content-type': 'application/x-www-form-urlencoded'
+        }
+        response: PooledResponse = self.__request(
+            'POST', '/sessions/capability_token', form, headers
+        )
+        if response.status == 200:
+            self.__set_capability_token(json.loads(response.read()).get('capability_token'))
+            return self.__capability_token
+        if response.status == 401:
+            raise UnauthorizedError()
+        if response.status == 404:
+            self.__set_capability_token(None)
+            return None
+        raise HTTPException('Server error')
+
+    def __set_capability_token(self, token: Optional[str]):
+        """ Stores a capability token along with its expiry time.
+        ---
+        Parameters:
+            - token: The token string, or None.
+        """
+        self.__capability_token = None
+        self.__capability_token_expiry = 0.0
+        if token is None:
+            return
+        try:
+            self.__capability_token_expiry = CapabilityToken.get_expiry(token)
+            self.__capability_token = token
+        except ValueError:
+            pass
+
     def logout(self, session_id: str):
         """ Logs out a user from the authentication server.
         ---
@@ -92,10 +172,11 @@ class AuthService():
         headers: dict = {
             'Content-type': 'application/x-www-form-urlencoded'
         }
-        connection: HTTPConnection = self.__get_connection()
-        connection.request('DELETE', '/sessions', form, headers)
-        response: HTTPResponse = connection.getresponse()
+        response: PooledResponse = self.__request('DELETE', '/sessions', form, headers)
         if response.status == 200:
+            if session_id == self.__session_id:
+                self.__session_id = None
+                self.__set_capability_token(None)
             return
 
         if response.status == 401:
@@ -121,9 +202,7 @@ class AuthService():
         headers: dict = {
             'Content-type': 'application/x-www-form-urlencoded'
         }
-        connection: HTTPConnection = self.__get_connection()
-        connection.request('POST', '/users', form, headers)
-        response: HTTPResponse = connection.getresponse()
+        response: PooledResponse = self.__request('POST', '/users', form, headers)
         if response.status == 200:
             return
         if response.status == 400:
@@ -152,9 +231,9 @@ class AuthService():
         headers: dict = {
             'Content-type': 'application/x-www-form-urlencoded'
         }
-        connection: HTTPConnection = self.__get_connection()
-        connection.request('POST', '/users/'+str(username)+'/rights/'+str(right), form, headers)
-        response: HTTPResponse = connection.getresponse()
+        response: PooledResponse = self.__request(
+            'POST', '/users/'+str(username)+'/rights/'+str(right), form, headers
+        )
         if response.status == 200:
             return
         if response.status == 401:
@@ -181,9 +260,9 @@ class AuthService():
         headers: dict = {
             'Content-type': 'application/x-www-form-urlencoded'
         }
-        connection: HTTPConnection = self.__get_connection()
-        connection.request('DELETE', '/users/'+str(username)+'/rights/'+str(right), form, headers)
-        response: HTTPResponse = connection.getresponse()
+        response: PooledResponse = self.__request(
+            'DELETE', '/users/'+str(username)+'/rights/'+str(right), form, headers
+        )
         if response.status == 200:
             return
         if response.status == 401:
@@ -209,9 +288,9 @@ class AuthService():
         headers: dict = {
             'Content-type': 'application/x-www-form-urlencoded'
         }
-        connection: HTTPConnection = self.__get_connection()
-        connection.request('GET', '/users/'+str(username)+'/rights/'+str(right), form, headers)
-        response: HTTPResponse = connection.getresponse()
+        response: PooledResponse = self.__request(
+            'GET', '/users/'+str(username)+'/rights/'+str(right), form, headers
+        )
         if response.status == 200:
             return True
         if response.status == 404:
@@ -219,3 +298,23 @@ class AuthService():
         if response.status == 500:
             raise HTTPException('Server error')
         return False
+
+    def get_rights(self, username: str) -> List[str]:
+        """ Gets every right of a given user from the authentication server.
+        ---
+        Parameters:
+            - username: The user name string.
+        Returns:
+            A list with the names of the rights of the user. Empty if the user
+            does not exist.
+        Throws:
+            - HTTPException: On an unhandled 500 error.
+        """
+        response: PooledResponse = self.__request(
+            'GET', '/users/' + quote(str(username)) + '/rights'
+        )
+        if response.status == 200:
+            return json.loads(response.read())
+        if response.status == 500:
+            raise HTTPException('Server error')
+        return []
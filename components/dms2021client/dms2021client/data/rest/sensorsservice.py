@@ -2,9 +2,11 @@
 """
 
 import json
-from typing import List
+import time
+from typing import Callable, Iterable, Iterator, List, Optional
 from urllib.parse import urlencode, quote
-from http.client import HTTPConnection, HTTPResponse, HTTPException
+from http.client import HTTPException
+from dms2021core.data.rest import HTTPConnectionPool, PooledResponse
 from dms2021client.data.rest.exc import BadRequestError, ConflictError, NotFoundError
 from dms2021client.data.rest.exc import UnauthorizedError
 
@@ -13,7 +15,10 @@ class SensorsService():
     """ REST client to connect to the sensor service.
     """
 
-    def __init__(self, host: str, port: int):
+    # Longest wait asked for in a single request, so the job is polled again now and then
+    LONG_POLL_SECONDS: float = 20.0
+
+    def __init__(self, host: str, port: int, pool: Optional[HTTPConnectionPool] = None):
         """ Constructor method.
 
         Initializes the client.
@@ -21,17 +26,53 @@ class SensorsService():
         Parameters:
             - host: The sensor service host string.
             - port: The sensor service port number.
+            - pool: The connection pool to use, or None to use a pool of its own.
         """
         self.__host: str = host
         self.__port: int = port
+        self.__pool: HTTPConnectionPool = pool or HTTPConnectionPool()
+        self.__capability_token_source: Optional[Callable[[], Optional[str]]] = None
+
+    def set_capability_token_source(self, source: Optional[Callable[[], Optional[str]]]):
+        """ Sets where the capability token sent along with every request is read from.
+        ---
+        Parameters:
+            - source: A callable returning a current token issued by the authentication
+                      service, or None if there is none; or None to send no token.
+        """
+        self.__capability_token_source = source
 
-    def __get_connection(self) -> HTTPConnection:
-        """ Creates a new connection to the sensor server.
+    def __request(self, method: str, url: str, body: Optional[str] = None,
+                  headers: Optional[dict] = None) -> PooledResponse:
+        """ Sends a request to the sensor server through the connection pool.
         ---
+        Parameters:
+            - method: The HTTP method.
+            - url: The request path.
+            - body: The request body, if any.
+            - headers: A dictionary with the request headers, if any.
         Returns:
-            The connection object.
+            The fully read response.
         """
-        return HTTPConnection(self.__host, self.__port)
+        return self.__pool.request(
+            self.__host, self.__port, method, url, body, self.__add_token(headers)
+        )
+
+    def __add_token(self, headers: Optional[dict]) -> Optional[dict]:
+        """ Adds the current capability token, if any, to the headers of a request.
+        ---
+        Parameters:
+            - headers: A dictionary with the request headers, if any.
+        Returns:
+            The headers to send.
+        """
+        token: Optional[str] = None
+        if self.__capability_token_source is not None:
+            token = self.__capability_token_source()
+        if token is not None:
+            headers = dict(headers or {})
+            headers['Authorization'] = 'Bearer ' + token
+        return headers
 
     def is_running(self) -> bool:
         """ Tests whether the sensor service is running or not.
@@ -40,9 +81,7 @@ class SensorsService():
             True if the sensor service could be contacted successfully; false otherwise.
         """
         try:
-            connection: HTTPConnection = self.__get_connection()
-            connection.request('GET', '/')
-            response: HTTPResponse = connection.getresponse()
+            response: PooledResponse = self.__request('GET', '/')
             if response.status == 200:
                 return True
             return False
@@ -66,16 +105,9 @@ class SensorsService():
         headers: dict = {
             'Content-type': 'application/x-www-form-urlencoded'
         }
-        connection: HTTPConnection = self.__get_connection()
-        connection.request('GET', '/rules/', form, headers)
-        response: HTTPResponse = connection.getresponse()
+        response: PooledResponse = self.__request('GET', '/v2/rules/', form, headers)
         if response.status == 200:
-            response_data_json = response.read()
-            lista = json.loads(response_data_json)
-            retorno: List[dict] = []
-            for rule in lista:
-                retorno.append(json.loads(rule))
-            return retorno
+            return list(self.__read_ndjson(response))
         if response.status == 401:
             raise UnauthorizedError()
         if response.status == 500:
@@ -100,9 +132,9 @@ class SensorsService():
         headers: dict = {
             'Content-type': 'application/x-www-form-urlencoded'
         }
-        connection: HTTPConnection = self.__get_connection()
-        connection.request('GET', '/rule/'+quote(str(rulename)), form, headers)
-        response: HTTPResponse = connection.getresponse()
+        response: PooledResponse = self.__request(
+            'GET', '/rule/'+quote(str(rulename)), form, headers
+        )
         if response.status == 200:
             response_data_json = response.read()
             return json.loads(response_data_json)
@@ -136,9 +168,7 @@ class SensorsService():
         headers: dict = {
             'Content-type': 'application/x-www-form-urlencoded'
         }
-        connection: HTTPConnection = self.__get_connection()
-        connection.request('POST', '/rule/', form, headers)
-        response: HTTPResponse = connection.getresponse()
+        response: PooledResponse = self.__request('POST', '/rule/', form, headers)
         if response.status == 200:
             return
         if response.status == 400:
@@ -165,9 +195,9 @@ class SensorsService():
         headers: dict = {
             'Content-type': 'application/x-www-form-urlencoded'
         }
-        connection: HTTPConnection = self.__get_connection()
-        connection.request('DELETE', '/rule/'+quote(str(rulename)), form, headers)
-        response: HTTPResponse = connection.getresponse()
+        response: PooledResponse = self.__request(
+            'DELETE', '/rule/'+quote(str(rulename)), form, headers
+        )
         if response.status == 200:
             return
         if response.status == 400:
@@ -179,66 +209,183 @@ class SensorsService():
         if response.status == 500:
             raise HTTPException('Server error')
 
-    def run_rule(self, rulename: str, user: str) -> dict:
+    def run_rule(self, rulename: str, user: str, timeout: float = 60.0) -> dict:
         """ Runs a specified rule.
+
+        The rule is run in the background by the service, while this client
+        waits for its result.
         ---
         Parameters:
             - rulename: The rule name string.
             - user: The username string.
+            - timeout: Maximum number of seconds to wait for the rule to finish.
         Returns:
             A dictionary with the output (str).
         Throws:
             - BadRequestError: If the request is malformed.
             - NotFoundError: If the rule does not exist.
-            - HTTPException: On an unhandled 500 error or if the rule failed.
+            - HTTPException: On an unhandled 500 error, if the rule failed or if it
+              did not finish in time.
+        """
+        deadline: float = time.monotonic() + timeout
+        job: dict = self.start_rule_run(rulename, user)
+        while job.get('status') not in ('succeeded', 'failed'):
+            remaining: float = deadline - time.monotonic()
+            if remaining <= 0:
+                raise HTTPException('The rule did not finish in time')
+            job = self.get_job(job['job_id'], user, min(remaining, self.LONG_POLL_SECONDS))
+        if job['status'] == 'failed':
+            raise HTTPException('Server error')
+        return {'result': job['result']}
+
+    def start_rule_run(self, rulename: str, user: str) -> dict:
+        """ Requests a run of a rule in the background.
+        ---
+        Parameters:
+            - rulename: The rule name string.
+            - user: The username string.
+        Returns:
+            A dictionary with the queued job (job_id, rule_name, status, result,
+            created and finished).
+        Throws:
+            - BadRequestError: If the request is malformed.
+            - NotFoundError: If the rule does not exist.
+            - HTTPException: On an unhandled 500 error or if the user has too many
+              unfinished runs.
         """
         form: str = urlencode({'username': user})
         headers: dict = {
             'Content-type': 'application/x-www-form-urlencoded'
         }
-        connection: HTTPConnection = self.__get_connection()
-        connection.request('GET', '/rule/' + quote(str(rulename)) + '/run/', form, headers)
-        response: HTTPResponse = connection.getresponse()
+        response: PooledResponse = self.__request(
+            'POST', '/rule/' + quote(str(rulename)) + '/run/', form, headers
+        )
+        if response.status == 202:
+            return json.loads(response.read())
+        if response.status == 400:
+            raise BadRequestError()
+        if response.status == 401:
+            raise UnauthorizedError()
+        if response.status == 404:
+            raise NotFoundError()
+        if response.status == 429:
+            raise HTTPException('Too many unfinished runs')
+        raise HTTPException('Server error')
+
+    def get_job(self, job_id: str, user: str, wait: float = 0.0) -> dict:
+        """ Gets a rule run requested in the background.
+        ---
+        Parameters:
+            - job_id: The job identifier string.
+            - user: The username string.
+            - wait: Maximum number of seconds the service waits for the run to finish
+                    before answering.
+        Returns:
+            A dictionary with the job (job_id, rule_name, status, result, created and
+            finished).
+        Throws:
+            - BadRequestError: If the request is malformed.
+            - NotFoundError: If the job does not exist.
+            - HTTPException: On an unhandled 500 error.
+        """
+        form: str = urlencode({'username': user})
+        headers: dict = {
+            'Content-type': 'application/x-www-form-urlencoded'
+        }
+        url: str = '/jobs/' + quote(str(job_id)) + '?' + urlencode({'wait': wait})
+        response: PooledResponse = self.__request('GET', url, form, headers)
         if response.status == 200:
-            response_data_json = response.read()
-            return json.loads(response_data_json)
+            return json.loads(response.read())
         if response.status == 400:
             raise BadRequestError()
         if response.status == 401:
             raise UnauthorizedError()
         if response.status == 404:
             raise NotFoundError()
+        raise HTTPException('Server error')
+
+    def get_log(self, user: str) -> Iterator[dict]:
+        """ Gets the log.
+
+        The logs are decoded as they arrive, so the whole log is never held in
+        memory. The request is sent when the iteration starts.
+        ---
+        Parameters:
+            - user: The username string.
+        Returns:
+            An iterator over the results, where each has rule_name, time and result.
+        Throws:
+            - UnauthorizedError: If the user lacks the required permission.
+            - HTTPException: On an unhandled 500 error.
+        """
+        form: str = urlencode({'username': user})
+        headers: dict = {
+            'Content-type': 'application/x-www-form-urlencoded'
+        }
+        with self.__pool.stream(self.__host, self.__port, 'GET', '/v2/log/', form,
+                                self.__add_token(headers)) as response:
+            if response.status == 200:
+                yield from self.__read_ndjson(response)
+                return
+            # Read to the end, so the connection can be reused
+            response.read()
+        if response.status == 401:
+            raise UnauthorizedError()
         if response.status == 500:
             raise HTTPException('Server error')
-        return {}
 
-    def get_log(self, user: str) -> List[dict]:
-        """ Gets the log.
+    @staticmethod
+    def __read_ndjson(response: Iterable[bytes]) -> Iterator[dict]:
+        """ Decodes a newline-delimited JSON response, one line at a time.
+        ---
+        Parameters:
+            - response: The response to read.
+        Returns:
+            An iterator over the object of each line.
+        """
+        for line in response:
+            if line.strip():
+                yield json.loads(line)
+
+    def get_log_page(self, user: str, cursor: Optional[str] = None, rule_name: Optional[str] = None,
+                     limit: Optional[int] = None) -> dict:
+        """ Gets a page of the log.
         ---
         Parameters:
             - user: The username string.
+            - cursor: The cursor returned with the previous page, or None for the first one.
+            - rule_name: Only get the logs of this rule.
+            - limit: The maximum number of logs in the page.
         Returns:
-            A dictionary with the list of results, where it has rule_name, time and
-            result.
+            A dictionary with the `logs` of the page and the `next_cursor` (None
+            on the last page).
         Throws:
+            - BadRequestError: If a parameter is not valid.
+            - UnauthorizedError: If the user lacks the required permission.
             - HTTPException: On an unhandled 500 error.
         """
         form: str = urlencode({'username': user})
         headers: dict = {
             'Content-type': 'application/x-www-form-urlencoded'
         }
-        connection: HTTPConnection = self.__get_connection()
-        connection.request('GET', '/log/', form, headers)
-        response: HTTPResponse = connection.getresponse()
+        query: dict = {}
+        if cursor is not None:
+            query['cursor'] = cursor
+        if rule_name is not None:
+            query['rule'] = rule_name
+        if limit is not None:
+            query['limit'] = limit
+        url: str = '/log/'
+        if query:
+            url += '?' + urlencode(query)
+        response: PooledResponse = self.__request('GET', url, form, headers)
         if response.status == 200:
             response_data_json = response.read()
-            lista = json.loads(response_data_json)
-            retorno: List[dict] = []
-            for rule in lista:
-                retorno.append(json.loads(rule))
-            return retorno
+            return json.loads(response_data_json)
+        if response.status == 400:
+            raise BadRequestError()
         if response.status == 401:
             raise UnauthorizedError()
         if response.status == 500:
             raise HTTPException('Server error')
-        return []
+        return {'logs': [], 'next_cursor': None}
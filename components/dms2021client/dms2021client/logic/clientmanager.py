@@ -4,6 +4,7 @@ import time
 from typing import Tuple
 from getpass import getpass
 from http.client import HTTPException
+from dms2021core.data.rest import HTTPConnectionPool
 from dms2021client.data.config import ClientConfiguration
 from dms2021client.data.rest import AuthService, SensorsService
 from dms2021client.data.rest.exc import InvalidCredentialsError, UnauthorizedError
@@ -21,19 +22,24 @@ class ClientManager():
         """
         self.__cfg: ClientConfiguration = ClientConfiguration()
         self.__cfg.load_from_file(self.__cfg.default_config_file())
+        self.__http_pool: HTTPConnectionPool = HTTPConnectionPool()
         self.__authservice: AuthService = AuthService(self.__cfg.get_auth_service_host(),
-            self.__cfg.get_auth_service_port())
+            self.__cfg.get_auth_service_port(), self.__http_pool)
         self.__sensor1_svc: SensorsService = SensorsService(
             self.__cfg.get_sensor1_service_host(),
-            self.__cfg.get_sensor1_service_port()
+            self.__cfg.get_sensor1_service_port(),
+            self.__http_pool
         )
         self.__sensor2_svc: SensorsService = SensorsService(
             self.__cfg.get_sensor2_service_host(),
-            self.__cfg.get_sensor2_service_port()
+            self.__cfg.get_sensor2_service_port(),
+            self.__http_pool
         )
 
         while True:
             self.__username, self.__session_id = self.login()
+            for sensor_svc in [self.__sensor1_svc, self.__sensor2_svc]:
+                sensor_svc.set_capability_token_source(self.__authservice.get_capability_token)
 
             self.__page: OrderedMenu = MainMenu(self.__session_id,
                 self.__username, self.__authservice, [self.__sensor1_svc, self.__sensor2_svc])
@@ -1,7 +1,7 @@
 """ RulesMenu class module.
 """
 
-from typing import List, Callable
+from typing import Callable, Iterator, List
 from http.client import HTTPException
 from dms2021client.data.rest.exc import BadRequestError, NotFoundError
 from dms2021client.data.rest.exc import UnauthorizedError
@@ -46,11 +46,12 @@ class RulesMenu(OrderedMenu):
             - items: A list with the strings that will display the menu options.
         """
         items: List[str] = []
-        if self.__authservice.has_right(self.__username, "AdminRules"):
+        rights: List[str] = self.__authservice.get_rights(self.__username)
+        if "AdminRules" in rights:
             items += ["Ver reglas", "Añadir regla", "Eliminar regla"]
-            if self.__authservice.has_right(self.__username, "ViewReports"):
+            if "ViewReports" in rights:
                 items.append("Ejecutar regla")
-        if self.__authservice.has_right(self.__username, "ViewReports"):
+        if "ViewReports" in rights:
             items.append("Ver historial de ejecución")
         self._ordered_items = items
 
@@ -61,14 +62,15 @@ class RulesMenu(OrderedMenu):
             a menu option is selected.
         """
         functions: List[Callable] = []
-        if self.__authservice.has_right(self.__username, "AdminRules"):
+        rights: List[str] = self.__authservice.get_rights(self.__username)
+        if "AdminRules" in rights:
             functions += [self.get_rules,
                 AddRulesMenu(self.__session_token, self.__username,
                 self.__authservice, self.__sensorservice).show_options,
                 self.remove_rules]
-            if self.__authservice.has_right(self.__username, "ViewReports"):
+            if "ViewReports" in rights:
                 functions.append(self.run_rule)
-        if self.__authservice.has_right(self.__username, "ViewReports"):
+        if "ViewReports" in rights:
             functions.append(self.get_log)
         self._ordered_opt_functions = functions
 
@@ -128,7 +130,7 @@ class RulesMenu(OrderedMenu):
         """
         try:
             print("-"*20 + "VER HISTORIAL DE EJECUCIÓN" + "-"*20 + "\n")
-            result: List[dict] = self.__sensorservice.get_log(self.__username)
+            result: Iterator[dict] = self.__sensorservice.get_log(self.__username)
             for rule in result:
                 for k in rule:
                     print("[" + k.upper() + "] -> " + str(rule[k]))
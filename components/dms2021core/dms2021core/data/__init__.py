@@ -2,3 +2,4 @@
 """
 
 from .userrightname import UserRightName
+from .capabilitytoken import CapabilityToken
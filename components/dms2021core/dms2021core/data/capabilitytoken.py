@@ -0,0 +1,129 @@
+""" CapabilityToken class module.
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import time
+from typing import List, Tuple
+
+
+class CapabilityToken():
+    """ Toolkit class to issue and verify HMAC-signed capability tokens.
+
+    A token carries a user name, the rights of the user and an expiry time, so
+    any service sharing the signing key can authorise that user without asking
+    the authentication service.
+    """
+
+    @staticmethod
+    def issue(key: str, username: str, rights: List[str], ttl: float) -> str:
+        """ Issues a new signed token.
+        ---
+        Parameters:
+            - key: The shared signing key.
+            - username: The user name string.
+            - rights: A list with the names of the rights of the user.
+            - ttl: Seconds the token is valid for.
+        Returns:
+            The token string.
+        Throws:
+            - ValueError: If the key is empty.
+        """
+        if not key:
+            raise ValueError('A signing key is required.')
+        payload: bytes = json.dumps(
+            {'u': username, 'r': rights, 'exp': int(time.time() + ttl)},
+            separators=(',', ':')
+        ).encode('utf-8')
+        return CapabilityToken.__encode(payload) + '.' \
+            + CapabilityToken.__encode(CapabilityToken.__sign(key, payload))
+
+    @staticmethod
+    def verify(key: str, token: str) -> Tuple[str, List[str]]:
+        """ Verifies a token.
+        ---
+        Parameters:
+            - key: The shared signing key.
+            - token: The token string.
+        Returns:
+            A tuple with the user name and the list of rights carried by the token.
+        Throws:
+            - ValueError: If the key is empty, or the token is malformed, was not
+              signed with the key or has expired.
+        """
+        if not key:
+            raise ValueError('A signing key is required.')
+        try:
+            encoded_payload, encoded_signature = token.split('.')
+            payload: bytes = CapabilityToken.__decode(encoded_payload)
+            signature: bytes = CapabilityToken.__decode(encoded_signature)
+        except (ValueError, UnicodeError) as ex:
+            raise ValueError('Malformed token.') from ex
+        if not hmac.compare_digest(signature, CapabilityToken.__sign(key, payload)):
+            raise ValueError('Invalid token signature.')
+        try:
+            claims: dict = json.loads(payload)
+            username: str = str(claims['u'])
+            rights: List[str] = [str(right) for right in claims['r']]
+            expiry: float = float(claims['exp'])
+        except (ValueError, TypeError, KeyError) as ex:
+            raise ValueError('Malformed token.') from ex
+        if expiry <= time.time():
+            raise ValueError('Expired token.')
+        return (username, rights)
+
+    @staticmethod
+    def get_expiry(token: str) -> float:
+        """ Reads the expiry time of a token, without verifying it.
+
+        Meant for the holders of a token, which do not have the key, to know
+        when to ask for a new one.
+        ---
+        Parameters:
+            - token: The token string.
+        Returns:
+            The expiry time, in seconds since the epoch.
+        Throws:
+            - ValueError: If the token is malformed.
+        """
+        try:
+            claims: dict = json.loads(CapabilityToken.__decode(token.split('.')[0]))
+            return float(claims['exp'])
+        except (ValueError, TypeError, KeyError, UnicodeError) as ex:
+            raise ValueError('Malformed token.') from ex
+
+    @staticmethod
+    def __sign(key: str, payload: bytes) -> bytes:
+        """ Computes the signature of a payload.
+        ---
+        Parameters:
+            - key: The signing key.
+            - payload: The payload bytes.
+        Returns:
+            The HMAC-SHA256 digest.
+        """
+        return hmac.new(key.encode('utf-8'), payload, hashlib.sha256).digest()
+
+    @staticmethod
+    def __encode(data: bytes) -> str:
+        """ Encodes bytes as unpadded URL-safe base64.
+        ---
+        Parameters:
+            - data: The bytes to encode.
+        Returns:
+            The encoded string.
+        """
+        return base64.urlsafe_b64encode(data).decode('ascii').rstrip('=')
+
+    @staticmethod
+    def __decode(data: str) -> bytes:
+        """ Decodes unpadded URL-safe base64.
+        ---
+        Parameters:
+            - data: The string to decode.
+        Returns:
+            The decoded bytes.
+        """
+        return base64.urlsafe_b64decode(data + '=' * (-len(data) % 4))
@@ -102,3 +102,136 @@ class Configuration(ABC):
             return self.__values[key]
         except KeyError:
             return None
+
+    def _get_optional_dict_value(self, key: str) -> dict:
+        """ Gets the value of an optional configuration dictionary.
+        ---
+        Parameters:
+            - key: The name of the configuration dictionary.
+        Returns:
+            A dictionary with the configured parameters, or an empty dictionary if
+            the parameter was not set.
+        Throws:
+            - TypeError: if the parameter is set but it is not a dictionary.
+        """
+        value: ConfigurationValueType = self.get_value(key)
+        if value is None:
+            return {}
+        if not isinstance(value, dict):
+            raise TypeError(
+                'Configuration parameter ' + key + ' is expected to be a dictionary. Received: '
+                + str(type(value))
+            )
+        return value
+
+    def get_db_pool_options(self) -> dict:
+        """ Gets the options of the database connection pool.
+        ---
+        Returns:
+            A dictionary with the configured `pool_size`, `max_overflow`,
+            `pool_timeout` and `pool_recycle` engine arguments. Options that are
+            not configured are left out so the engine defaults are kept.
+        Throws:
+            - TypeError: if the db_pool parameter is not a dictionary.
+        """
+
+        db_pool_value: dict = self._get_optional_dict_value('db_pool')
+        options: dict = {}
+        if 'size' in db_pool_value:
+            options['pool_size'] = int(str(db_pool_value['size']))
+        if 'max_overflow' in db_pool_value:
+            options['max_overflow'] = int(str(db_pool_value['max_overflow']))
+        if 'timeout' in db_pool_value:
+            options['pool_timeout'] = float(str(db_pool_value['timeout']))
+        if 'recycle' in db_pool_value:
+            options['pool_recycle'] = int(str(db_pool_value['recycle']))
+        return options
+
+    def get_sqlite_pragmas(self) -> Dict[str, str]:
+        """ Gets the pragmas set on every new SQLite connection.
+
+        The `performance` profile (default) enables the write-ahead log, so
+        readers do not block on writers, and relaxes the disk synchronization
+        to the commits that complete a checkpoint. The `default` profile keeps
+        the SQLite defaults. Any pragma can be set on its own to override the
+        profile.
+        ---
+        Returns:
+            A dictionary with the value of every pragma to set, by name.
+        Throws:
+            - TypeError: if the sqlite parameter is not a dictionary.
+            - ValueError: if the profile or any of the pragma values is not valid.
+        """
+
+        sqlite_value: dict = self._get_optional_dict_value('sqlite')
+        profile: str = str(sqlite_value.get('profile', 'performance'))
+        pragmas: Dict[str, str]
+        if profile == 'performance':
+            pragmas = {
+                'journal_mode': 'WAL',
+                'synchronous': 'NORMAL',
+                'mmap_size': '268435456',
+                'cache_size': '-16000',
+                'busy_timeout': '5000'
+            }
+        elif profile == 'default':
+            pragmas = {}
+        else:
+            raise ValueError('Unknown SQLite profile: ' + profile)
+        for name in ('journal_mode', 'synchronous'):
+            if name in sqlite_value:
+                value: str = str(sqlite_value[name])
+                if not value.isalnum():
+                    raise ValueError('Invalid value for the SQLite pragma ' + name + ': ' + value)
+                pragmas[name] = value
+        for name in ('mmap_size', 'cache_size', 'busy_timeout'):
+            if name in sqlite_value:
+                pragmas[name] = str(int(str(sqlite_value[name])))
+        return pragmas
+
+    def get_server_mode(self) -> str:
+        """ Gets the server the service is run with.
+        ---
+        Returns:
+            A string, `development` for the Flask development server (default) or
+            `production` for the embedded production server.
+        Throws:
+            - TypeError: if the server parameter is not a dictionary.
+            - ValueError: if the mode is not valid.
+        """
+
+        mode: str = str(self._get_optional_dict_value('server').get('mode', 'development'))
+        if mode not in ('development', 'production'):
+            raise ValueError('Unknown server mode: ' + mode)
+        return mode
+
+    def get_server_options(self) -> dict:
+        """ Gets the options of the production server.
+        ---
+        Returns:
+            A dictionary with the `workers` (processes, default 1), `threads` per
+            worker (default 8), `worker_timeout` (default 30) and `keepalive`
+            (default 5) arguments of the server.
+        Throws:
+            - TypeError: if the server parameter is not a dictionary.
+        """
+
+        server_value: dict = self._get_optional_dict_value('server')
+        return {
+            'workers': int(str(server_value.get('workers', 1))),
+            'threads': int(str(server_value.get('threads', 8))),
+            'worker_timeout': float(str(server_value.get('worker_timeout', 30))),
+            'keepalive': float(str(server_value.get('keepalive', 5)))
+        }
+
+    def get_metrics_token(self) -> Optional[str]:
+        """ Gets the token the requests for the metrics must carry.
+        ---
+        Returns:
+            A string with the token, or None if the metrics are served to anyone.
+        Throws:
+            - TypeError: if the metrics parameter is not a dictionary.
+        """
+
+        token = self._get_optional_dict_value('metrics').get('token')
+        return str(token) if token else None
@@ -0,0 +1,5 @@
+""" Common database-related classes.
+"""
+
+from .leasestore import LeaseStore
+from .schemasetup import SchemaSetup
@@ -0,0 +1,86 @@
+""" LeaseStore class module.
+"""
+
+from datetime import datetime, timedelta
+from sqlalchemy import func, or_  # type: ignore
+from sqlalchemy.exc import IntegrityError  # type: ignore
+from sqlalchemy.orm.session import Session  # type: ignore
+
+
+class LeaseStore():
+    """ Class responsible of the lease operations shared by the services.
+
+    Every service maps its own lease table; the ORM class given to the
+    operations must have the `name`, `holder` and `heartbeat` columns and be
+    constructed from their values, in that order. Only the services with a
+    database use this module, so SQLAlchemy is not a dependency of the core.
+    """
+
+    # Extra time an abandoned lease is waited for, as some database clocks
+    # (e.g. SQLite's CURRENT_TIMESTAMP) only have a one-second resolution
+    CLOCK_MARGIN: timedelta = timedelta(seconds=1)
+
+    @staticmethod
+    def acquire(session: Session, lease_class: type, name: str, holder: str,
+                ttl: timedelta) -> bool:
+        """ Takes or renews a lease.
+
+        The lease is taken if nobody holds it, if its holder is the requestor
+        or if its heartbeat is older than the TTL plus `CLOCK_MARGIN`. The check
+        and the update are a single statement, so two processes can never take
+        it at once. Times are taken from the database clock, so processes on
+        different hosts do not need to agree on theirs; the margin covers that
+        clock truncating them, so a holder that renews within the TTL is never
+        overtaken.
+        ---
+        Note:
+            Any existing transaction will be committed.
+        Parameters:
+            - session: The session object.
+            - lease_class: The ORM class of the lease records.
+            - name: The lease name.
+            - holder: A string identifying the requestor.
+            - ttl: Time after its last heartbeat a lease is considered abandoned.
+        Returns:
+            True if the requestor holds the lease; False otherwise.
+        """
+        lease_name = getattr(lease_class, 'name')
+        lease_holder = getattr(lease_class, 'holder')
+        lease_heartbeat = getattr(lease_class, 'heartbeat')
+        now: datetime = session.query(func.now()).scalar()
+        updated: int = session.query(lease_class).filter(
+            lease_name == name,
+            or_(lease_holder == holder, lease_heartbeat < now - ttl - LeaseStore.CLOCK_MARGIN)
+        ).update({'holder': holder, 'heartbeat': now}, synchronize_session=False)
+        if updated > 0:
+            session.commit()
+            return True
+        # Held by another process; only a missing lease is created
+        if session.query(lease_name).filter(lease_name == name).first() is not None:
+            session.commit()
+            return False
+        try:
+            session.add(lease_class(name, holder, now))
+            session.commit()
+        except IntegrityError:
+            session.rollback()
+            return False
+        return True
+
+    @staticmethod
+    def release(session: Session, lease_class: type, name: str, holder: str) -> None:
+        """ Gives a lease up, so another process can take it straight away.
+        ---
+        Note:
+            Any existing transaction will be committed.
+        Parameters:
+            - session: The session object.
+            - lease_class: The ORM class of the lease records.
+            - name: The lease name.
+            - holder: A string identifying the requestor. Nothing is done if it
+                      does not hold the lease.
+        """
+        session.query(lease_class).filter_by(
+            name=name, holder=holder
+        ).delete(synchronize_session=False)
+        session.commit()
@@ -0,0 +1,71 @@
+""" SchemaSetup class module.
+"""
+
+from typing import Dict, Set
+from sqlalchemy import MetaData, create_engine, event, inspect  # type: ignore
+from sqlalchemy.engine import Engine  # type: ignore
+from sqlalchemy.engine.url import make_url  # type: ignore
+
+
+class SchemaSetup():
+    """ Class responsible of the database setup steps shared by the service schemas.
+    """
+
+    @staticmethod
+    def new_engine(connection_string: str, pool_options: dict) -> Engine:
+        """ Creates the engine of a database with the configured pool options.
+        ---
+        Parameters:
+            - connection_string: The database connection string.
+            - pool_options: The connection pool engine arguments.
+        Returns:
+            A new Engine.
+        """
+        if make_url(connection_string).get_backend_name() == 'sqlite':
+            # SQLite engines do not use a QueuePool, which is the only one taking the
+            # size, overflow and timeout options
+            pool_options = {
+                key: value for key, value in pool_options.items() if key == 'pool_recycle'
+            }
+        return create_engine(connection_string, **pool_options)
+
+    @staticmethod
+    def set_sqlite_pragmas(engine: Engine, pragmas: Dict[str, str]) -> None:
+        """ Sets some pragmas on every new connection of a SQLite engine.
+        ---
+        Parameters:
+            - engine: The engine of the database.
+            - pragmas: A dictionary with the value of every pragma, by name. The
+                       values must have been validated (see
+                       `Configuration.get_sqlite_pragmas`).
+        """
+        if not pragmas:
+            return
+
+        def set_pragmas(dbapi_connection, _connection_record):
+            cursor = dbapi_connection.cursor()
+            for name, value in pragmas.items():
+                cursor.execute('PRAGMA ' + name + ' = ' + value + ';')
+            cursor.close()
+
+        event.listen(engine, 'connect', set_pragmas)
+
+    @staticmethod
+    def create_missing_indexes(engine: Engine, metadata: MetaData) -> None:
+        """ Creates the indexes of the already existing tables that lack them.
+
+        `create_all` only creates the indexes of the tables it creates, so the
+        tables deployed by older versions would never get those added later on.
+        ---
+        Parameters:
+            - engine: The engine of the database.
+            - metadata: The schema metadata with the table definitions.
+        """
+        inspector = inspect(engine)
+        for table in metadata.sorted_tables:
+            existing: Set[str] = {
+                index['name'] for index in inspector.get_indexes(table.name) if index['name']
+            }
+            for index in table.indexes:
+                if index.name not in existing:
+                    index.create(engine)
@@ -2,3 +2,7 @@
 """
 
 from .restresponse import RestResponse
+from .pooledresponse import PooledResponse
+from .httpconnectionpool import HTTPConnectionPool
+from .wsgiserver import WSGIServer
+from .metrics import Metrics
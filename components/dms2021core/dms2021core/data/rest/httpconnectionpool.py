@@ -0,0 +1,259 @@
+""" HTTPConnectionPool class module.
+"""
+
+import time
+from collections import deque
+from contextlib import contextmanager
+from http.client import HTTPConnection, HTTPException, HTTPResponse
+from threading import BoundedSemaphore, Lock
+from typing import Deque, Dict, Iterator, Optional, Tuple
+from .pooledresponse import PooledResponse
+
+
+class HTTPConnectionPool():
+    """ Thread-safe pool of persistent HTTP/1.1 connections.
+
+    Connections are kept alive between requests and reused, up to a limit of
+    connections per host. Connections idle for too long are closed instead of
+    being reused.
+    """
+    RETRY_METHODS: Tuple[str, ...] = ('GET', 'HEAD')
+
+    def __init__(self, max_per_host: int = 4, connect_timeout: float = 5.0,
+                 read_timeout: Optional[float] = None, idle_timeout: float = 60.0):
+        """ Constructor method.
+
+        Initializes the pool.
+        ---
+        Parameters:
+            - max_per_host: Maximum number of connections to the same host and port.
+                            Requests over the limit wait for a connection to be free.
+            - connect_timeout: Seconds to wait for a connection to be established.
+            - read_timeout: Seconds to wait for data from an established connection.
+                            None (default) to wait as long as the server takes.
+            - idle_timeout: Seconds after which an idle connection is closed.
+        """
+        self.__max_per_host: int = max(1, max_per_host)
+        self.__connect_timeout: float = connect_timeout
+        self.__read_timeout: Optional[float] = read_timeout
+        self.__idle_timeout: float = idle_timeout
+        self.__lock: Lock = Lock()
+        self.__idle: Dict[Tuple[str, int], Deque[Tuple[HTTPConnection, float]]] = {}
+        self.__slots: Dict[Tuple[str, int], BoundedSemaphore] = {}
+        self.__metrics: Dict[str, int] = {
+            'requests': 0,
+            'created': 0,
+            'reused': 0,
+            'retried': 0,
+            'closed_idle': 0,
+            'closed_error': 0
+        }
+
+    def request(self, host: str, port: int, method: str, url: str, body: Optional[str] = None,
+                headers: Optional[dict] = None) -> PooledResponse:
+        """ Sends a request through a pooled connection and reads its response.
+
+        If a reused connection turns out to have been closed by the server, a
+        GET or HEAD request is sent again once through a new connection. Other
+        requests are not retried, as the server may have already handled them.
+        ---
+        Parameters:
+            - host: The server host string.
+            - port: The server port number.
+            - method: The HTTP method.
+            - url: The request path.
+            - body: The request body, if any.
+            - headers: A dictionary with the request headers, if any.
+        Returns:
+            The fully read response.
+        Throws:
+            - HTTPException, OSError: If the request could not be completed.
+        """
+        key: Tuple[str, int] = (host, port)
+        slot: BoundedSemaphore = self.__get_slot(key)
+        slot.acquire()
+        try:
+            connection, response = self.__open(key, method, url, body, headers)
+            try:
+                pooled: PooledResponse = PooledResponse(
+                    response.status, response.reason, response.getheaders(), response.read()
+                )
+            finally:
+                self.__release(key, connection, response)
+            return pooled
+        finally:
+            slot.release()
+
+    @contextmanager
+    def stream(self, host: str, port: int, method: str, url: str, body: Optional[str] = None,
+               headers: Optional[dict] = None) -> Iterator[HTTPResponse]:
+        """ Sends a request through a pooled connection and hands its response over unread.
+
+        The body is read by the caller as it arrives, so it is never held in
+        memory as a whole. The connection goes back to the pool when the block
+        ends if the body was read to its end, and is closed otherwise. Requests
+        are retried as in `request`.
+        ---
+        Parameters:
+            - host: The server host string.
+            - port: The server port number.
+            - method: The HTTP method.
+            - url: The request path.
+            - body: The request body, if any.
+            - headers: A dictionary with the request headers, if any.
+        Returns:
+            The response, with its status and headers already read.
+        Throws:
+            - HTTPException, OSError: If the request could not be completed.
+        """
+        key: Tuple[str, int] = (host, port)
+        slot: BoundedSemaphore = self.__get_slot(key)
+        slot.acquire()
+        try:
+            connection, response = self.__open(key, method, url, body, headers)
+            try:
+                yield response
+            finally:
+                self.__release(key, connection, response)
+        finally:
+            slot.release()
+
+    def close(self) -> None:
+        """ Closes every idle connection.
+        """
+        with self.__lock:
+            for idle in self.__idle.values():
+                while idle:
+                    idle.popleft()[0].close()
+
+    def get_metrics(self) -> Dict[str, int]:
+        """ Gets the pool metrics.
+        ---
+        Returns:
+            A dictionary with the number of requests, connections created, reused
+            and closed, requests retried and connections currently idle.
+        """
+        with self.__lock:
+            metrics: Dict[str, int] = dict(self.__metrics)
+            metrics['idle'] = sum(len(idle) for idle in self.__idle.values())
+        return metrics
+
+    def __get_slot(self, key: Tuple[str, int]) -> BoundedSemaphore:
+        """ Gets the semaphore limiting the connections to a host.
+        ---
+        Parameters:
+            - key: The (host, port) tuple.
+        Returns:
+            The semaphore of the host.
+        """
+        with self.__lock:
+            if key not in self.__slots:
+                self.__slots[key] = BoundedSemaphore(self.__max_per_host)
+            return self.__slots[key]
+
+    def __checkout(self, key: Tuple[str, int]) -> Tuple[HTTPConnection, bool]:
+        """ Takes an idle connection to a host, or opens a new one.
+        ---
+        Parameters:
+            - key: The (host, port) tuple.
+        Returns:
+            A tuple with the connection and whether it was reused or not.
+        """
+        now: float = time.monotonic()
+        with self.__lock:
+            idle: Deque[Tuple[HTTPConnection, float]] = self.__idle.get(key, deque())
+            while idle:
+                connection, idle_since = idle.pop()
+                if now - idle_since < self.__idle_timeout:
+                    self.__metrics['reused'] += 1
+                    return (connection, True)
+                connection.close()
+                self.__metrics['closed_idle'] += 1
+        return (self.__connect(key), False)
+
+    def __connect(self, key: Tuple[str, int]) -> HTTPConnection:
+        """ Opens a new connection to a host.
+        ---
+        Parameters:
+            - key: The (host, port) tuple.
+        Returns:
+            The connection.
+        """
+        connection: HTTPConnection = HTTPConnection(key[0], key[1], timeout=self.__connect_timeout)
+        connection.connect()
+        connection.sock.settimeout(self.__read_timeout)
+        with self.__lock:
+            self.__metrics['created'] += 1
+        return connection
+
+    def __open(self, key: Tuple[str, int], method: str, url: str, body: Optional[str],
+               headers: Optional[dict]) -> Tuple[HTTPConnection, HTTPResponse]:
+        """ Sends a request through a connection to a host, taken from the pool if possible.
+
+        If a reused connection turns out to have been closed by the server, a
+        GET or HEAD request is sent again once through a new connection.
+        ---
+        Parameters:
+            - key: The (host, port) tuple.
+            - method: The HTTP method.
+            - url: The request path.
+            - body: The request body, if any.
+            - headers: A dictionary with the request headers, if any.
+        Returns:
+            A tuple with the connection and its response, whose body is still unread.
+        """
+        with self.__lock:
+            self.__metrics['requests'] += 1
+        connection, reused = self.__checkout(key)
+        try:
+            return (connection, self.__send(connection, method, url, body, headers))
+        except (HTTPException, ConnectionError):
+            if not reused or method not in self.RETRY_METHODS:
+                raise
+            with self.__lock:
+                self.__metrics['retried'] += 1
+            connection = self.__connect(key)
+            return (connection, self.__send(connection, method, url, body, headers))
+
+    def __send(self, connection: HTTPConnection, method: str, url: str, body: Optional[str],
+               headers: Optional[dict]) -> HTTPResponse:
+        """ Sends a request and reads the status and headers of its response.
+        ---
+        Parameters:
+            - connection: The connection to use.
+            - method: The HTTP method.
+            - url: The request path.
+            - body: The request body, if any.
+            - headers: A dictionary with the request headers, if any.
+        Returns:
+            The response, whose body is still unread.
+        """
+        try:
+            connection.request(method, url, body, headers or {})
+            return connection.getresponse()
+        except Exception:
+            connection.close()
+            with self.__lock:
+                self.__metrics['closed_error'] += 1
+            raise
+
+    def __release(self, key: Tuple[str, int], connection: HTTPConnection,
+                  response: HTTPResponse) -> None:
+        """ Gives a connection back once its response is done with.
+
+        The connection is closed instead if the server asked to, or if the body
+        of the response was not read to its end.
+        ---
+        Parameters:
+            - key: The (host, port) tuple.
+            - connection: The connection the response came from.
+            - response: The response.
+        """
+        if response.will_close or not response.isclosed():
+            connection.close()
+            if not response.isclosed():
+                with self.__lock:
+                    self.__metrics['closed_error'] += 1
+        else:
+            with self.__lock:
+                self.__idle.setdefault(key, deque()).append((connection, time.monotonic()))
@@ -0,0 +1,49 @@
+""" Metrics class module.
+"""
+
+import hmac
+import json
+from typing import Callable, Dict, Optional
+from .restresponse import RestResponse
+
+
+class Metrics():
+    """ Class responsible of handling the metrics-related REST requests.
+    """
+
+    def __init__(self, token: Optional[str] = None):
+        """ Constructor method.
+
+        Initializes the metrics REST interface without any metric source.
+        ---
+        Parameters:
+            - token: The token the requests must carry to get the metrics, or None
+                     to serve them to anyone.
+        """
+        self.__sources: Dict[str, Callable[[], Dict[str, float]]] = {}
+        self.__token: Optional[str] = token
+
+    def add_source(self, name: str, source: Callable[[], Dict[str, float]]) -> None:
+        """ Registers a new metrics source.
+        ---
+        Parameters:
+            - name: The name under which the metrics will be reported.
+            - source: A callable returning a dictionary of metric values.
+        """
+        self.__sources[name] = source
+
+    def get_metrics(self, token: Optional[str] = None) -> RestResponse:
+        """ Gets the current value of every registered metric.
+        ---
+        Parameters:
+            - token: The token sent with the request, if any.
+        Returns:
+            A RestResponse object holding the metrics, or a 401 response if a token
+            is required and the given one does not match it.
+        """
+        if self.__token is not None and not hmac.compare_digest(
+                (token or '').encode('utf-8'), self.__token.encode('utf-8')):
+            return RestResponse(code=401, mime_type='text/plain')
+        json_content = {name: source() for name, source in self.__sources.items()}
+        json_response = json.dumps(json_content)
+        return RestResponse(json_response, mime_type="application/json")
@@ -0,0 +1,58 @@
+""" PooledResponse class module.
+"""
+
+from typing import Iterator, List, Optional, Tuple
+
+
+class PooledResponse():
+    """ Entity data-object class holding a fully read HTTP response.
+
+    The body is read before the response is handed over, so the connection it
+    came from can go back to the pool right away.
+    """
+
+    def __init__(self, status: int, reason: str, headers: List[Tuple[str, str]], body: bytes):
+        """ Constructor method.
+
+        Initializes a PooledResponse instance with its immutable data.
+        ---
+        Parameters:
+            - status: The HTTP status code.
+            - reason: The HTTP reason phrase.
+            - headers: A list of (name, value) header tuples.
+            - body: The response body.
+        """
+        self.status: int = status
+        self.reason: str = reason
+        self.__headers: List[Tuple[str, str]] = headers
+        self.__body: bytes = body
+
+    def getheader(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """ Gets the value of a response header.
+        ---
+        Parameters:
+            - name: The header name. Case insensitive.
+            - default: The value to return if the header is not present.
+        Returns:
+            The header value, or the default value.
+        """
+        for header_name, value in self.__headers:
+            if header_name.lower() == name.lower():
+                return value
+        return default
+
+    def read(self) -> bytes:
+        """ Gets the response body.
+        ---
+        Returns:
+            The body bytes.
+        """
+        return self.__body
+
+    def __iter__(self) -> Iterator[bytes]:
+        """ Iterates over the lines of the body.
+        ---
+        Returns:
+            An iterator over the lines, line endings included.
+        """
+        return iter(self.__body.splitlines(True))
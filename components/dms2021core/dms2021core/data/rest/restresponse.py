@@ -1,18 +1,22 @@
 """ RestResponse class module.
 """
 
+from typing import Iterable, Union
+
 
 class RestResponse():
     """ Entity data-object class used to store the data of a response to a REST request.
     """
 
-    def __init__(self, content: str = '', code: int = 200, mime_type: str = 'text/html'):
+    def __init__(self, content: Union[str, Iterable[str]] = '', code: int = 200,
+                 mime_type: str = 'text/html'):
         """ Constructor method.
 
         Initializes a RestResponse instance with its immutable data.
         ---
         Parameters:
-            - content: A string with the response content. Defaults to ''
+            - content: A string with the response content, or an iterable of strings
+                       to stream it in chunks. Defaults to ''
             - code: An integer with the HTTP status code to use for the response.
                     Defaults to 200 (OK).
             - mime_type: The content type string. Defaults to 'text/html'
@@ -21,11 +25,11 @@ class RestResponse():
         self.__code = code
         self.__mime_type = mime_type
 
-    def get_content(self) -> str:
+    def get_content(self) -> Union[str, Iterable[str]]:
         """ Gets the response content.
         ---
         Returns:
-            A string with the response content.
+            A string with the response content, or an iterable of its chunks.
         """
         return self.__content
 
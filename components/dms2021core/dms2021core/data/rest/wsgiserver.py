@@ -0,0 +1,90 @@
+""" WSGIServer class module.
+"""
+
+from typing import Callable, Optional
+
+
+class WSGIServer():
+    """ Production server for the WSGI applications of the services.
+
+    Embeds gunicorn, serving the application from a number of worker processes,
+    each of them with a pool of threads handling the requests and keeping the
+    connections alive between requests. The application is loaded before the
+    workers are forked, so anything that must not be shared between processes
+    (background threads, database connections) has to be set up in the
+    `post_fork` callback.
+
+    Requests have no time limit: a thread cannot be interrupted, so a slow
+    request keeps its thread busy until it finishes.
+    """
+
+    def __init__(self, app: Callable, host: str, port: int, workers: int = 1, threads: int = 8,
+                 worker_timeout: float = 30.0, keepalive: float = 5.0,
+                 post_fork: Optional[Callable[[], None]] = None):
+        """ Constructor method.
+
+        Initializes the server. Nothing is served until `run` is called.
+        ---
+        Parameters:
+            - app: The WSGI application.
+            - host: The host to listen on.
+            - port: The port to listen on.
+            - workers: Number of worker processes.
+            - threads: Number of threads handling the requests in every worker.
+            - worker_timeout: Seconds after which a worker that stopped sending its
+                              heartbeat to the server is restarted. It is not a
+                              request timeout: with threaded workers, a slow
+                              request does not stop the heartbeat.
+            - keepalive: Seconds an idle connection is kept open waiting for the
+                         next request.
+            - post_fork: A callable run in every worker process once it is forked.
+        """
+        self.__app: Callable = app
+        self.__options: dict = {
+            'bind': host + ':' + str(port),
+            'workers': max(1, workers),
+            'threads': max(1, threads),
+            'worker_class': 'gthread',
+            'timeout': worker_timeout,
+            'keepalive': keepalive
+        }
+        self.__post_fork: Optional[Callable[[], None]] = post_fork
+
+    def run(self) -> None:
+        """ Serves the application until the server is stopped.
+        ---
+        Throws:
+            - RuntimeError: If gunicorn is not installed.
+        """
+        # pylint: disable=import-outside-toplevel
+        # Only needed in production mode, so it is not a dependency of the core
+        try:
+            from gunicorn.app.base import BaseApplication  # type: ignore
+        except ImportError as ex:
+            raise RuntimeError('The production server mode requires gunicorn.') from ex
+
+        app: Callable = self.__app
+        options: dict = dict(self.__options)
+        post_fork: Optional[Callable[[], None]] = self.__post_fork
+        if post_fork is not None:
+            options['post_fork'] = lambda server, worker: post_fork()
+
+        class EmbeddedApplication(BaseApplication):  # pylint: disable=abstract-method
+            """ Gunicorn application serving an already loaded WSGI application.
+            """
+
+            def load_config(self):
+                """ Loads the server options.
+                """
+                for key, value in options.items():
+                    self.cfg.set(key, value)
+
+            def load(self):
+                """ Gets the WSGI application.
+                ---
+                Returns:
+                    The WSGI application to serve.
+                """
+                return app
+
+        EmbeddedApplication().run()
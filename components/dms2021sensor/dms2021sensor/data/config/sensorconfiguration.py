@@ -1,6 +1,9 @@
 """ SensorConfiguration class module.
 """
 
+import os
+from typing import Optional
+from appdirs import user_data_dir  # type: ignore
 from dms2021core.data.config import Configuration, ConfigurationValueType
 
 
@@ -120,3 +123,356 @@ class SensorConfiguration(Configuration):
 
         auth_service_value: dict = self.__get_auth_service_value()
         return int(str(auth_service_value['port']))
+
+    def get_scheduler_resync_interval(self) -> float:
+        """ Gets the interval between two rule list reloads of the scheduler.
+        ---
+        Returns:
+            A float with the number of seconds between reloads. Defaults to 10.
+        Throws:
+            - TypeError: if the scheduler parameter is not a dictionary.
+        """
+
+        scheduler_value: dict = self._get_optional_dict_value('scheduler')
+        return float(str(scheduler_value.get('resync_interval', 10)))
+
+    def get_scheduler_workers(self) -> int:
+        """ Gets the number of worker threads running the scheduled rules.
+        ---
+        Returns:
+            An integer with the size of the worker pool. Defaults to 4.
+        Throws:
+            - TypeError: if the scheduler parameter is not a dictionary.
+        """
+
+        scheduler_value: dict = self._get_optional_dict_value('scheduler')
+        return int(str(scheduler_value.get('workers', 4)))
+
+    def get_scheduler_lease_ttl(self) -> float:
+        """ Gets the time after its last heartbeat the scheduler lease is considered abandoned.
+        ---
+        Returns:
+            A float with the number of seconds. Defaults to 15.
+        Throws:
+            - TypeError: if the scheduler parameter is not a dictionary.
+        """
+
+        scheduler_value: dict = self._get_optional_dict_value('scheduler')
+        return float(str(scheduler_value.get('lease_ttl', 15)))
+
+    def get_scheduler_heartbeat_interval(self) -> float:
+        """ Gets the interval between two renewals of the scheduler lease.
+        ---
+        Returns:
+            A float with the number of seconds between renewals. Defaults to 5.
+        Throws:
+            - TypeError: if the scheduler parameter is not a dictionary.
+        """
+
+        scheduler_value: dict = self._get_optional_dict_value('scheduler')
+        return float(str(scheduler_value.get('heartbeat_interval', 5)))
+
+    def get_command_runner_mode(self) -> str:
+        """ Gets how the command rules are run.
+        ---
+        Returns:
+            `subprocess` to run each command from a blocking thread (default) or
+            `asyncio` to supervise every command from a single event loop.
+        Throws:
+            - TypeError: if the command_runner parameter is not a dictionary.
+            - ValueError: if the mode is not supported.
+        """
+
+        command_runner_value: dict = self._get_optional_dict_value('command_runner')
+        mode: str = str(command_runner_value.get('mode', 'subprocess'))
+        if mode not in ('subprocess', 'asyncio'):
+            raise ValueError('Unsupported command runner mode: ' + mode)
+        return mode
+
+    def get_command_runner_max_concurrency(self) -> int:
+        """ Gets the maximum number of commands run at the same time in `asyncio` mode.
+        ---
+        Returns:
+            An integer with the maximum number of concurrent commands. Defaults to 100.
+        Throws:
+            - TypeError: if the command_runner parameter is not a dictionary.
+        """
+
+        command_runner_value: dict = self._get_optional_dict_value('command_runner')
+        return int(str(command_runner_value.get('max_concurrency', 100)))
+
+    def get_command_runner_timeout(self) -> float:
+        """ Gets the number of seconds after which a command is killed in `asyncio` mode.
+        ---
+        Returns:
+            A float with the timeout in seconds, or 0 if commands never time out (default).
+        Throws:
+            - TypeError: if the command_runner parameter is not a dictionary.
+        """
+
+        command_runner_value: dict = self._get_optional_dict_value('command_runner')
+        return float(str(command_runner_value.get('timeout', 0)))
+
+    def get_cpu_sampler_enabled(self) -> bool:
+        """ Gets whether the CPU rules read from a shared background sampler or not.
+        ---
+        Returns:
+            A boolean, True if the sampler is enabled (default).
+        Throws:
+            - TypeError: if the cpu_sampler parameter is not a dictionary.
+        """
+
+        cpu_sampler_value: dict = self._get_optional_dict_value('cpu_sampler')
+        return bool(cpu_sampler_value.get('enabled', True))
+
+    def get_cpu_sampler_interval(self) -> float:
+        """ Gets the number of seconds between two CPU samples.
+        ---
+        Returns:
+            A float with the sampling interval. Defaults to 0.5.
+        Throws:
+            - TypeError: if the cpu_sampler parameter is not a dictionary.
+        """
+
+        cpu_sampler_value: dict = self._get_optional_dict_value('cpu_sampler')
+        return float(str(cpu_sampler_value.get('interval', 0.5)))
+
+    def get_cpu_sampler_window(self) -> float:
+        """ Gets the number of seconds of CPU samples averaged by the CPU rules.
+        ---
+        Returns:
+            A float with the window size. Defaults to 0.5, i.e., the latest sample.
+        Throws:
+            - TypeError: if the cpu_sampler parameter is not a dictionary.
+        """
+
+        cpu_sampler_value: dict = self._get_optional_dict_value('cpu_sampler')
+        return float(str(cpu_sampler_value.get('window', 0.5)))
+
+    def get_log_writer_enabled(self) -> bool:
+        """ Gets whether the logs are stored in batches by a background writer or not.
+        ---
+        Returns:
+            A boolean, True if the writer is enabled (default).
+        Throws:
+            - TypeError: if the log_writer parameter is not a dictionary.
+        """
+
+        log_writer_value: dict = self._get_optional_dict_value('log_writer')
+        return bool(log_writer_value.get('enabled', True))
+
+    def get_log_writer_batch_size(self) -> int:
+        """ Gets the maximum number of logs committed at once.
+        ---
+        Returns:
+            An integer with the batch size. Defaults to 100.
+        Throws:
+            - TypeError: if the log_writer parameter is not a dictionary.
+        """
+
+        log_writer_value: dict = self._get_optional_dict_value('log_writer')
+        return int(str(log_writer_value.get('batch_size', 100)))
+
+    def get_log_writer_flush_interval(self) -> float:
+        """ Gets the maximum time a log waits before being committed.
+        ---
+        Returns:
+            A float with the flush interval in seconds. Configured in milliseconds
+            through `flush_interval_ms`, it defaults to 200 ms.
+        Throws:
+            - TypeError: if the log_writer parameter is not a dictionary.
+        """
+
+        log_writer_value: dict = self._get_optional_dict_value('log_writer')
+        return float(str(log_writer_value.get('flush_interval_ms', 200))) / 1000
+
+    def get_sqlite_read_pool_size(self) -> int:
+        """ Gets the number of read-only connections the REST reads of a SQLite database use.
+        ---
+        Returns:
+            An integer with the number of connections, 0 to read through the same
+            connections as the writes. Defaults to 4.
+        Throws:
+            - TypeError: if the sqlite parameter is not a dictionary.
+        """
+
+        return int(str(self._get_optional_dict_value('sqlite').get('read_pool_size', 4)))
+
+    def get_rights_cache_enabled(self) -> bool:
+        """ Gets whether the right checks are cached or not.
+        ---
+        Returns:
+            A boolean, True if the cache is enabled (default).
+        Throws:
+            - TypeError: if the rights_cache parameter is not a dictionary.
+        """
+
+        rights_cache_value: dict = self._get_optional_dict_value('rights_cache')
+        return bool(rights_cache_value.get('enabled', True))
+
+    def get_rights_cache_positive_ttl(self) -> float:
+        """ Gets the time a granted right is cached.
+        ---
+        Returns:
+            A float with the number of seconds. Defaults to 10.
+        Throws:
+            - TypeError: if the rights_cache parameter is not a dictionary.
+        """
+
+        rights_cache_value: dict = self._get_optional_dict_value('rights_cache')
+        return float(str(rights_cache_value.get('positive_ttl', 10)))
+
+    def get_rights_cache_negative_ttl(self) -> float:
+        """ Gets the time a denied right is cached.
+        ---
+        Returns:
+            A float with the number of seconds. Defaults to 2.
+        Throws:
+            - TypeError: if the rights_cache parameter is not a dictionary.
+        """
+
+        rights_cache_value: dict = self._get_optional_dict_value('rights_cache')
+        return float(str(rights_cache_value.get('negative_ttl', 2)))
+
+    def get_rights_cache_max_entries(self) -> int:
+        """ Gets the maximum number of cached right checks.
+        ---
+        Returns:
+            An integer with the number of entries. Defaults to 1024.
+        Throws:
+            - TypeError: if the rights_cache parameter is not a dictionary.
+        """
+
+        rights_cache_value: dict = self._get_optional_dict_value('rights_cache')
+        return int(str(rights_cache_value.get('max_entries', 1024)))
+
+    def get_http_pool_options(self) -> dict:
+        """ Gets the options of the pool of connections to the other services.
+        ---
+        Returns:
+            A dictionary with the configured `max_per_host`, `connect_timeout`,
+            `read_timeout` and `idle_timeout` pool arguments. The read timeout
+            defaults to 30 seconds; the other options that are not configured are
+            left out so the pool defaults are kept.
+        Throws:
+            - TypeError: if the http_pool parameter is not a dictionary.
+        """
+
+        http_pool_value: dict = self._get_optional_dict_value('http_pool')
+        options: dict = {}
+        if 'max_per_host' in http_pool_value:
+            options['max_per_host'] = int(str(http_pool_value['max_per_host']))
+        for key in ['connect_timeout', 'idle_timeout']:
+            if key in http_pool_value:
+                options[key] = float(str(http_pool_value[key]))
+        options['read_timeout'] = float(str(http_pool_value.get('read_timeout', 30)))
+        return options
+
+    def get_capability_token_key(self) -> Optional[str]:
+        """ Gets the key shared with the authentication service to verify capability tokens.
+        ---
+        Returns:
+            A string with the key, or None if the tokens are not to be trusted.
+        Throws:
+            - TypeError: if the capability_tokens parameter is not a dictionary.
+        """
+
+        key = self._get_optional_dict_value('capability_tokens').get('key')
+        return str(key) if key else None
+
+    def get_runner_mode(self) -> str:
+        """ Gets where the rules are run.
+        ---
+        Returns:
+            A string, `embedded` to run them in the service process (default) or
+            `standalone` to run them in a `dms2021sensor-runner` process.
+        Throws:
+            - TypeError: if the runner parameter is not a dictionary.
+            - ValueError: if the mode is not valid.
+        """
+
+        mode: str = str(self._get_optional_dict_value('runner').get('mode', 'embedded'))
+        if mode not in ('embedded', 'standalone'):
+            raise ValueError('Unknown runner mode: ' + mode)
+        return mode
+
+    def get_runner_address(self) -> str:
+        """ Gets the path of the socket the standalone runner process listens on.
+        ---
+        Returns:
+            A string with the path. Defaults to `runner.sock` in a `dms2021sensor`
+            directory of `$XDG_RUNTIME_DIR`, or of the user data directory if it is
+            not set, which the runner creates accessible only by its user.
+        Throws:
+            - TypeError: if the runner parameter is not a dictionary.
+        """
+
+        runner_value: dict = self._get_optional_dict_value('runner')
+        if 'address' in runner_value:
+            return str(runner_value['address'])
+        runtime_dir: str = os.environ.get('XDG_RUNTIME_DIR') or user_data_dir()
+        return os.path.join(runtime_dir, 'dms2021sensor', 'runner.sock')
+
+    def get_runner_timeout(self) -> float:
+        """ Gets the maximum time to wait for the standalone runner process to answer.
+        ---
+        Returns:
+            A float with the number of seconds. Defaults to 60.
+        Throws:
+            - TypeError: if the runner parameter is not a dictionary.
+        """
+
+        return float(str(self._get_optional_dict_value('runner').get('timeout', 60)))
+
+    def get_runner_authkey(self) -> bytes:
+        """ Gets the key the service authenticates with to the standalone runner process.
+        ---
+        Returns:
+            The key as bytes.
+        Throws:
+            - TypeError: if the runner parameter is not a dictionary.
+            - ValueError: if the key is not set or empty.
+        """
+
+        authkey = self._get_optional_dict_value('runner').get('authkey')
+        if authkey is None or not str(authkey):
+            raise ValueError(
+                'A value for the configuration parameter `runner.authkey` is needed.'
+            )
+        return str(authkey).encode('utf-8')
+
+    def get_jobs_max_per_user(self) -> int:
+        """ Gets the maximum number of unfinished rule run jobs of a single user.
+
+        The limit is checked by every service process on its own, so several
+        processes sharing the database may together accept a few more jobs.
+        ---
+        Returns:
+            An integer with the number of jobs. Defaults to 4.
+        Throws:
+            - TypeError: if the jobs parameter is not a dictionary.
+        """
+
+        return int(str(self._get_optional_dict_value('jobs').get('max_per_user', 4)))
+
+    def get_jobs_retention(self) -> float:
+        """ Gets the time the rule run jobs are kept for.
+        ---
+        Returns:
+            A float with the number of seconds since a job is requested. Defaults to 3600.
+        Throws:
+            - TypeError: if the jobs parameter is not a dictionary.
+        """
+
+        return float(str(self._get_optional_dict_value('jobs').get('retention', 3600)))
+
+    def get_jobs_max_wait(self) -> float:
+        """ Gets the maximum time a request waits for a rule run job to finish.
+        ---
+        Returns:
+            A float with the number of seconds. Defaults to 30.
+        Throws:
+            - TypeError: if the jobs parameter is not a dictionary.
+        """
+
+        return float(str(self._get_optional_dict_value('jobs').get('max_wait', 30)))
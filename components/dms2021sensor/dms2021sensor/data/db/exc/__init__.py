@@ -5,3 +5,4 @@ from .rulenotexsistserror import RuleNotExistsError
 from .logexistserror import LogExistsError
 from .ruleexistserror import RuleExistsError
 from .lognotexistserror import LogNotExistsError
+from .jobnotexistserror import JobNotExistsError
@@ -0,0 +1,6 @@
+""" JobNotExistsError class module.
+"""
+
+class JobNotExistsError(Exception):
+    """ This is thrown when a job does not exist
+    """
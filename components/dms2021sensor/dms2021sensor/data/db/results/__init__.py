@@ -3,3 +3,5 @@
 
 from .log import Log
 from .rule import Rule
+from .schedulerlease import SchedulerLease
+from .job import Job
@@ -0,0 +1,93 @@
+""" Job class module.
+"""
+
+from datetime import datetime
+from typing import Optional
+import json
+from sqlalchemy import Table, MetaData, Column, String, DateTime, Index # type: ignore
+from .resultbase import ResultBase
+
+class Job(ResultBase):
+    """ Definition and storage of job ORM records.
+
+    A job is a run of a rule requested by a user, executed in the background
+    while the user polls for its result.
+    """
+
+    QUEUED: str = "queued"
+    RUNNING: str = "running"
+    SUCCEEDED: str = "succeeded"
+    FAILED: str = "failed"
+
+    def __init__(self, job_id: str, rule_name: str, username: str, created: datetime):
+        """ Constructor method.
+
+        Initializes a queued job.
+        ---
+        Parameters:
+            - job_id: A string with the job identifier.
+            - rule_name: A string with the name of the rule to run.
+            - username: A string with the name of the user requesting the run.
+            - created: The datetime the job was requested at.
+        """
+        self.job_id: str = job_id
+        self.rule_name: str = rule_name
+        self.username: str = username
+        self.status: str = Job.QUEUED
+        self.result: Optional[str] = None
+        self.created: datetime = created
+        self.finished: Optional[datetime] = None
+
+    @staticmethod
+    def _table_definition(metadata: MetaData) -> Table:
+        """ Gets the table definition.
+        ---
+        Parameters:
+            - metadata: The database schema metadata
+        Returns:
+            A Table object with the table definition.
+        """
+        return Table(
+            "jobs",
+            metadata,
+            Column("job_id", String(32), primary_key=True),
+            Column("rule_name", String(32), nullable=False),
+            Column("username", String(32), nullable=False),
+            Column("status", String(16), nullable=False),
+            Column("result", String(8192), nullable=True),
+            Column("created", DateTime, nullable=False),
+            Column("finished", DateTime, nullable=True),
+            # Serves the count of the unfinished jobs of every user
+            Index("ix_jobs_username_status", "username", "status")
+        )
+
+    def is_finished(self) -> bool:
+        """ Gets whether the job has finished or not.
+        ---
+        Returns:
+            True if the job succeeded or failed; False otherwise.
+        """
+        return self.status in (Job.SUCCEEDED, Job.FAILED)
+
+    def to_dict(self) -> dict:
+        """ Gets the object as a dictionary.
+        ---
+        Returns:
+            A dictionary with the JSON-serializable fields of the object.
+        """
+        return {
+            "job_id": self.job_id,
+            "rule_name": self.rule_name,
+            "status": self.status,
+            "result": self.result,
+            "created": self.created.strftime("%d %b %Y %H:%M:%S"),
+            "finished": self.finished.strftime("%d %b %Y %H:%M:%S") if self.finished else None
+        }
+
+    def __str__(self) -> str:
+        """ Gets the object as a string.
+        ---
+        Returns:
+            The object formatted as a json-formatted string.
+        """
+        return json.dumps(self.to_dict())
@@ -3,7 +3,7 @@
 
 from datetime import datetime
 import json
-from sqlalchemy import Table, MetaData, Column, String, DateTime, ForeignKey # type: ignore
+from sqlalchemy import Table, MetaData, Column, String, DateTime, ForeignKey, Index # type: ignore
 from .resultbase import ResultBase
 
 class Log(ResultBase):
@@ -36,19 +36,32 @@ class Log(ResultBase):
         return Table(
             "logs",
             metadata,
-            Column("rule_name", String(32), ForeignKey("rules.rule_name", ondelete="CASCADE"), primary_key=True),
+            Column(
+                "rule_name", String(32), ForeignKey("rules.rule_name", ondelete="CASCADE"),
+                primary_key=True
+            ),
             Column("time", DateTime, primary_key=True),
-            Column("result", String(8192), nullable=False)
+            Column("result", String(8192), nullable=False),
+            # Serves the pages of logs of every rule ordered by (time, rule_name)
+            Index("ix_logs_time_rule_name", "time", "rule_name")
         )
 
-    def __str__(self) -> str:
-        """ Gets the object as a string.
+    def to_dict(self) -> dict:
+        """ Gets the object as a dictionary.
         ---
         Returns:
-            The object formatted as a json-formatted string.
+            A dictionary with the JSON-serializable fields of the object.
         """
-        return json.dumps({
+        return {
             "rule_name": self.rule_name,
             "time": self.time.strftime("%d %b %Y %H:%M:%S"),
             "result": self.result
-        })
+        }
+
+    def __str__(self) -> str:
+        """ Gets the object as a string.
+        ---
+        Returns:
+            The object formatted as a json-formatted string.
+        """
+        return json.dumps(self.to_dict())
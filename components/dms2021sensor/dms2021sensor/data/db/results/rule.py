@@ -56,15 +56,23 @@ class Rule(ResultBase):
             "logs": relationship(Log, backref=backref("rule"))
         }
 
-    def __str__(self) -> str:
-        """ Gets the object as a string.
+    def to_dict(self) -> dict:
+        """ Gets the object as a dictionary.
         ---
         Returns:
-            The object formatted as a json-formatted string.
+            A dictionary with the JSON-serializable fields of the object.
         """
-        return json.dumps({
+        return {
             "rule_name": self.rule_name,
             "type": self.type,
             "data": self.data,
             "frequency": self.frequency
-        })
+        }
+
+    def __str__(self) -> str:
+        """ Gets the object as a string.
+        ---
+        Returns:
+            The object formatted as a json-formatted string.
+        """
+        return json.dumps(self.to_dict())
@@ -0,0 +1,45 @@
+""" SchedulerLease class module.
+"""
+
+from datetime import datetime
+from sqlalchemy import Table, MetaData, Column, String, DateTime # type: ignore
+from .resultbase import ResultBase
+
+class SchedulerLease(ResultBase):
+    """ Definition and storage of the scheduler lease ORM records.
+
+    A lease names the process currently allowed to schedule the rules. The
+    holder keeps it by updating the heartbeat; a lease whose heartbeat is too
+    old can be taken by any other process.
+    """
+
+    def __init__(self, name: str, holder: str, heartbeat: datetime):
+        """ Constructor method.
+
+        Initializes a lease.
+        ---
+        Parameters:
+            - name: A string with the lease name.
+            - holder: A string identifying the process holding the lease.
+            - heartbeat: The datetime of the last renewal of the lease.
+        """
+        self.name: str = name
+        self.holder: str = holder
+        self.heartbeat: datetime = heartbeat
+
+    @staticmethod
+    def _table_definition(metadata: MetaData) -> Table:
+        """ Gets the table definition.
+        ---
+        Parameters:
+            - metadata: The database schema metadata
+        Returns:
+            A Table object with the table definition.
+        """
+        return Table(
+            "scheduler_leases",
+            metadata,
+            Column("name", String(32), primary_key=True),
+            Column("holder", String(128), nullable=False),
+            Column("heartbeat", DateTime, nullable=False)
+        )
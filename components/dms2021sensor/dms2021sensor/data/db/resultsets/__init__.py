@@ -3,3 +3,5 @@
 
 from .logs import Logs
 from .rules import Rules
+from .schedulerleases import SchedulerLeases
+from .jobs import Jobs
@@ -0,0 +1,151 @@
+""" Jobs class module.
+"""
+
+from datetime import datetime
+from typing import Collection, Optional
+from dms2021sensor.data.db.results.job import Job
+from dms2021sensor.data.db.exc import JobNotExistsError
+from sqlalchemy.orm.session import Session # type: ignore
+
+class Jobs():
+    """ Class responsible of table-level jobs operations
+    """
+    @staticmethod
+    def create(session: Session, job_id: str, rule_name: str, username: str) -> Job:
+        """ Creates a new queued job record.
+        ---
+        Note:
+            Any existing transaction will be committed.
+        Parameters:
+            - session: The session object.
+            - job_id: The job identifier string.
+            - rule_name: The name of the rule to run.
+            - username: The name of the user requesting the run.
+        Returns:
+            The created Job result.
+        Throws:
+            - ValueError: If some parameter is missing.
+        """
+        if not job_id or not rule_name:
+            raise ValueError("A job identifier and a rule name are required.")
+        job = Job(job_id, rule_name, username, datetime.now())
+        session.add(job)
+        session.commit()
+        return job
+
+    @staticmethod
+    def get_job(session: Session, job_id: str) -> Job:
+        """ Gets a job
+        ---
+        Parameters:
+            - session: The session object.
+            - job_id: The job identifier.
+        Return:
+            The job if exists.
+        Throws:
+            - JobNotExistsError if the job does not exist.
+        """
+        job: Optional[Job] = session.query(Job).filter_by(job_id=job_id).one_or_none()
+        if job is None:
+            raise JobNotExistsError("The job does not exist.")
+        return job
+
+    @staticmethod
+    def count_unfinished(session: Session, username: str, since: datetime) -> int:
+        """ Counts the jobs of a user that are queued or running.
+        ---
+        Parameters:
+            - session: The session object.
+            - username: The user name.
+            - since: Only count the jobs created at or after this datetime.
+        Return:
+            The number of unfinished jobs.
+        """
+        job_status = getattr(Job, 'status')
+        return session.query(Job).filter(
+            getattr(Job, 'username') == username,
+            job_status.in_([Job.QUEUED, Job.RUNNING]),
+            getattr(Job, 'created') >= since
+        ).count()
+
+    @staticmethod
+    def update_status(session: Session, job_id: str, status: str,
+                      result: Optional[str] = None) -> None:
+        """ Updates the status of a job.
+
+        Finished jobs are left as they are, so a job failed by
+        `fail_unfinished_before` is never reported as something else afterwards.
+        ---
+        Note:
+            Any existing transaction will be committed.
+        Parameters:
+            - session: The session object.
+            - job_id: The job identifier.
+            - status: The new status.
+            - result: The result of the run, or the reason it failed, if finished.
+        """
+        values: dict = {"status": status}
+        if status in (Job.SUCCEEDED, Job.FAILED):
+            values["result"] = result
+            values["finished"] = datetime.now()
+        session.query(Job).filter(
+            getattr(Job, 'job_id') == job_id,
+            getattr(Job, 'status').in_([Job.QUEUED, Job.RUNNING])
+        ).update(values, synchronize_session=False)
+        session.commit()
+
+    @staticmethod
+    def delete_created_before(session: Session, cutoff: datetime) -> int:
+        """ Deletes the finished jobs created before a given time.
+
+        Unfinished jobs are kept; see `fail_unfinished_before`.
+        ---
+        Note:
+            Any existing transaction will be committed.
+        Parameters:
+            - session: The session object.
+            - cutoff: The datetime before which the jobs are deleted.
+        Return:
+            The number of jobs deleted.
+        """
+        job_status = getattr(Job, 'status')
+        deleted: int = session.query(Job).filter(
+            job_status.in_([Job.SUCCEEDED, Job.FAILED]),
+            getattr(Job, 'created') < cutoff
+        ).delete(synchronize_session=False)
+        session.commit()
+        return deleted
+
+    @staticmethod
+    def fail_unfinished_before(session: Session, cutoff: datetime,
+                               running: Collection[str] = ()) -> int:
+        """ Marks as failed the unfinished jobs created before a given time.
+
+        These are usually jobs left behind by a process that died or was
+        restarted, which nothing else would ever finish. Once failed, they are
+        deleted like any other finished job.
+        ---
+        Note:
+            Any existing transaction will be committed.
+        Parameters:
+            - session: The session object.
+            - cutoff: The datetime before which the jobs are failed.
+            - running: The identifiers of the jobs known to be still running,
+                       which are left unfinished.
+        Return:
+            The number of jobs failed.
+        """
+        job_status = getattr(Job, 'status')
+        query = session.query(Job).filter(
+            job_status.in_([Job.QUEUED, Job.RUNNING]),
+            getattr(Job, 'created') < cutoff
+        )
+        if running:
+            query = query.filter(getattr(Job, 'job_id').notin_(list(running)))
+        failed: int = query.update({
+            "status": Job.FAILED,
+            "result": "The job did not finish within the retention time.",
+            "finished": datetime.now()
+        }, synchronize_session=False)
+        session.commit()
+        return failed
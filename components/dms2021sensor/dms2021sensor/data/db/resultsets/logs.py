@@ -1,11 +1,12 @@
 """ Logs class module.
 """
 
-from typing import Optional, List
+from typing import Iterator, Optional, List, Tuple
 from datetime import datetime
 from dms2021sensor.data.db.results.log import Log
 from dms2021sensor.data.db.resultsets.rules import Rules
 from dms2021sensor.data.db.exc import RuleNotExistsError, LogExistsError, LogNotExistsError
+from sqlalchemy import tuple_ # type: ignore
 from sqlalchemy.exc import IntegrityError # type: ignore
 from sqlalchemy.orm.session import Session # type: ignore
 
@@ -41,8 +42,39 @@ class Logs():
             session.commit()
             return log
         except IntegrityError as ex:
+            session.rollback()
             raise LogExistsError("The log already exists") from ex
 
+    @staticmethod
+    def create_many(session: Session, entries: List[Tuple[str, datetime, str]]) -> List[Log]:
+        """ Creates several log records in a single transaction.
+
+        Unlike `create`, the existence of the rules is not queried beforehand; the
+        foreign key on the rule name is relied upon instead.
+        ---
+        Note:
+            Any existing transaction will be committed.
+        Parameters:
+            - session: The session object.
+            - entries: A list of (rule name, time, result) tuples.
+        Returns:
+            The list of created Log results.
+        Throws:
+            - ValueError: If any of the rule names is missing.
+            - LogExistsError: If any of the logs already exists or its rule does not
+              exist. No log is created in that case.
+        """
+        if not all(rule_name for rule_name, _, _ in entries):
+            raise ValueError("A rule name, a time and a result is required.")
+        try:
+            logs = [Log(rule_name, time, result) for rule_name, time, result in entries]
+            session.add_all(logs)
+            session.commit()
+            return logs
+        except IntegrityError as ex:
+            session.rollback()
+            raise LogExistsError("The log already exists or its rule does not exist") from ex
+
     @staticmethod
     def get_last_run(session: Session, rule_name: str) -> Log:
         """ Gets the latest log for a rule
@@ -75,3 +107,68 @@ class Logs():
         """
         query = session.query(Log)
         return query.all()
+
+    @staticmethod
+    def get_runs(session: Session, rule_name: Optional[str] = None,
+                 since: Optional[datetime] = None, until: Optional[datetime] = None,
+                 after: Optional[Tuple[datetime, str]] = None, limit: int = 100) -> List[Log]:
+        """ Gets a page of logs ordered by time and rule name.
+
+        The page starts right after the `after` key, so every page is read through
+        the (rule_name, time) primary key or the (time, rule_name) index no matter
+        how many logs came before it.
+        ---
+        Parameters:
+            - session: The session object.
+            - rule_name: Only return the logs of this rule. None for every rule.
+            - since: Only return the logs at or after this time.
+            - until: Only return the logs before this time.
+            - after: The (time, rule name) key of the last log of the previous page,
+                     or None for the first page.
+            - limit: The maximum number of logs to return.
+        Returns:
+            A list with the logs of the page.
+        """
+        log_rule_name = getattr(Log, 'rule_name')
+        log_time = getattr(Log, 'time')
+        query = session.query(Log)
+        if rule_name is not None:
+            query = query.filter(log_rule_name == rule_name)
+        if since is not None:
+            query = query.filter(log_time >= since)
+        if until is not None:
+            query = query.filter(log_time < until)
+        if after is not None:
+            # A row value comparison, so the database seeks to the key instead of
+            # scanning the index from its start
+            query = query.filter(tuple_(log_time, log_rule_name) > tuple_(*after))
+        return query.order_by(log_time, log_rule_name).limit(limit).all()
+
+    @staticmethod
+    def iter_runs(session: Session, rule_name: Optional[str] = None,
+                  since: Optional[datetime] = None, until: Optional[datetime] = None,
+                  batch_size: int = 500) -> Iterator[Log]:
+        """ Iterates over the logs ordered by time and rule name.
+
+        The rows are fetched `batch_size` at a time, so only one batch of logs is
+        held in memory at once.
+        ---
+        Parameters:
+            - session: The session object.
+            - rule_name: Only return the logs of this rule. None for every rule.
+            - since: Only return the logs at or after this time.
+            - until: Only return the logs before this time.
+            - batch_size: The number of rows fetched at a time.
+        Returns:
+            An iterator over the logs.
+        """
+        log_rule_name = getattr(Log, 'rule_name')
+        log_time = getattr(Log, 'time')
+        query = session.query(Log)
+        if rule_name is not None:
+            query = query.filter(log_rule_name == rule_name)
+        if since is not None:
+            query = query.filter(log_time >= since)
+        if until is not None:
+            query = query.filter(log_time < until)
+        return iter(query.order_by(log_time, log_rule_name).yield_per(batch_size))
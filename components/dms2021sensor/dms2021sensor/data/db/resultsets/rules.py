@@ -1,7 +1,7 @@
 """ Rules class module.
 """
 
-from typing import List
+from typing import Iterator, List
 from dms2021sensor.data.db.results.rule import Rule
 from dms2021sensor.data.db.exc import RuleExistsError, RuleNotExistsError
 from sqlalchemy.exc import IntegrityError # type: ignore
@@ -37,6 +37,7 @@ class Rules():
             session.commit()
             return rule
         except IntegrityError as ex:
+            session.rollback()
             raise RuleExistsError("The rule already exists") from ex
 
     @staticmethod
@@ -101,3 +102,15 @@ class Rules():
         """
         query = session.query(Rule)
         return query.all()
+
+    @staticmethod
+    def iter_all_rules(session: Session, batch_size: int = 500) -> Iterator[Rule]:
+        """ Iterates over all the rules, fetching `batch_size` rows at a time.
+        ---
+        Parameters:
+            - session: The session object.
+            - batch_size: The number of rows fetched at a time.
+        Return:
+            An iterator over the existing rules.
+        """
+        return iter(session.query(Rule).yield_per(batch_size))
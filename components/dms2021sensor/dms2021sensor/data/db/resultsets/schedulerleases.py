@@ -0,0 +1,42 @@
+""" SchedulerLeases class module.
+"""
+
+from datetime import timedelta
+from sqlalchemy.orm.session import Session # type: ignore
+from dms2021core.data.db import LeaseStore
+from dms2021sensor.data.db.results.schedulerlease import SchedulerLease
+
+class SchedulerLeases():
+    """ Class responsible of table-level scheduler lease operations
+    """
+    @staticmethod
+    def acquire(session: Session, name: str, holder: str, ttl: timedelta) -> bool:
+        """ Takes or renews a lease.
+
+        See `LeaseStore.acquire`.
+        ---
+        Note:
+            Any existing transaction will be committed.
+        Parameters:
+            - session: The session object.
+            - name: The lease name.
+            - holder: A string identifying the requestor.
+            - ttl: Time after its last heartbeat a lease is considered abandoned.
+        Returns:
+            True if the requestor holds the lease; False otherwise.
+        """
+        return LeaseStore.acquire(session, SchedulerLease, name, holder, ttl)
+
+    @staticmethod
+    def release(session: Session, name: str, holder: str) -> None:
+        """ Gives a lease up, so another process can take it straight away.
+        ---
+        Note:
+            Any existing transaction will be committed.
+        Parameters:
+            - session: The session object.
+            - name: The lease name.
+            - holder: A string identifying the requestor. Nothing is done if it
+                      does not hold the lease.
+        """
+        LeaseStore.release(session, SchedulerLease, name, holder)
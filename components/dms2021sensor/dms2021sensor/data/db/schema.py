@@ -1,13 +1,20 @@
 """ Schema class module.
 """
 
+import weakref
+from contextlib import contextmanager
+from threading import Lock, local
+from typing import Dict, Iterator, Set
 from sqlalchemy import create_engine, event  # type: ignore
 from sqlalchemy.engine import Engine  # type: ignore
+from sqlalchemy.engine.url import make_url  # type: ignore
+from sqlalchemy.pool import QueuePool  # type: ignore
 from sqlalchemy.ext.declarative import declarative_base  # type: ignore
-from sqlalchemy.orm import sessionmaker  # type: ignore
+from sqlalchemy.orm import scoped_session, sessionmaker  # type: ignore
 from sqlalchemy.orm.session import Session  # type: ignore
+from dms2021core.data.db import SchemaSetup
 from dms2021sensor.data.config import SensorConfiguration
-from dms2021sensor.data.db.results import Rule, Log
+from dms2021sensor.data.db.results import Rule, Log, SchedulerLease, Job
 
 
 # Required for SQLite to enforce FK integrity when supported
@@ -25,6 +32,18 @@ def set_sqlite_pragma(dbapi_connection, connection_record):  # pylint: disable=u
 
 class Schema():
     """ Class responsible of the schema initialization and session generation.
+
+    Sessions are scoped to the current thread: every call to `new_session`
+    made while serving a request or running a scheduled job gets the same
+    session, which is closed (and its connection returned to the pool) by
+    `remove_session` or at the end of a `session_scope` block.
+
+    With a SQLite database file, writes go through a single connection, so
+    they are serialized in the process instead of waiting on the database
+    lock, while reads (`new_read_session`) use a pool of read-only
+    connections that, in WAL mode, do not block on the writes. Writes must
+    then be made in a `write_session` block, which gives that connection
+    back as soon as the block ends.
     """
 
     def __init__(self, config: SensorConfiguration):
@@ -41,17 +60,198 @@ class Schema():
                 'A value for the configuration parameter `db_connection_string` is needed.'
             )
         db_connection_string: str = config.get_db_connection_string() or ''
-        self.__create_engine = create_engine(db_connection_string)
-        self.__session_maker = sessionmaker(bind=self.__create_engine)
+        url = make_url(db_connection_string)
+        self.__sqlite_pragmas: Dict[str, str] = {}
+        read_pool_size: int = 0
+        if url.get_backend_name() == 'sqlite':
+            self.__sqlite_pragmas = config.get_sqlite_pragmas()
+            if url.database not in (None, '', ':memory:'):
+                read_pool_size = config.get_sqlite_read_pool_size()
+        if read_pool_size > 0:
+            pool_timeout: float = config.get_db_pool_options().get('pool_timeout', 30)
+            self.__create_engine = create_engine(
+                db_connection_string, poolclass=QueuePool, pool_size=1, max_overflow=0,
+                pool_timeout=pool_timeout, connect_args={'check_same_thread': False}
+            )
+            self.__read_engine = create_engine(
+                db_connection_string, poolclass=QueuePool, pool_size=read_pool_size,
+                max_overflow=0, pool_timeout=pool_timeout,
+                connect_args={'check_same_thread': False}
+            )
+            SchemaSetup.set_sqlite_pragmas(self.__read_engine, self.__sqlite_pragmas)
+            event.listen(self.__read_engine, 'connect', self.__set_read_only)
+        else:
+            self.__create_engine = SchemaSetup.new_engine(
+                db_connection_string, config.get_db_pool_options()
+            )
+            self.__read_engine = self.__create_engine
+        SchemaSetup.set_sqlite_pragmas(self.__create_engine, self.__sqlite_pragmas)
+        if self.__read_engine is not self.__create_engine:
+            # The written objects stay readable once the writer session is closed
+            self.__session_maker = scoped_session(
+                sessionmaker(bind=self.__create_engine, expire_on_commit=False)
+            )
+            self.__read_session_maker = scoped_session(sessionmaker(bind=self.__read_engine))
+        else:
+            self.__session_maker = scoped_session(sessionmaker(bind=self.__create_engine))
+            self.__read_session_maker = self.__session_maker
+        self.__scope = local()
+        self.__lock: Lock = Lock()
+        self.__open_sessions: Set[int] = set()
+        self.__metrics: Dict[str, int] = {
+            'sessions_opened': 0,
+            'sessions_closed': 0,
+            'sessions_leaked': 0
+        }
 
         Log.map(self.__declarative_base.metadata)
         Rule.map(self.__declarative_base.metadata)
+        SchedulerLease.map(self.__declarative_base.metadata)
+        Job.map(self.__declarative_base.metadata)
         self.__declarative_base.metadata.create_all(self.__create_engine)
+        SchemaSetup.create_missing_indexes(self.__create_engine, self.__declarative_base.metadata)
+
+    @staticmethod
+    def __set_read_only(dbapi_connection, _connection_record):
+        """ Prevents a SQLite connection from writing to the database.
+        ---
+        Parameters:
+            - dbapi_connection: The connection to the database API.
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA query_only = ON;')
+        cursor.close()
 
     def new_session(self) -> Session:
-        """ Constructs a new session.
+        """ Gets the session of the current thread, constructing it if needed.
+        ---
+        Returns:
+            A `Session` object.
+        """
+        return self.__get_scoped_session(self.__session_maker)
+
+    def new_read_session(self) -> Session:
+        """ Gets the read-only session of the current thread, constructing it if needed.
+
+        It must only be used to read; with a SQLite database file its
+        connections cannot write.
+        ---
+        Returns:
+            A `Session` object, which is the same as the one of `new_session` if
+            reads and writes share their connections.
+        """
+        return self.__get_scoped_session(self.__read_session_maker)
+
+    @contextmanager
+    def write_session(self) -> Iterator[Session]:
+        """ Context in which the current thread writes to the database.
+
+        With a single writer connection, the session is closed when leaving the
+        block, even if it failed, so other threads can write while the current
+        one goes on reading.
+        ---
+        Returns:
+            The `Session` object of `new_session`.
+        """
+        session: Session = self.new_session()
+        try:
+            yield session
+        finally:
+            if self.__read_session_maker is not self.__session_maker:
+                session.close()
+
+    def dispose(self) -> None:
+        """ Closes every pooled database connection.
+
+        Must be called in a forked process before using the schema, so the
+        connections opened by the parent process are not shared.
+        """
+        self.__create_engine.dispose()
+        if self.__read_engine is not self.__create_engine:
+            self.__read_engine.dispose()
+
+    def __get_scoped_session(self, session_maker: scoped_session) -> Session:
+        """ Gets the session of the current thread from a registry, constructing it if needed.
+        ---
+        Parameters:
+            - session_maker: The scoped session registry.
+        Returns:
+            A `Session` object.
+        """
+        if not session_maker.registry.has():
+            session: Session = session_maker()
+            with self.__lock:
+                self.__open_sessions.add(id(session))
+                self.__metrics['sessions_opened'] += 1
+            weakref.finalize(session, self.__session_collected, id(session))
+            return session
+        return session_maker()
+
+    def remove_session(self) -> None:
+        """ Closes the sessions of the current thread, if any, releasing their connections.
+        """
+        self.__remove_scoped_session(self.__session_maker)
+        if self.__read_session_maker is not self.__session_maker:
+            self.__remove_scoped_session(self.__read_session_maker)
+
+    def __remove_scoped_session(self, session_maker: scoped_session) -> None:
+        """ Closes the session of the current thread in a registry, if any.
+        ---
+        Parameters:
+            - session_maker: The scoped session registry.
+        """
+        if not session_maker.registry.has():
+            return
+        session_id: int = id(session_maker())
+        session_maker.remove()
+        with self.__lock:
+            if session_id in self.__open_sessions:
+                self.__open_sessions.discard(session_id)
+                self.__metrics['sessions_closed'] += 1
+
+    @contextmanager
+    def session_scope(self) -> Iterator[None]:
+        """ Context in which the current thread uses a single session.
+
+        The session is removed when leaving the outermost scope of the thread.
+        """
+        depth: int = getattr(self.__scope, 'depth', 0)
+        self.__scope.depth = depth + 1
+        try:
+            yield
+        finally:
+            self.__scope.depth = depth
+            if depth == 0:
+                self.remove_session()
+
+    def __session_collected(self, session_id: int) -> None:
+        """ Records a session being garbage collected.
+
+        Sessions still open at this point were never removed by their owner.
+        ---
+        Parameters:
+            - session_id: The identifier of the collected session.
+        """
+        with self.__lock:
+            if session_id in self.__open_sessions:
+                self.__open_sessions.discard(session_id)
+                self.__metrics['sessions_leaked'] += 1
+
+    def get_metrics(self) -> Dict[str, int]:
+        """ Gets the session and connection pool metrics.
         ---
         Returns:
-            A new `Session` object.
+            A dictionary with the number of sessions opened, closed, currently
+            open and never closed, plus the connections checked out of the pools
+            when the pools report them.
         """
-        return self.__session_maker()
+        with self.__lock:
+            metrics: Dict[str, int] = dict(self.__metrics)
+            metrics['sessions_open'] = len(self.__open_sessions)
+        pool = self.__create_engine.pool
+        if hasattr(pool, 'checkedout'):
+            metrics['pool_checked_out'] = pool.checkedout()
+        read_pool = self.__read_engine.pool
+        if self.__read_engine is not self.__create_engine and hasattr(read_pool, 'checkedout'):
+            metrics['read_pool_checked_out'] = read_pool.checkedout()
+        return metrics
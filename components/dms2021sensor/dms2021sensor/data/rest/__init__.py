@@ -1,4 +1,5 @@
 """ REST-related sensor modules
 """
 
+from .rightscache import RightsCache
 from .authservice import AuthService
@@ -1,16 +1,22 @@
 """ AuthService class module.
 """
 
-from urllib.parse import urlencode
-from http.client import HTTPConnection, HTTPResponse, HTTPException
+import json
+from typing import List, Optional
+from urllib.parse import quote
+from http.client import HTTPException
+from dms2021core.data import CapabilityToken, UserRightName
+from dms2021core.data.rest import HTTPConnectionPool, PooledResponse
 from dms2021sensor.data.rest.exc import NotFoundError
+from dms2021sensor.data.rest.rightscache import RightsCache
 
 
 class AuthService():
     """ REST client to connect to the authentication service.
     """
 
-    def __init__(self, host: str, port: int):
+    def __init__(self, host: str, port: int, rights_cache: Optional[RightsCache] = None,
+                 pool: Optional[HTTPConnectionPool] = None, token_key: Optional[str] = None):
         """ Constructor method.
 
         Initializes the client.
@@ -18,25 +24,40 @@ class AuthService():
         Parameters:
             - host: The authentication service host string.
             - port: The authentication service port number.
+            - rights_cache: The cache of right checks to use, or None to always
+                            ask the authentication service.
+            - pool: The connection pool to use, or None to use a pool of its own.
+            - token_key: The key shared with the authentication service to verify
+                         capability tokens, or None to ignore them.
         """
         self.__host: str = host
         self.__port: int = port
+        self.__rights_cache: Optional[RightsCache] = rights_cache
+        self.__pool: HTTPConnectionPool = pool or HTTPConnectionPool()
+        self.__token_key: Optional[str] = token_key
 
-    def __get_connection(self) -> HTTPConnection:
-        """ Creates a new connection to the authentication server.
+    def __request(self, method: str, url: str, body: Optional[str] = None,
+                  headers: Optional[dict] = None) -> PooledResponse:
+        """ Sends a request to the authentication server through the connection pool.
         ---
+        Parameters:
+            - method: The HTTP method.
+            - url: The request path.
+            - body: The request body, if any.
+            - headers: A dictionary with the request headers, if any.
         Returns:
-            The connection object.
+            The fully read response.
         """
-        return HTTPConnection(self.__host, self.__port)
+        return self.__pool.request(self.__host, self.__port, method, url, body, headers)
 
-    def has_right(self, username: str, right: str) -> bool:
+    def has_right(self, username: str, right: str, token: Optional[str] = None) -> bool:
         """ Determines whether a given user from the authentication server
             has a certain right or not.
         ---
         Parameters:
             - username: The user name string.
             - right: The right name.
+            - token: A capability token of the user, if any.
         Returns:
             True if the user has the given right
         Throws:
@@ -44,17 +65,83 @@ class AuthService():
               exist, or the right does not exist.
             - HTTPException: On an unhandled 500 error.
         """
-        form: str = urlencode({'username': username, 'right': right})
-        headers: dict = {
-            'Content-type': 'application/x-www-form-urlencoded'
-        }
-        connection: HTTPConnection = self.__get_connection()
-        connection.request('GET', '/users/'+str(username)+'/rights/'+str(right), form, headers)
-        response: HTTPResponse = connection.getresponse()
-        if response.status == 200:
+        return self.has_rights(username, [right], token)
+
+    def has_rights(self, username: str, rights: List[str], token: Optional[str] = None) -> bool:
+        """ Determines whether a given user from the authentication server
+            has all of several rights or not.
+
+        A valid capability token of the user carrying all the rights is trusted
+        without contacting the authentication service. Otherwise, as the rights
+        may have been granted after the token was issued, every right of the
+        user is requested at once, and all of them are cached.
+        ---
+        Parameters:
+            - username: The user name string.
+            - rights: A list of right names.
+            - token: A capability token of the user, if any.
+        Returns:
+            True if the user has all of the given rights
+        Throws:
+            - NotFoundError: if the user lacks any of the rights, the user does not
+              exist, or a right does not exist.
+            - HTTPException: On an unhandled 500 error.
+        """
+        token_rights: Optional[List[str]] = self.__verify_token(username, token)
+        if token_rights is not None and all(right in token_rights for right in rights):
             return True
-        if response.status == 404:
+        if self.__rights_cache is not None:
+            cached: List[Optional[bool]] = [
+                self.__rights_cache.get(username, right) for right in rights
+            ]
+            if None not in cached:
+                if not all(cached):
+                    raise NotFoundError()
+                return True
+        user_rights: List[str] = self.get_rights(username)
+        if self.__rights_cache is not None:
+            for right_name in UserRightName.__members__:
+                self.__rights_cache.put(username, right_name, right_name in user_rights)
+        if not all(right in user_rights for right in rights):
             raise NotFoundError()
+        return True
+
+    def __verify_token(self, username: str, token: Optional[str]) -> Optional[List[str]]:
+        """ Gets the rights carried by a capability token.
+        ---
+        Parameters:
+            - username: The user name the token must belong to.
+            - token: The token string, if any.
+        Returns:
+            The list of rights in the token, or None if there is no token, no key
+            to verify it, or the token is not valid for the user.
+        """
+        if not token or not self.__token_key:
+            return None
+        try:
+            token_username, token_rights = CapabilityToken.verify(self.__token_key, token)
+        except ValueError:
+            return None
+        if token_username != username:
+            return None
+        return token_rights
+
+    def get_rights(self, username: str) -> List[str]:
+        """ Gets every right of a given user from the authentication server.
+        ---
+        Parameters:
+            - username: The user name string.
+        Returns:
+            A list with the names of the rights of the user. Empty if the user
+            does not exist.
+        Throws:
+            - HTTPException: On an unhandled 500 error.
+        """
+        response: PooledResponse = self.__request(
+            'GET', '/users/' + quote(str(username)) + '/rights'
+        )
+        if response.status == 200:
+            return json.loads(response.read())
         if response.status == 500:
             raise HTTPException('Server error')
-        return False
+        return []
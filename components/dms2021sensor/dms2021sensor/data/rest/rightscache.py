@@ -0,0 +1,100 @@
+""" RightsCache class module.
+"""
+
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Optional, Tuple
+
+
+class RightsCache():
+    """ In-process LRU cache of the rights checked against the authentication service.
+
+    Granted and denied rights expire after different times, so a revoked right
+    stops being accepted soon while repeated denials do not keep hitting the
+    authentication service.
+    """
+
+    def __init__(self, positive_ttl: float, negative_ttl: float, max_entries: int):
+        """ Constructor method.
+
+        Initializes the cache.
+        ---
+        Parameters:
+            - positive_ttl: Seconds a granted right is cached.
+            - negative_ttl: Seconds a denied right is cached.
+            - max_entries: Maximum number of cached (username, right) pairs.
+        """
+        self.__positive_ttl: float = max(0.0, positive_ttl)
+        self.__negative_ttl: float = max(0.0, negative_ttl)
+        self.__max_entries: int = max(1, max_entries)
+        self.__entries: 'OrderedDict[Tuple[str, str], Tuple[bool, float]]' = OrderedDict()
+        self.__lock: Lock = Lock()
+        self.__metrics: Dict[str, int] = {
+            'hits': 0,
+            'misses': 0,
+            'expired': 0,
+            'evictions': 0
+        }
+
+    def get(self, username: str, right: str) -> Optional[bool]:
+        """ Gets a cached right check.
+        ---
+        Parameters:
+            - username: The user name string.
+            - right: The right name.
+        Returns:
+            True if the right was granted, False if it was denied, or None if
+            the check is not cached or has expired.
+        """
+        key: Tuple[str, str] = (username, right)
+        with self.__lock:
+            entry: Optional[Tuple[bool, float]] = self.__entries.get(key)
+            if entry is None:
+                self.__metrics['misses'] += 1
+                return None
+            if entry[1] <= time.monotonic():
+                del self.__entries[key]
+                self.__metrics['expired'] += 1
+                self.__metrics['misses'] += 1
+                return None
+            self.__entries.move_to_end(key)
+            self.__metrics['hits'] += 1
+            return entry[0]
+
+    def put(self, username: str, right: str, granted: bool) -> None:
+        """ Caches the result of a right check.
+        ---
+        Parameters:
+            - username: The user name string.
+            - right: The right name.
+            - granted: Whether the right was granted or not.
+        """
+        ttl: float = self.__positive_ttl if granted else self.__negative_ttl
+        if ttl <= 0:
+            return
+        key: Tuple[str, str] = (username, right)
+        with self.__lock:
+            self.__entries[key] = (granted, time.monotonic() + ttl)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__max_entries:
+                self.__entries.popitem(last=False)
+                self.__metrics['evictions'] += 1
+
+    def clear(self) -> None:
+        """ Removes every cached check.
+        """
+        with self.__lock:
+            self.__entries.clear()
+
+    def get_metrics(self) -> Dict[str, int]:
+        """ Gets the cache metrics.
+        ---
+        Returns:
+            A dictionary with the hits, misses, expired and evicted entries and
+            the current size.
+        """
+        with self.__lock:
+            metrics: Dict[str, int] = dict(self.__metrics)
+            metrics['size'] = len(self.__entries)
+        return metrics
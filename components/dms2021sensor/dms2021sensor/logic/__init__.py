@@ -3,3 +3,4 @@
 
 from .logmanager import LogManager
 from .rulemanager import RuleManager
+from .jobmanager import JobManager
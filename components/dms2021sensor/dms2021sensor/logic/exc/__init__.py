@@ -0,0 +1,4 @@
+""" Sensor logic exceptions.
+"""
+
+from .joblimiterror import JobLimitError
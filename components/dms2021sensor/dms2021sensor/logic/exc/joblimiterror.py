@@ -0,0 +1,6 @@
+""" JobLimitError class module.
+"""
+
+class JobLimitError(Exception):
+    """ Error raised when a user has too many unfinished jobs to request another one.
+    """
@@ -0,0 +1,191 @@
+""" JobManager class module.
+"""
+
+import logging
+import time
+import uuid
+from concurrent.futures import Future
+from datetime import datetime, timedelta
+from functools import partial
+from threading import Event, Lock
+from typing import Dict, Optional
+from dms2021sensor.data.config import SensorConfiguration
+from dms2021sensor.data.db import Schema
+from dms2021sensor.data.db.exc import JobNotExistsError, RuleNotExistsError
+from dms2021sensor.data.db.results import Job
+from dms2021sensor.data.db.resultsets import Jobs
+from dms2021sensor.logic.managerbase import ManagerBase
+from dms2021sensor.logic.rulemanager import RuleManager
+from dms2021sensor.logic.exc import JobLimitError
+from dms2021sensor.logic.rulerunners.ruleexecutor import RuleExecutor
+
+class JobManager(ManagerBase):
+    """ Class responsible of the rule run job logic.
+
+    Jobs are stored in the database, so any service process can report them,
+    and are run by the rule executor of the process that accepted them.
+    """
+
+    POLL_INTERVAL: float = 0.25
+
+    def __init__(self, config: SensorConfiguration, schema: Schema, rule_manager: RuleManager):
+        """ Constructor method.
+
+        Initializes the manager.
+        ---
+        Parameters:
+            - config: A SensorConfiguration instance with the manager configurable parameters.
+            - schema: The database schema instance to use.
+            - rule_manager: The rule manager used to check the rules exist.
+        """
+        super().__init__(config, schema)
+        self.__rule_manager: RuleManager = rule_manager
+        self.__executor: Optional[RuleExecutor] = None
+        self.__lock: Lock = Lock()
+        self.__pending: Dict[str, Event] = {}
+        self.__metrics: Dict[str, float] = {
+            'submitted': 0,
+            'rejected': 0,
+            'succeeded': 0,
+            'failed': 0,
+            'purged': 0,
+            'abandoned': 0
+        }
+
+    def set_executor(self, executor: Optional[RuleExecutor]) -> None:
+        """ Sets the executor the jobs are run by.
+        ---
+        Parameters:
+            - executor: A RuleExecutor, or None to reject new jobs.
+        """
+        self.__executor = executor
+
+    def submit(self, rule_name: str, username: str) -> Job:
+        """ Requests a run of a rule, to be executed in the background.
+        ---
+        Parameters:
+            - rule_name: The name of the rule to run.
+            - username: The name of the user requesting the run.
+        Returns:
+            The queued Job.
+        Throws:
+            - ValueError if the rule name is missing.
+            - RuleNotExistsError if the rule does not exist.
+            - JobLimitError if the user has too many unfinished jobs.
+            - RuntimeError if there is no executor to run the job.
+        """
+        if not rule_name:
+            raise ValueError("A non-empty rule name is needed.")
+        if self.__executor is None:
+            raise RuntimeError("There is no executor to run the jobs.")
+        if not self.__rule_manager.rule_exists(rule_name):
+            raise RuleNotExistsError
+        config: SensorConfiguration = self.get_configuration()
+        # Jobs older than the retention are dropped, and no longer count as unfinished
+        since: datetime = datetime.now() - timedelta(seconds=config.get_jobs_retention())
+        read_session = self.get_schema().new_read_session()
+        job_id: str = uuid.uuid4().hex
+        # Only serializes the requests of this process; others may submit at the same time
+        with self.__lock:
+            unfinished: int = Jobs.count_unfinished(read_session, username, since)
+            # End the read transaction, so the next count sees the jobs created now
+            read_session.rollback()
+            if unfinished >= config.get_jobs_max_per_user():
+                self.__metrics['rejected'] += 1
+                raise JobLimitError("Too many unfinished jobs.")
+            with self.get_schema().write_session() as session:
+                self.__metrics['purged'] += Jobs.delete_created_before(session, since)
+                # Failed after the purge, so they can still be polled until the next one.
+                # The jobs still run by this process are left alone
+                self.__metrics['abandoned'] += Jobs.fail_unfinished_before(
+                    session, since, list(self.__pending)
+                )
+                job: Job = Jobs.create(session, job_id, rule_name, username)
+            self.__pending[job_id] = Event()
+            self.__metrics['submitted'] += 1
+        future: Future = self.__executor.run(
+            rule_name, partial(self.__store_status, job_id, Job.RUNNING)
+        )
+        future.add_done_callback(partial(self.__finish, job_id))
+        return job
+
+    def get_job(self, job_id: str, username: str, wait: float = 0.0) -> Job:
+        """ Gets a job, optionally waiting for it to finish.
+        ---
+        Parameters:
+            - job_id: The job identifier.
+            - username: The name of the user requesting the job.
+            - wait: Maximum number of seconds to wait for the job to finish. It is
+                    capped by the configured maximum.
+        Returns:
+            The Job, finished or not.
+        Throws:
+            - JobNotExistsError if the job does not exist or belongs to another user.
+        """
+        wait = min(max(0.0, wait), self.get_configuration().get_jobs_max_wait())
+        deadline: float = time.monotonic() + wait
+        session = self.get_schema().new_read_session()
+        job: Job = Jobs.get_job(session, job_id)
+        if job.username != username:
+            raise JobNotExistsError("The job does not exist.")
+        while not job.is_finished():
+            remaining: float = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            with self.__lock:
+                pending: Optional[Event] = self.__pending.get(job_id)
+            if pending is not None:
+                pending.wait(remaining)
+            else:
+                # Run by another process; only the database tells when it finishes
+                time.sleep(min(self.POLL_INTERVAL, remaining))
+            # End the transaction, so the job is read again as it is now
+            session.rollback()
+            job = Jobs.get_job(session, job_id)
+        return job
+
+    def __store_status(self, job_id: str, status: str, result: Optional[str] = None) -> None:
+        """ Stores the status of a job.
+        ---
+        Parameters:
+            - job_id: The job identifier.
+            - status: The new status.
+            - result: The result of the run, or the reason it failed, if finished.
+        """
+        with self.get_schema().session_scope(), self.get_schema().write_session() as session:
+            Jobs.update_status(session, job_id, status, result)
+
+    def __finish(self, job_id: str, future: Future) -> None:
+        """ Records the end of a job and wakes up the requests waiting for it.
+        ---
+        Parameters:
+            - job_id: The job identifier.
+            - future: The finished future of the run.
+        """
+        exception = future.exception()
+        try:
+            if exception is None:
+                self.__store_status(job_id, Job.SUCCEEDED, str(future.result()))
+            else:
+                self.__store_status(job_id, Job.FAILED, str(exception) or type(exception).__name__)
+        except Exception:  # pylint: disable=broad-except
+            logging.getLogger(__name__).exception(
+                'The result of job %s could not be stored', job_id
+            )
+        with self.__lock:
+            self.__metrics['failed' if exception is not None else 'succeeded'] += 1
+            pending: Optional[Event] = self.__pending.pop(job_id, None)
+        if pending is not None:
+            pending.set()
+
+    def get_metrics(self) -> Dict[str, float]:
+        """ Gets the job metrics.
+        ---
+        Returns:
+            A dictionary with the number of jobs submitted, rejected by the per-user
+            limit, succeeded, failed, purged and abandoned, and the ones still pending.
+        """
+        with self.__lock:
+            metrics: Dict[str, float] = dict(self.__metrics)
+            metrics['pending'] = len(self.__pending)
+        return metrics
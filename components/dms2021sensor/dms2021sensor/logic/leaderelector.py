@@ -0,0 +1,159 @@
+""" LeaderElector class module.
+"""
+
+import logging
+import os
+import socket
+import time
+import uuid
+from datetime import timedelta
+from threading import Thread, Event, Lock
+from typing import Callable, Dict, List
+from dms2021sensor.data.db import Schema
+from dms2021sensor.data.db.resultsets import SchedulerLeases
+
+class LeaderElector(Thread):
+    """ Background thread electing the single process that schedules the rules.
+
+    Every process competes for the same lease in the database. The holder
+    renews it every `heartbeat_interval` seconds; if it dies, its lease is
+    abandoned and taken by another process once `lease_ttl` seconds have
+    passed since its last heartbeat. A process that fails to renew the lease
+    stops considering itself the leader before the TTL expires, so two
+    processes never schedule at once.
+    """
+
+    LEASE_NAME: str = 'scheduler'
+
+    def __init__(self, schema: Schema, lease_ttl: float = 15.0, heartbeat_interval: float = 5.0):
+        """ Constructor method.
+
+        Initializes the elector. The lease is not requested until the thread is started.
+        ---
+        Parameters:
+            - schema: The database schema instance to use.
+            - lease_ttl: Seconds after its last heartbeat a lease is considered abandoned.
+            - heartbeat_interval: Seconds between two renewals of the lease. It should
+                                  be well below the TTL.
+        """
+        Thread.__init__(self, name='LeaderElector', daemon=True)
+        self.__schema: Schema = schema
+        self.__lease_ttl: float = max(1.0, lease_ttl)
+        self.__heartbeat_interval: float = min(max(0.1, heartbeat_interval),
+                                               self.__lease_ttl / 2)
+        self.__holder: str = socket.gethostname() + ':' + str(os.getpid()) + ':' \
+            + uuid.uuid4().hex[:8]
+        self.__stopping: Event = Event()
+        self.__lock: Lock = Lock()
+        self.__renewed_at: float = 0.0
+        self.__leader: bool = False
+        self.__listeners: List[Callable[[], None]] = []
+        self.__metrics: Dict[str, float] = {
+            'heartbeats': 0,
+            'failed_heartbeats': 0,
+            'acquisitions': 0,
+            'losses': 0
+        }
+
+    def add_listener(self, listener: Callable[[], None]) -> None:
+        """ Registers a callable invoked whenever this process gains or loses the leadership.
+        ---
+        Parameters:
+            - listener: A callable without arguments.
+        """
+        self.__listeners.append(listener)
+
+    def is_leader(self) -> bool:
+        """ Gets whether this process holds the lease or not.
+        ---
+        Returns:
+            True if the lease was renewed by this process within the TTL; False otherwise.
+        """
+        with self.__lock:
+            return self.__leader and time.monotonic() - self.__renewed_at < self.__lease_ttl
+
+    def run(self):
+        """ Runs the thread
+        """
+        while not self.__stopping.is_set():
+            self.heartbeat()
+            self.__stopping.wait(self.__heartbeat_interval)
+
+    def stop(self) -> None:
+        """ Stops the thread and releases the lease, if held, so another process
+        can take it over without waiting for the TTL.
+        """
+        self.__stopping.set()
+        if self.is_alive():
+            self.join()
+        with self.__lock:
+            was_leader: bool = self.__leader
+            self.__leader = False
+        if not was_leader:
+            return
+        try:
+            with self.__schema.session_scope():
+                SchedulerLeases.release(self.__schema.new_session(), self.LEASE_NAME,
+                                        self.__holder)
+        except Exception:  # pylint: disable=broad-except
+            logging.getLogger(__name__).exception('The scheduler lease could not be released')
+        self.__notify_change()
+
+    def heartbeat(self) -> bool:
+        """ Takes or renews the lease.
+        ---
+        Returns:
+            True if this process is the leader afterwards; False otherwise.
+        """
+        started: float = time.monotonic()
+        acquired: bool = False
+        failed: bool = False
+        try:
+            with self.__schema.session_scope():
+                acquired = SchedulerLeases.acquire(
+                    self.__schema.new_session(), self.LEASE_NAME, self.__holder,
+                    timedelta(seconds=self.__lease_ttl)
+                )
+        except Exception:  # pylint: disable=broad-except
+            failed = True
+            logging.getLogger(__name__).exception('The scheduler lease could not be renewed')
+        with self.__lock:
+            was_leader: bool = self.__leader and started - self.__renewed_at < self.__lease_ttl
+            self.__metrics['heartbeats'] += 1
+            self.__metrics['failed_heartbeats'] += 1 if failed else 0
+            if acquired:
+                self.__renewed_at = started
+                self.__leader = True
+            elif not failed or not was_leader:
+                # A failed renewal keeps the lease until the TTL, it may still be ours
+                self.__leader = False
+            is_leader: bool = self.__leader and started - self.__renewed_at < self.__lease_ttl
+            if is_leader and not was_leader:
+                self.__metrics['acquisitions'] += 1
+            elif was_leader and not is_leader:
+                self.__metrics['losses'] += 1
+        if is_leader != was_leader:
+            logging.getLogger(__name__).info(
+                'Scheduler leadership %s by %s', 'taken' if is_leader else 'lost', self.__holder
+            )
+            self.__notify_change()
+        return is_leader
+
+    def __notify_change(self) -> None:
+        """ Invokes every leadership change listener.
+        """
+        for listener in self.__listeners:
+            listener()
+
+    def get_metrics(self) -> Dict[str, float]:
+        """ Gets the elector metrics.
+        ---
+        Returns:
+            A dictionary with whether this process is the leader and the number
+            of heartbeats, leadership acquisitions and losses.
+        """
+        leader: bool = self.is_leader()
+        with self.__lock:
+            metrics: Dict[str, float] = dict(self.__metrics)
+        metrics['leader'] = 1 if leader else 0
+        return metrics
@@ -1,32 +1,61 @@
 """ LogManager class module.
 """
 
-from typing import List
+from typing import Iterator, List, Optional, Tuple
 from datetime import datetime
+from dms2021sensor.data.config import SensorConfiguration
+from dms2021sensor.data.db import Schema
 from dms2021sensor.data.db.resultsets import Logs
 from dms2021sensor.data.db.results import Log
 from dms2021sensor.logic.managerbase import ManagerBase
+from dms2021sensor.logic.logwriter import LogWriter
 
 
 class LogManager(ManagerBase):
     """ Class responsible of the log management logic.
     """
+    def __init__(self, config: SensorConfiguration, schema: Schema):
+        """ Constructor method.
+
+        Initializes the manager.
+        ---
+        Parameters:
+            - config: A SensorConfiguration instance with the manager configurable parameters.
+            - schema: The database schema instance to use.
+        """
+        super().__init__(config, schema)
+        self.__writer: Optional[LogWriter] = None
+
+    def set_writer(self, writer: Optional[LogWriter]) -> None:
+        """ Sets the writer the new logs are queued to.
+        ---
+        Parameters:
+            - writer: A running LogWriter, or None to store every log as it is created.
+        """
+        self.__writer = writer
+
     def create_log(self, rule_name: str, time: datetime, result: str) -> None:
         """ Creates a new log
         ---
+        Note:
+            If a writer is set the log is only queued, and it is stored in the
+            background along with other logs.
         Parameters:
             - rule_name: The rule name
             - time: A datetime.
             - result: A string with the result.
         Throws:
             - ValueError if any of the parameters is missing.
-            - RuleNotExistsError if the rule does not exist.
-            - LogExistsError if a log already exists.
+            - RuleNotExistsError if the rule does not exist and no writer is set.
+            - LogExistsError if a log already exists and no writer is set.
         """
         if not rule_name:
             raise ValueError("A rule name is required.")
-        session = self.get_schema().new_session()
-        Logs.create(session, rule_name, time, result)
+        if self.__writer is not None:
+            self.__writer.enqueue(rule_name, time, result)
+            return
+        with self.get_schema().write_session() as session:
+            Logs.create(session, rule_name, time, result)
 
     def get_last_run(self, rule_name: str) -> Log:
         """ Gets the last log for a rule.
@@ -42,7 +71,7 @@ class LogManager(ManagerBase):
         """
         if not rule_name:
             raise ValueError("A rule name is required.")
-        session = self.get_schema().new_session()
+        session = self.get_schema().new_read_session()
         return Logs.get_last_run(session, rule_name)
 
     def get_all_runs(self) -> List[Log]:
@@ -51,5 +80,43 @@ class LogManager(ManagerBase):
         Returns:
             A list with all of the logs that exists on the system.
         """
-        session = self.get_schema().new_session()
+        session = self.get_schema().new_read_session()
         return Logs.get_all_runs(session)
+
+    def get_runs(self, rule_name: Optional[str] = None, since: Optional[datetime] = None,
+                 until: Optional[datetime] = None, after: Optional[Tuple[datetime, str]] = None,
+                 limit: int = 100) -> Tuple[List[Log], bool]:
+        """ Gets a page of logs ordered by time and rule name.
+        ---
+        Parameters:
+            - rule_name: Only return the logs of this rule. None for every rule.
+            - since: Only return the logs at or after this time.
+            - until: Only return the logs before this time.
+            - after: The (time, rule name) key of the last log of the previous page,
+                     or None for the first page.
+            - limit: The maximum number of logs to return.
+        Returns:
+            A tuple with the list of logs of the page and whether there are more
+            logs after it.
+        Throws:
+            - ValueError if the limit is not positive.
+        """
+        if limit <= 0:
+            raise ValueError("The limit must be a positive number.")
+        session = self.get_schema().new_read_session()
+        logs: List[Log] = Logs.get_runs(session, rule_name, since, until, after, limit + 1)
+        return (logs[:limit], len(logs) > limit)
+
+    def iter_runs(self, rule_name: Optional[str] = None, since: Optional[datetime] = None,
+                  until: Optional[datetime] = None) -> Iterator[Log]:
+        """ Iterates over the logs ordered by time and rule name, fetching them in batches.
+        ---
+        Parameters:
+            - rule_name: Only return the logs of this rule. None for every rule.
+            - since: Only return the logs at or after this time.
+            - until: Only return the logs before this time.
+        Returns:
+            An iterator over the logs.
+        """
+        session = self.get_schema().new_read_session()
+        return Logs.iter_runs(session, rule_name, since, until)
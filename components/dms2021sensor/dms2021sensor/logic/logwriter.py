@@ -0,0 +1,136 @@
+""" LogWriter class module.
+"""
+
+import logging
+import time
+from datetime import datetime
+from queue import Queue, Empty
+from threading import Thread, Lock
+from typing import Dict, List, Optional, Tuple
+from dms2021sensor.data.db import Schema
+from dms2021sensor.data.db.resultsets import Logs
+from dms2021sensor.data.db.exc import LogExistsError
+
+class LogWriter(Thread):
+    """ Background thread storing the rule logs in batches.
+
+    Logs are queued and committed together once `batch_size` logs are pending
+    or `flush_interval` seconds have passed since the first pending one, so the
+    cost of a commit is shared by the whole batch.
+    """
+
+    def __init__(self, schema: Schema, batch_size: int = 100, flush_interval: float = 0.2):
+        """ Constructor method.
+
+        Initializes the writer. Nothing is written until the thread is started.
+        ---
+        Parameters:
+            - schema: The database schema instance to use.
+            - batch_size: Maximum number of logs committed at once.
+            - flush_interval: Maximum number of seconds a log waits in the queue.
+        """
+        Thread.__init__(self, name='LogWriter', daemon=True)
+        self.__schema: Schema = schema
+        self.__batch_size: int = max(1, batch_size)
+        self.__flush_interval: float = max(0.0, flush_interval)
+        self.__queue: Queue = Queue()
+        self.__lock: Lock = Lock()
+        self.__metrics: Dict[str, float] = {
+            'batches': 0,
+            'rows_written': 0,
+            'rows_failed': 0,
+            'last_batch_size': 0,
+            'max_batch_size': 0,
+            'last_commit_seconds': 0.0,
+            'max_commit_seconds': 0.0,
+            'total_commit_seconds': 0.0
+        }
+
+    def enqueue(self, rule_name: str, log_time: datetime, result: str) -> None:
+        """ Queues a log to be written.
+        ---
+        Parameters:
+            - rule_name: The rule name.
+            - log_time: The datetime of the log.
+            - result: A string with the result.
+        """
+        self.__queue.put((rule_name, log_time, result))
+
+    def stop(self) -> None:
+        """ Writes every pending log and stops the thread.
+        """
+        if self.is_alive():
+            self.__queue.put(None)
+            self.join()
+
+    def run(self):
+        """ Runs the thread
+        """
+        stopping: bool = False
+        while not stopping:
+            first: Optional[Tuple[str, datetime, str]] = self.__queue.get()
+            if first is None:
+                break
+            batch: List[Tuple[str, datetime, str]] = [first]
+            deadline: float = time.monotonic() + self.__flush_interval
+            while len(batch) < self.__batch_size:
+                try:
+                    entry = self.__queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except Empty:
+                    break
+                if entry is None:
+                    stopping = True
+                    break
+                batch.append(entry)
+            self.__write(batch)
+
+    def __write(self, batch: List[Tuple[str, datetime, str]]) -> None:
+        """ Commits a batch of logs.
+
+        If the batch is rejected, its logs are retried one by one so a single
+        wrong log does not discard the others.
+        ---
+        Parameters:
+            - batch: A list of (rule name, time, result) tuples.
+        """
+        session = self.__schema.new_session()
+        started: float = time.monotonic()
+        written: int = 0
+        try:
+            Logs.create_many(session, batch)
+            written = len(batch)
+        except LogExistsError:
+            for entry in batch:
+                try:
+                    Logs.create_many(session, [entry])
+                    written += 1
+                except LogExistsError:
+                    logging.getLogger(__name__).warning(
+                        'Log of rule %s could not be stored', entry[0]
+                    )
+        except Exception:  # pylint: disable=broad-except
+            logging.getLogger(__name__).exception('%d logs could not be stored', len(batch))
+        finally:
+            self.__schema.remove_session()
+        elapsed: float = time.monotonic() - started
+        with self.__lock:
+            self.__metrics['batches'] += 1
+            self.__metrics['rows_written'] += written
+            self.__metrics['rows_failed'] += len(batch) - written
+            self.__metrics['last_batch_size'] = len(batch)
+            self.__metrics['max_batch_size'] = max(self.__metrics['max_batch_size'], len(batch))
+            self.__metrics['last_commit_seconds'] = elapsed
+            self.__metrics['max_commit_seconds'] = max(self.__metrics['max_commit_seconds'],
+                                                       elapsed)
+            self.__metrics['total_commit_seconds'] += elapsed
+
+    def get_metrics(self) -> Dict[str, float]:
+        """ Gets the writer metrics.
+        ---
+        Returns:
+            A dictionary with the queue depth, the batch sizes and the commit latency.
+        """
+        with self.__lock:
+            metrics: Dict[str, float] = dict(self.__metrics)
+        metrics['queue_depth'] = self.__queue.qsize()
+        return metrics
@@ -1,18 +1,54 @@
 """ RuleManager class module.
 """
 
-from typing import List
+from concurrent.futures import Future
+from threading import get_ident
+from typing import Iterator, List, Callable, Dict, Optional, Type, Union
 from datetime import datetime
+from dms2021sensor.data.config import SensorConfiguration
+from dms2021sensor.data.db import Schema
 from dms2021sensor.data.db.resultsets import Rules
 from dms2021sensor.data.db.results import Rule
 from dms2021sensor.logic.managerbase import ManagerBase
-from dms2021sensor.logic import LogManager
+from dms2021sensor.logic.logmanager import LogManager
 from dms2021sensor.logic.rulerunners import CommandRuleRunner, FileRuleRunner, CPURuleRunner
+from dms2021sensor.logic.rulerunners.baserulerunner import BaseRuleRunner, AsyncRuleRunner
+from dms2021sensor.logic.rulerunners.runnerclient import RunnerClient
 from dms2021sensor.data.db.exc import RuleNotExistsError
 
 class RuleManager(ManagerBase):
     """ Class responsible of the rule management logic.
     """
+    def __init__(self, config: SensorConfiguration, schema: Schema):
+        """ Constructor method.
+
+        Initializes the manager.
+        ---
+        Parameters:
+            - config: A SensorConfiguration instance with the manager configurable parameters.
+            - schema: The database schema instance to use.
+        """
+        super().__init__(config, schema)
+        self.__change_listeners: List[Callable[[], None]] = []
+        self.__runners: Dict[str, Union[Type[BaseRuleRunner], AsyncRuleRunner]] = {
+            "command": CommandRuleRunner, "file": FileRuleRunner, "cpu": CPURuleRunner
+        }
+        self.__remote_runner: Optional[RunnerClient] = None
+
+    def add_change_listener(self, listener: Callable[[], None]) -> None:
+        """ Registers a function to be called whenever a rule is created or deleted.
+        ---
+        Parameters:
+            - listener: A callable without parameters.
+        """
+        self.__change_listeners.append(listener)
+
+    def __notify_change(self) -> None:
+        """ Calls every registered change listener.
+        """
+        for listener in self.__change_listeners:
+            listener()
+
     def create_rule(self, rule_name: str, rule_type: str, data: str, frequency: int) -> None:
         """ Creates a new rule
         ---
@@ -31,8 +67,9 @@ class RuleManager(ManagerBase):
             raise ValueError("The rule type must be exactly \"file\", \"command\" or \"rule\".")
         if not data:
             raise ValueError("An argument is required")
-        session = self.get_schema().new_session()
-        Rules.create(session, rule_name, rule_type, data, frequency)
+        with self.get_schema().write_session() as session:
+            Rules.create(session, rule_name, rule_type, data, frequency)
+        self.__notify_change()
 
     def rule_exists(self, rule_name: str) -> bool:
         """ Checks if a rule exists
@@ -46,7 +83,7 @@ class RuleManager(ManagerBase):
         """
         if not rule_name:
             raise ValueError("The rule name must not be empty.")
-        session = self.get_schema().new_session
+        session = self.get_schema().new_read_session()
         return Rules.rule_exists(session, rule_name)
 
     def get_rule(self, rule_name: str) -> Rule:
@@ -62,7 +99,7 @@ class RuleManager(ManagerBase):
         """
         if not rule_name:
             raise ValueError("The rule name must not be empty.")
-        session = self.get_schema().new_session()
+        session = self.get_schema().new_read_session()
         return Rules.get_rule(session, rule_name)
 
     def delete_rule(self, rule_name: str) -> bool:
@@ -78,8 +115,10 @@ class RuleManager(ManagerBase):
         """
         if not rule_name:
             raise ValueError("The rule name must not be empty.")
-        session = self.get_schema().new_session()
-        return Rules.delete_rule(session, rule_name)
+        with self.get_schema().write_session() as session:
+            deleted: bool = Rules.delete_rule(session, rule_name)
+        self.__notify_change()
+        return deleted
 
     def get_all_rules(self) -> List[Rule]:
         """ Gets all rules
@@ -87,9 +126,36 @@ class RuleManager(ManagerBase):
         Returns:
             A list with all the rules.
         """
-        session = self.get_schema().new_session()
+        session = self.get_schema().new_read_session()
         return Rules.get_all_rules(session)
 
+    def iter_all_rules(self) -> Iterator[Rule]:
+        """ Iterates over all rules, fetching them in batches.
+        ---
+        Returns:
+            An iterator over the rules.
+        """
+        session = self.get_schema().new_read_session()
+        return Rules.iter_all_rules(session)
+
+    def set_runner(self, rule_type: str, runner: Union[Type[BaseRuleRunner], AsyncRuleRunner]):
+        """ Sets the runner used for a type of rule.
+        ---
+        Parameters:
+            - rule_type: The rule type.
+            - runner: The runner class, or an AsyncRuleRunner instance to start
+                      the rules without blocking the caller.
+        """
+        self.__runners[rule_type] = runner
+
+    def set_remote_runner(self, remote_runner: Optional[RunnerClient]) -> None:
+        """ Sets the client of the standalone runner process that runs the rules on demand.
+        ---
+        Parameters:
+            - remote_runner: A RunnerClient, or None to run the rules in this process.
+        """
+        self.__remote_runner = remote_runner
+
     def run_rule(self, rule_name: str, log_manager: LogManager) -> str:
         """ Runs a rule and logs its results
         ---
@@ -102,12 +168,64 @@ class RuleManager(ManagerBase):
             - ValueError if a parameter is missing.
             - RuleNotExistsError if the rule does not exist.
             - LogExistsError if a log already exists
+            - RuleRunError if the rule is run by a runner process that is not available.
+        """
+        return self.start_rule(rule_name, log_manager).result()
+
+    def start_rule(self, rule_name: str, log_manager: LogManager) -> Future:
+        """ Starts running a rule, logging its results once it finishes.
+
+        Rules whose runner supports it are run in the background; the rest are
+        run before returning. If a remote runner is set, the rule is run and
+        logged by the runner process before returning.
+        ---
+        Parameters:
+            - rule_name: A string with the rule name.
+            - log_manager: A instance of the LogManager
+        Returns:
+            A future that will hold the string with the result of the action,
+            or the exception raised while running or logging the rule.
+        Throws:
+            - ValueError if a parameter is missing.
+            - RuleNotExistsError if the rule does not exist.
         """
+        if self.__remote_runner is not None:
+            remote_future: Future = Future()
+            try:
+                remote_future.set_result(self.__remote_runner.run_rule(rule_name))
+            except (ValueError, RuleNotExistsError):
+                raise
+            except Exception as ex:  # pylint: disable=broad-except
+                remote_future.set_exception(ex)
+            return remote_future
         rule = self.get_rule(rule_name)
-        runners = {"command": CommandRuleRunner, "file": FileRuleRunner, "cpu": CPURuleRunner}
-        if rule.type not in runners:
+        if rule.type not in self.__runners:
             raise RuleNotExistsError
-        runner = runners[rule.type]
-        result = str(runner.run_rule(rule))
-        log_manager.create_log(rule_name, datetime.now(), result)
-        return result
+        runner = self.__runners[rule.type]
+        run_future: Future
+        if isinstance(runner, AsyncRuleRunner):
+            run_future = runner.submit(rule)
+        else:
+            run_future = Future()
+            try:
+                run_future.set_result(runner.run_rule(rule))
+            except Exception as ex:  # pylint: disable=broad-except
+                run_future.set_exception(ex)
+        logged_future: Future = Future()
+        caller: int = get_ident()
+
+        def log_result(finished: Future):
+            try:
+                result = str(finished.result())
+                if get_ident() == caller:
+                    # Run inline, so the session belongs to the caller (e.g. a request)
+                    log_manager.create_log(rule_name, datetime.now(), result)
+                else:
+                    with self.get_schema().session_scope():
+                        log_manager.create_log(rule_name, datetime.now(), result)
+                logged_future.set_result(result)
+            except Exception as ex:  # pylint: disable=broad-except
+                logged_future.set_exception(ex)
+
+        run_future.add_done_callback(log_result)
+        return logged_future
@@ -0,0 +1,153 @@
+""" AsyncCommandRuleRunner class module.
+"""
+
+import asyncio
+from concurrent.futures import Future
+from threading import Thread, Lock
+from typing import Dict, Optional
+from dms2021sensor.data.db.results import Rule
+from dms2021sensor.logic.rulerunners.baserulerunner import AsyncRuleRunner
+from dms2021sensor.logic.rulerunners.exc import RuleRunError
+
+class AsyncCommandRuleRunner(AsyncRuleRunner):
+    """ Rule runner when type is "command", based on asyncio subprocesses.
+
+    A single event loop thread supervises every running command, so running
+    many commands concurrently does not need a thread per child process. The
+    number of concurrent commands is bounded by a semaphore. The returned
+    futures are completed from a worker thread of the loop, so their callbacks
+    may block without stalling the running commands.
+    """
+
+    def __init__(self, max_concurrency: int, timeout: float = 0.0):
+        """ Constructor method.
+
+        Initializes the runner. The event loop is not started until `start` is called.
+        ---
+        Parameters:
+            - max_concurrency: Maximum number of commands running at the same time.
+            - timeout: Seconds after which a command is killed. 0 to disable.
+        """
+        self.__max_concurrency: int = max(1, max_concurrency)
+        self.__timeout: Optional[float] = timeout if timeout > 0 else None
+        self.__loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        self.__thread: Thread = Thread(
+            target=self.__run_loop, name='AsyncCommandRuleRunner', daemon=True
+        )
+        self.__semaphore: Optional[asyncio.Semaphore] = None
+        self.__lock: Lock = Lock()
+        self.__metrics: Dict[str, float] = {
+            'waiting': 0,
+            'running': 0,
+            'completed': 0,
+            'failed': 0,
+            'timed_out': 0
+        }
+
+    def start(self) -> None:
+        """ Starts the event loop thread.
+        """
+        self.__thread.start()
+        asyncio.run_coroutine_threadsafe(self.__create_semaphore(), self.__loop).result()
+
+    def stop(self) -> None:
+        """ Stops the event loop thread.
+        """
+        self.__loop.call_soon_threadsafe(self.__loop.stop)
+        self.__thread.join()
+
+    def submit(self, rule: Rule) -> Future:
+        """ Starts running a rule without waiting for it.
+        ---
+        Parameters:
+            rule: A rule object
+        Returns:
+            A future that will hold the result of the rule as a string.
+        """
+        result: Future = Future()
+        asyncio.run_coroutine_threadsafe(self.__run_rule(rule.data, result), self.__loop)
+        return result
+
+    def get_metrics(self) -> Dict[str, float]:
+        """ Gets the runner metrics.
+        ---
+        Returns:
+            A dictionary with the number of commands waiting, running and finished.
+        """
+        with self.__lock:
+            metrics: Dict[str, float] = dict(self.__metrics)
+        metrics['max_concurrency'] = self.__max_concurrency
+        return metrics
+
+    def __run_loop(self) -> None:
+        """ Runs the event loop until it is stopped.
+        """
+        asyncio.set_event_loop(self.__loop)
+        self.__loop.run_forever()
+
+    async def __create_semaphore(self) -> None:
+        """ Creates the concurrency semaphore inside the event loop.
+        """
+        self.__semaphore = asyncio.Semaphore(self.__max_concurrency)
+
+    def __count(self, metric: str, delta: int) -> None:
+        """ Updates a metric counter.
+        ---
+        Parameters:
+            - metric: The metric name.
+            - delta: The amount to add to the metric.
+        """
+        with self.__lock:
+            self.__metrics[metric] += delta
+
+    async def __run_rule(self, command: str, result: Future) -> None:
+        """ Runs a shell command and completes a future with its outcome.
+
+        The future is completed in the default executor of the loop, since its
+        callbacks may block (e.g. to store the result in the database).
+        ---
+        Parameters:
+            - command: The command to run.
+            - result: The future to complete.
+        """
+        try:
+            output: str = await self.__run_command(command)
+        except Exception as ex:  # pylint: disable=broad-except
+            await self.__loop.run_in_executor(None, result.set_exception, ex)
+        else:
+            await self.__loop.run_in_executor(None, result.set_result, output)
+
+    async def __run_command(self, command: str) -> str:
+        """ Runs a shell command, waiting for a free slot first.
+        ---
+        Parameters:
+            - command: The command to run.
+        Returns:
+            The standard output of the command.
+        Throws:
+            - RuleRunError: If the command failed or timed out.
+        """
+        assert self.__semaphore is not None
+        self.__count('waiting', 1)
+        async with self.__semaphore:
+            self.__count('waiting', -1)
+            self.__count('running', 1)
+            outcome: str = 'failed'
+            try:
+                process = await asyncio.create_subprocess_shell(
+                    command, stdout=asyncio.subprocess.PIPE
+                )
+                try:
+                    stdout, _ = await asyncio.wait_for(process.communicate(), self.__timeout)
+                except asyncio.TimeoutError as ex:
+                    process.kill()
+                    await process.wait()
+                    outcome = 'timed_out'
+                    raise RuleRunError from ex
+                if process.returncode != 0:
+                    raise RuleRunError
+                outcome = 'completed'
+                return stdout.decode("utf-8")
+            finally:
+                self.__count('running', -1)
+                self.__count(outcome, 1)
@@ -1,7 +1,8 @@
 """ Base rule runner module
 """
 
-from abc import ABC
+from abc import ABC, abstractmethod
+from concurrent.futures import Future
 from dms2021sensor.data.db.results import Rule
 
 class BaseRuleRunner(ABC):
@@ -16,3 +17,26 @@ class BaseRuleRunner(ABC):
         Returns:
             The result of the rule as a string.
         """
+
+class AsyncRuleRunner(ABC):
+    """ A base class for the rule runners that run the rules in the background.
+    """
+    @abstractmethod
+    def submit(self, rule: Rule) -> Future:
+        """ Starts running a rule without waiting for it.
+        ---
+        Parameters:
+            rule: A rule object
+        Returns:
+            A future that will hold the result of the rule as a string.
+        """
+
+    def run_rule(self, rule: Rule) -> str:
+        """ Runs a rule and returns its result
+        ---
+        Parameters:
+            rule: A rule object
+        Returns:
+            The result of the rule as a string.
+        """
+        return self.submit(rule).result()
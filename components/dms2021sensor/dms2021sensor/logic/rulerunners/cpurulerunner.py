@@ -1,14 +1,27 @@
 """ Base rule runner module
 """
 
+from typing import Optional
 from dms2021sensor.data.db.results import Rule
 from dms2021sensor.logic.rulerunners.baserulerunner import BaseRuleRunner
+from dms2021sensor.logic.rulerunners.cpusampler import CPUSampler
 from dms2021sensor.logic.rulerunners.exc import RuleRunError
 import psutil #type: ignore
 
 class CPURuleRunner(BaseRuleRunner):
     """ Rule runner when type is "cpu".
     """
+    sampler: Optional[CPUSampler] = None
+
+    @classmethod
+    def set_sampler(cls, sampler: Optional[CPUSampler]) -> None:
+        """ Sets the shared sampler the CPU usage is read from.
+        ---
+        Parameters:
+            sampler: A running CPUSampler, or None to measure on every run.
+        """
+        cls.sampler = sampler
+
     @staticmethod
     def run_rule(rule: Rule) -> str:
         """ Runs a rule and returns its result
@@ -19,10 +32,15 @@ class CPURuleRunner(BaseRuleRunner):
             The result of the rule as a string.
         """
         try:
+            sampler: Optional[CPUSampler] = CPURuleRunner.sampler
             if rule.data == "all":
-                return psutil.cpu_percent(0.5)
+                if sampler is not None:
+                    return str(sampler.get_usage())
+                return str(psutil.cpu_percent(0.5))
             num_core = int(rule.data)
+            if sampler is not None:
+                return str(sampler.get_usage(num_core))
             cpu_loads = psutil.cpu_percent(0.5, True)
-            return cpu_loads[num_core]
+            return str(cpu_loads[num_core])
         except Exception as ex:
             raise RuleRunError from ex
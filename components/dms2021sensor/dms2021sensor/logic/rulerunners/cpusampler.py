@@ -0,0 +1,97 @@
+""" CPUSampler class module.
+"""
+
+import math
+from array import array
+from threading import Thread, Event, Lock
+from typing import Optional
+import psutil #type: ignore
+
+class CPUSampler(Thread):
+    """ Background thread sampling the CPU usage at a fixed rate.
+
+    The samples are kept in a ring buffer backed by a flat array of doubles,
+    where every slot holds the total usage followed by the usage of each core,
+    so the CPU rules can read them without measuring anything themselves.
+    """
+
+    def __init__(self, interval: float = 0.5, window: float = 0.5):
+        """ Constructor method.
+
+        Initializes the sampler. Sampling does not begin until the thread is started.
+        ---
+        Parameters:
+            - interval: Seconds between two samples.
+            - window: Seconds of samples that are averaged when reading the usage.
+        """
+        Thread.__init__(self, name='CPUSampler', daemon=True)
+        self.__interval: float = max(0.01, interval)
+        self.__window: float = max(self.__interval, window)
+        self.__window_samples: int = max(1, math.ceil(window / self.__interval))
+        self.__cores: int = psutil.cpu_count() or 1
+        self.__stride: int = self.__cores + 1
+        self.__buffer: array = array('d', [0.0] * (self.__window_samples * self.__stride))
+        self.__position: int = 0
+        self.__count: int = 0
+        self.__lock: Lock = Lock()
+        self.__ready: Event = Event()
+        self.__stopping: Event = Event()
+
+    def run(self):
+        """ Runs the thread
+        """
+        # The first call only sets the baseline the next samples are measured against
+        psutil.cpu_percent(None)
+        psutil.cpu_percent(None, True)
+        while not self.__stopping.wait(self.__interval):
+            self.__store(psutil.cpu_percent(None), psutil.cpu_percent(None, True))
+            self.__ready.set()
+
+    def stop(self):
+        """ Requests the thread to stop.
+        """
+        self.__stopping.set()
+
+    def get_usage(self, core: Optional[int] = None) -> float:
+        """ Gets the CPU usage averaged over the configured window.
+
+        If no sample has been taken yet, waits for the first one, and if it
+        does not arrive in time, measures the usage over the window directly.
+        ---
+        Parameters:
+            - core: The core number, or None for the total usage.
+        Returns:
+            A float with the usage percentage.
+        Throws:
+            - IndexError: If the core does not exist.
+        """
+        if core is not None and not 0 <= core < self.__cores:
+            raise IndexError('CPU core ' + str(core) + ' does not exist.')
+        self.__ready.wait(self.__interval * 2)
+        offset: int = 0 if core is None else core + 1
+        with self.__lock:
+            count: int = self.__count
+            total: float = 0.0
+            for i in range(count):
+                slot: int = (self.__position - 1 - i) % self.__window_samples
+                total += self.__buffer[slot * self.__stride + offset]
+        if count == 0:
+            if core is None:
+                return psutil.cpu_percent(self.__window)
+            return psutil.cpu_percent(self.__window, True)[core]
+        return round(total / count, 1)
+
+    def __store(self, total: float, per_core: list):
+        """ Stores a new sample, overwriting the oldest one if the buffer is full.
+        ---
+        Parameters:
+            - total: The total usage percentage.
+            - per_core: A list with the usage percentage of each core.
+        """
+        with self.__lock:
+            base: int = self.__position * self.__stride
+            self.__buffer[base] = total
+            for core, usage in enumerate(per_core[:self.__cores]):
+                self.__buffer[base + 1 + core] = usage
+            self.__position = (self.__position + 1) % self.__window_samples
+            self.__count = min(self.__count + 1, self.__window_samples)
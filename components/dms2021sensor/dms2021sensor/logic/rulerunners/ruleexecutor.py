@@ -0,0 +1,193 @@
+""" RuleExecutor class module.
+"""
+
+import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from threading import Lock
+from typing import Callable, Dict, Optional, Set
+from dms2021sensor.logic.logmanager import LogManager
+from dms2021sensor.logic.rulemanager import RuleManager
+
+class RuleExecutor():
+    """ Bounded pool of worker threads running the rules that are due.
+
+    A rule is never run twice at the same time: if it becomes due again while a
+    previous run is still queued or running, the new run is skipped. Runs
+    requested on demand share the same workers, but are never skipped.
+    """
+
+    def __init__(self, rule_manager: RuleManager, log_manager: LogManager, workers: int):
+        """ Constructor method.
+
+        Initializes the executor and its worker pool.
+        ---
+        Parameters:
+            - rule_manager: The rule manager used to run the rules.
+            - log_manager: The log manager used to store the results.
+            - workers: The maximum number of rules run concurrently.
+        """
+        self.__rule_manager: RuleManager = rule_manager
+        self.__log_manager: LogManager = log_manager
+        self.__workers: int = max(1, workers)
+        self.__pool: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=self.__workers, thread_name_prefix='RuleWorker'
+        )
+        self.__lock: Lock = Lock()
+        self.__in_flight: Set[str] = set()
+        self.__queued: int = 0
+        self.__metrics: Dict[str, float] = {
+            'submitted': 0,
+            'skipped_in_flight': 0,
+            'submitted_on_demand': 0,
+            'completed': 0,
+            'failed': 0,
+            'last_wait_seconds': 0.0,
+            'max_wait_seconds': 0.0,
+            'total_wait_seconds': 0.0
+        }
+
+    def submit(self, rule_name: str) -> bool:
+        """ Queues a rule to be run by the worker pool.
+        ---
+        Parameters:
+            - rule_name: The name of the rule to run.
+        Returns:
+            True if the rule was queued, False if a run of the same rule was
+            already in flight.
+        """
+        with self.__lock:
+            if rule_name in self.__in_flight:
+                self.__metrics['skipped_in_flight'] += 1
+                return False
+            self.__in_flight.add(rule_name)
+            self.__queued += 1
+            self.__metrics['submitted'] += 1
+        self.__pool.submit(self.__run, rule_name, time.monotonic())
+        return True
+
+    def run(self, rule_name: str, started: Optional[Callable[[], None]] = None) -> Future:
+        """ Queues an on-demand run of a rule.
+        ---
+        Parameters:
+            - rule_name: The name of the rule to run.
+            - started: A callable invoked from the worker thread when the run starts, if any.
+        Returns:
+            A future that will hold the string with the result of the run once it
+            is logged, or the exception raised while running or logging it.
+        """
+        with self.__lock:
+            self.__queued += 1
+            self.__metrics['submitted_on_demand'] += 1
+        result: Future = Future()
+        self.__pool.submit(self.__run_on_demand, rule_name, time.monotonic(), started, result)
+        return result
+
+    def __run_on_demand(self, rule_name: str, submitted_at: float,
+                        started: Optional[Callable[[], None]], result: Future) -> None:
+        """ Runs a rule requested on demand inside a worker thread.
+        ---
+        Parameters:
+            - rule_name: The name of the rule to run.
+            - submitted_at: The monotonic time at which the rule was queued.
+            - started: A callable to invoke before running the rule, if any.
+            - result: The future returned to the requestor.
+        """
+        self.__record_wait(submitted_at)
+        if not result.set_running_or_notify_cancel():
+            return
+        try:
+            if started is not None:
+                started()
+            with self.__rule_manager.get_schema().session_scope():
+                future: Future = self.__rule_manager.start_rule(rule_name, self.__log_manager)
+        except Exception as ex:  # pylint: disable=broad-except
+            future = Future()
+            future.set_exception(ex)
+        future.add_done_callback(partial(self.__finish_on_demand, result))
+
+    def __finish_on_demand(self, result: Future, future: Future) -> None:
+        """ Records the end of a rule run requested on demand.
+        ---
+        Parameters:
+            - result: The future returned to the requestor.
+            - future: The finished future of the run.
+        """
+        exception = future.exception()
+        with self.__lock:
+            self.__metrics['failed' if exception is not None else 'completed'] += 1
+        if exception is not None:
+            result.set_exception(exception)
+        else:
+            result.set_result(future.result())
+
+    def __record_wait(self, submitted_at: float) -> None:
+        """ Records the time a rule waited in the queue.
+        ---
+        Parameters:
+            - submitted_at: The monotonic time at which the rule was queued.
+        """
+        waited: float = time.monotonic() - submitted_at
+        with self.__lock:
+            self.__queued -= 1
+            self.__metrics['last_wait_seconds'] = waited
+            self.__metrics['max_wait_seconds'] = max(self.__metrics['max_wait_seconds'], waited)
+            self.__metrics['total_wait_seconds'] += waited
+
+    def __run(self, rule_name: str, submitted_at: float) -> None:
+        """ Runs a queued rule inside a worker thread.
+        ---
+        Parameters:
+            - rule_name: The name of the rule to run.
+            - submitted_at: The monotonic time at which the rule was queued.
+        """
+        self.__record_wait(submitted_at)
+        try:
+            with self.__rule_manager.get_schema().session_scope():
+                future: Future = self.__rule_manager.start_rule(rule_name, self.__log_manager)
+        except Exception as ex:  # pylint: disable=broad-except
+            future = Future()
+            future.set_exception(ex)
+        future.add_done_callback(partial(self.__finish, rule_name))
+
+    def __finish(self, rule_name: str, future: Future) -> None:
+        """ Records the end of a rule run.
+
+        Rules whose runner works in the background finish outside of the worker
+        threads, so the worker is released as soon as the rule is started.
+        ---
+        Parameters:
+            - rule_name: The name of the rule that was run.
+            - future: The finished future of the run.
+        """
+        exception = future.exception()
+        if exception is not None:
+            logging.getLogger(__name__).error(
+                'Rule %s failed to run', rule_name, exc_info=exception
+            )
+        with self.__lock:
+            self.__in_flight.discard(rule_name)
+            self.__metrics['failed' if exception is not None else 'completed'] += 1
+
+    def shutdown(self, wait: bool = True) -> None:
+        """ Stops the worker pool.
+        ---
+        Parameters:
+            - wait: Whether to wait for the queued rules to finish or not.
+        """
+        self.__pool.shutdown(wait=wait)
+
+    def get_metrics(self) -> Dict[str, float]:
+        """ Gets the executor metrics.
+        ---
+        Returns:
+            A dictionary with the queue depth, the number of rules in flight and
+            the time the rules waited in the queue.
+        """
+        with self.__lock:
+            metrics: Dict[str, float] = dict(self.__metrics)
+            metrics['workers'] = self.__workers
+            metrics['queue_depth'] = self.__queued
+            metrics['in_flight'] = len(self.__in_flight)
+        return metrics
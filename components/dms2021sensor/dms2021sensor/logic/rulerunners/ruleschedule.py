@@ -0,0 +1,112 @@
+""" RuleSchedule class module.
+"""
+
+import heapq
+from typing import Dict, List, Optional, Tuple
+
+
+class RuleSchedule():
+    """ Min-heap of rule names keyed by their next due time.
+
+    Entries are never removed from the middle of the heap. Instead, every rule
+    keeps a generation number and heap entries whose generation does not match
+    are discarded when they reach the top.
+    """
+
+    def __init__(self):
+        """ Constructor method.
+
+        Initializes an empty schedule.
+        """
+        self.__heap: List[Tuple[float, int, str]] = []
+        self.__entries: Dict[str, Tuple[float, int]] = {}
+        self.__generation: int = 0
+
+    def sync(self, frequencies: Dict[str, float], now: float) -> None:
+        """ Updates the schedule to match a set of rules.
+
+        New rules are due immediately, removed rules are dropped and rules whose
+        frequency changed are rescheduled from now.
+        ---
+        Parameters:
+            - frequencies: A dictionary with the frequency in seconds of every
+                           rule name that must be scheduled.
+            - now: The current monotonic time.
+        """
+        for rule_name in list(self.__entries):
+            if rule_name not in frequencies:
+                del self.__entries[rule_name]
+        for rule_name, frequency in frequencies.items():
+            entry: Optional[Tuple[float, int]] = self.__entries.get(rule_name)
+            if entry is None:
+                self.__push(rule_name, frequency, now)
+            elif entry[0] != frequency:
+                self.__push(rule_name, frequency, now + frequency)
+        if len(self.__heap) > 2 * len(self.__entries) + 16:
+            self.__compact()
+
+    def pop_due(self, now: float) -> List[str]:
+        """ Removes the rules that are due and schedules their next run.
+        ---
+        Parameters:
+            - now: The current monotonic time.
+        Returns:
+            A list with the names of the rules that are due.
+        """
+        due: List[str] = []
+        while self.__heap and self.__heap[0][0] <= now:
+            deadline, generation, rule_name = heapq.heappop(self.__heap)
+            entry: Optional[Tuple[float, int]] = self.__entries.get(rule_name)
+            if entry is None or entry[1] != generation:
+                continue
+            due.append(rule_name)
+            frequency: float = entry[0]
+            next_deadline: float = deadline + frequency
+            if next_deadline <= now:
+                # Runs that were missed are skipped instead of run in a burst
+                next_deadline = now + frequency
+            self.__push(rule_name, frequency, next_deadline)
+        return due
+
+    def next_deadline(self) -> Optional[float]:
+        """ Gets the time at which the next rule will be due.
+        ---
+        Returns:
+            The monotonic time of the earliest deadline, or None if nothing is scheduled.
+        """
+        while self.__heap:
+            deadline, generation, rule_name = self.__heap[0]
+            entry: Optional[Tuple[float, int]] = self.__entries.get(rule_name)
+            if entry is not None and entry[1] == generation:
+                return deadline
+            heapq.heappop(self.__heap)
+        return None
+
+    def __len__(self) -> int:
+        """ Gets the number of scheduled rules.
+        ---
+        Returns:
+            The number of rules in the schedule.
+        """
+        return len(self.__entries)
+
+    def __push(self, rule_name: str, frequency: float, deadline: float) -> None:
+        """ Adds a new heap entry for a rule, invalidating the previous ones.
+        ---
+        Parameters:
+            - rule_name: The rule name.
+            - frequency: The rule frequency in seconds.
+            - deadline: The monotonic time at which the rule will be due.
+        """
+        self.__generation += 1
+        self.__entries[rule_name] = (frequency, self.__generation)
+        heapq.heappush(self.__heap, (deadline, self.__generation, rule_name))
+
+    def __compact(self) -> None:
+        """ Rebuilds the heap without the stale entries.
+        """
+        self.__heap = [
+            item for item in self.__heap
+            if item[2] in self.__entries and self.__entries[item[2]][1] == item[1]
+        ]
+        heapq.heapify(self.__heap)
@@ -0,0 +1,135 @@
+""" RunnerClient class module.
+"""
+
+import logging
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client
+from threading import Event, Lock, Thread
+from typing import Dict, Optional
+from dms2021sensor.data.db.exc import RuleNotExistsError
+from dms2021sensor.logic.rulerunners.exc import RuleRunError
+
+class RunnerClient():
+    """ Client of the requests to a standalone rule runner process.
+
+    Used by the API processes when the rules are run by `dms2021sensor-runner`,
+    so the rules never compete with the requests for the same interpreter.
+    """
+
+    def __init__(self, address: str, authkey: bytes, timeout: float = 60.0):
+        """ Constructor method.
+
+        Initializes the client. Nothing is connected until a request is sent.
+        ---
+        Parameters:
+            - address: The path of the socket the runner process listens on.
+            - authkey: The key to authenticate with.
+            - timeout: Maximum number of seconds to wait for a response.
+        """
+        self.__address: str = address
+        self.__timeout: float = timeout
+        self.__authkey: bytes = authkey
+        self.__lock: Lock = Lock()
+        self.__resync_requested: Event = Event()
+        self.__resync_thread: Optional[Thread] = None
+        self.__metrics: Dict[str, float] = {
+            'requests': 0,
+            'unavailable': 0,
+            'timed_out': 0
+        }
+
+    def run_rule(self, rule_name: str) -> str:
+        """ Runs a rule in the runner process, which also logs its result.
+        ---
+        Parameters:
+            - rule_name: A string with the rule name.
+        Returns:
+            A string with the result of the action.
+        Throws:
+            - ValueError if a parameter is missing.
+            - RuleNotExistsError if the rule does not exist.
+            - RuleRunError if the rule failed or the runner process is not available.
+        """
+        status, value = self.__request(('run', rule_name))
+        if status == 'ok':
+            return str(value)
+        if status == 'not_found':
+            raise RuleNotExistsError(value)
+        if status == 'invalid':
+            raise ValueError(value)
+        raise RuleRunError(value)
+
+    def request_resync(self) -> None:
+        """ Asks the runner process to reload the rule list as soon as possible.
+
+        Returns at once: the request is sent from a background thread, so a
+        stalled runner does not stall the caller, and the requests made while
+        another one is being sent are sent only once. Failures are only logged;
+        the runner reloads the list periodically anyway.
+        """
+        self.__resync_requested.set()
+        with self.__lock:
+            if self.__resync_thread is None:
+                self.__resync_thread = Thread(
+                    target=self.__send_resyncs, name='RunnerResync', daemon=True
+                )
+                self.__resync_thread.start()
+
+    def __send_resyncs(self) -> None:
+        """ Sends the requested resyncs to the runner process, one at a time.
+        """
+        while True:
+            self.__resync_requested.wait()
+            self.__resync_requested.clear()
+            try:
+                self.__request(('resync',))
+            except RuleRunError:
+                logging.getLogger(__name__).warning('The rule runner could not be notified')
+
+    def get_runner_metrics(self) -> Dict[str, dict]:
+        """ Gets the metrics of the runner process.
+        ---
+        Returns:
+            A dictionary with a dictionary of metrics per component of the runner
+            process, or an empty dictionary if it is not available.
+        """
+        try:
+            status, value = self.__request(('metrics',))
+        except RuleRunError:
+            return {}
+        return value if status == 'ok' else {}
+
+    def __request(self, request: tuple) -> tuple:
+        """ Sends a request to the runner process and waits for its response.
+        ---
+        Parameters:
+            - request: The request tuple.
+        Returns:
+            The response tuple.
+        Throws:
+            - RuleRunError if the runner process is not available or does not answer in time.
+        """
+        with self.__lock:
+            self.__metrics['requests'] += 1
+        try:
+            with Client(self.__address, family='AF_UNIX', authkey=self.__authkey) as connection:
+                connection.send(request)
+                if not connection.poll(self.__timeout):
+                    with self.__lock:
+                        self.__metrics['timed_out'] += 1
+                    raise RuleRunError('The rule runner did not answer in time.')
+                return connection.recv()
+        except (OSError, EOFError, AuthenticationError) as ex:
+            with self.__lock:
+                self.__metrics['unavailable'] += 1
+            raise RuleRunError('The rule runner is not available.') from ex
+
+    def get_metrics(self) -> Dict[str, float]:
+        """ Gets the client metrics.
+        ---
+        Returns:
+            A dictionary with the number of requests sent, and of those that
+            failed because the runner was not available or did not answer in time.
+        """
+        with self.__lock:
+            return dict(self.__metrics)
@@ -0,0 +1,148 @@
+""" RunnerServer class module.
+"""
+
+import logging
+import os
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Listener, Connection
+from threading import Thread, Lock
+from typing import Callable, Dict, Optional
+from dms2021sensor.data.db.exc import RuleNotExistsError
+from dms2021sensor.logic import LogManager, RuleManager
+
+class RunnerServer(Thread):
+    """ Background thread serving the requests of the API processes to the rule runner process.
+
+    Requests arrive through a local socket. Each connection carries a single
+    request, handled in its own thread so a slow rule does not delay the
+    others. The supported requests are:
+        - `('run', rule_name)`: Runs a rule and logs its result.
+        - `('resync',)`: Reloads the rule list of the scheduler.
+        - `('metrics',)`: Gets the metrics of the runner process.
+    Responses are `('ok', value)` or `(error, message)` tuples, where error is
+    one of `not_found`, `invalid` or `failed`.
+    """
+
+    def __init__(self, address: str, rule_manager: RuleManager, log_manager: LogManager,
+                 resync: Callable[[], None], metrics: Callable[[], Dict[str, dict]],
+                 authkey: bytes):
+        """ Constructor method.
+
+        Initializes the server. Nothing is served until the thread is started.
+        ---
+        Parameters:
+            - address: The path of the socket to listen on.
+            - rule_manager: The rule manager used to run the rules.
+            - log_manager: The log manager used to log the results.
+            - resync: A callable reloading the rule list of the scheduler.
+            - metrics: A callable returning the metrics of the runner process.
+            - authkey: The key the clients must authenticate with.
+        Throws:
+            - ValueError: If the key is empty.
+        """
+        if not authkey:
+            raise ValueError('A non-empty key is needed to authenticate the clients.')
+        Thread.__init__(self, name='RunnerServer', daemon=True)
+        self.__address: str = address
+        self.__rule_manager: RuleManager = rule_manager
+        self.__log_manager: LogManager = log_manager
+        self.__resync: Callable[[], None] = resync
+        self.__metrics_source: Callable[[], Dict[str, dict]] = metrics
+        self.__authkey: bytes = authkey
+        self.__listener: Optional[Listener] = None
+        self.__stopping: bool = False
+        self.__lock: Lock = Lock()
+        self.__metrics: Dict[str, float] = {
+            'requests': 0,
+            'runs': 0,
+            'failed': 0
+        }
+
+    def run(self):
+        """ Runs the thread
+        """
+        directory: str = os.path.dirname(self.__address)
+        if directory and not os.path.isdir(directory):
+            # Only the user running the runner can reach the socket
+            os.makedirs(directory, mode=0o700)
+        # A socket left behind by a previous runner would prevent listening
+        if os.path.exists(self.__address):
+            os.unlink(self.__address)
+        self.__listener = Listener(self.__address, family='AF_UNIX', authkey=self.__authkey)
+        while not self.__stopping:
+            try:
+                connection: Connection = self.__listener.accept()
+            except (OSError, AuthenticationError):
+                if self.__stopping:
+                    break
+                logging.getLogger(__name__).exception('A runner client could not connect')
+                continue
+            Thread(target=self.__handle, args=(connection,), daemon=True).start()
+
+    def stop(self) -> None:
+        """ Stops listening for new requests.
+        """
+        self.__stopping = True
+        if self.__listener is not None:
+            self.__listener.close()
+
+    def __handle(self, connection: Connection) -> None:
+        """ Serves the request of a connection, closing it afterwards.
+        ---
+        Parameters:
+            - connection: The client connection.
+        """
+        with connection:
+            try:
+                request = connection.recv()
+            except (EOFError, OSError):
+                return
+            response: tuple = self.__dispatch(request)
+            try:
+                connection.send(response)
+            except OSError:
+                # The client gave up waiting, e.g. after its timeout
+                logging.getLogger(__name__).warning('A runner client left before its response')
+
+    def __dispatch(self, request) -> tuple:
+        """ Serves a request.
+        ---
+        Parameters:
+            - request: The request tuple.
+        Returns:
+            The response tuple.
+        """
+        with self.__lock:
+            self.__metrics['requests'] += 1
+        operation = request[0] if isinstance(request, tuple) and request else None
+        if operation == 'resync':
+            self.__resync()
+            return ('ok', None)
+        if operation == 'metrics':
+            return ('ok', self.__metrics_source())
+        if operation != 'run' or len(request) != 2:
+            return ('invalid', 'Unknown request.')
+        with self.__lock:
+            self.__metrics['runs'] += 1
+        try:
+            with self.__rule_manager.get_schema().session_scope():
+                return ('ok', self.__rule_manager.run_rule(str(request[1]), self.__log_manager))
+        except RuleNotExistsError:
+            return ('not_found', 'The rule does not exist.')
+        except ValueError as ex:
+            return ('invalid', str(ex))
+        except Exception as ex:  # pylint: disable=broad-except
+            with self.__lock:
+                self.__metrics['failed'] += 1
+            logging.getLogger(__name__).exception('Rule %s could not be run', request[1])
+            return ('failed', str(ex))
+
+    def get_metrics(self) -> Dict[str, float]:
+        """ Gets the server metrics.
+        ---
+        Returns:
+            A dictionary with the number of requests served, the rules run and
+            the runs that failed.
+        """
+        with self.__lock:
+            return dict(self.__metrics)
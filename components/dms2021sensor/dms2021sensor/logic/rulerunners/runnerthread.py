@@ -1,44 +1,154 @@
 """ RunnerThread class module.
 """
 
-from threading import Thread
-from typing import List, Dict
-from datetime import datetime
-from dms2021sensor.logic import RuleManager, LogManager
+import time
+from threading import Thread, Event
+from typing import List, Dict, Optional
+from dms2021sensor.logic import RuleManager
+from dms2021sensor.logic.leaderelector import LeaderElector
 from dms2021sensor.data.db.results import Rule
+from dms2021sensor.data.db.exc import RuleExistsError
+from dms2021sensor.logic.rulerunners.ruleexecutor import RuleExecutor
+from dms2021sensor.logic.rulerunners.ruleschedule import RuleSchedule
 
 class RunnerThread(Thread):
     """ Background thread that runs rules automatically and logs results
+
+    The thread sleeps until the next rule is due instead of polling, and only
+    reloads the rule list periodically or when the rules are changed. Due rules
+    are handed over to a RuleExecutor, so a slow rule does not delay the others.
+    If a LeaderElector is given, rules are only scheduled while this process is
+    the leader, so several processes can serve the same database.
     """
-    def set_up(self, rule_manager: RuleManager, log_manager: LogManager):
+    def __init__(self):
+        """ Constructor method.
+
+        Initializes the thread as a daemon thread.
+        """
+        Thread.__init__(self, name='RunnerThread', daemon=True)
+        self.__wakeup: Event = Event()
+        self.__stopping: bool = False
+        self.__resync_requested: bool = True
+        self.__schedule: RuleSchedule = RuleSchedule()
+        self.__leader_elector: Optional[LeaderElector] = None
+        self.__executor: Optional[RuleExecutor] = None
+        self.__resync_interval: float = 10.0
+        self.__metrics: Dict[str, float] = {
+            'ticks': 0,
+            'last_tick_seconds': 0.0,
+            'total_tick_seconds': 0.0,
+            'last_due_count': 0,
+            'total_due_count': 0,
+            'resyncs': 0,
+            'standby_waits': 0
+        }
+
+    def set_up(self, rule_manager: RuleManager, executor: RuleExecutor,
+               resync_interval: float = 10.0, leader_elector: Optional[LeaderElector] = None):
         """ Sets up the objects for the thread
+        ---
+        Parameters:
+            - rule_manager: The rule manager used to load the rules.
+            - executor: The executor the due rules are dispatched to.
+            - resync_interval: Maximum number of seconds between two rule list reloads.
+            - leader_elector: The elector deciding whether this process schedules the
+                              rules, or None to always schedule them.
         """
         self.rule_manager = rule_manager
-        self.log_manager = log_manager
         self.rules: List[Rule] = []
-        self.rule_manager.create_rule("Archivo file.txt", "file", "/tmp/sensor-volume/file.txt", 30)
-        self.rule_manager.create_rule("Estado memoria", "command", "free -m", 30)
-        self.rule_manager.create_rule("Uso CPU", "cpu",
-        "all", 30)
-        self.rule_manager.create_rule("Info kernel", "command", "uname -a", 0)
-        self.last_runs: Dict[str, datetime] = {}
+        self.__executor = executor
+        self.__resync_interval = resync_interval
+        self.__leader_elector = leader_elector
+        default_rules = [
+            ("Archivo file.txt", "file", "/tmp/sensor-volume/file.txt", 30),
+            ("Estado memoria", "command", "free -m", 30),
+            ("Uso CPU", "cpu", "all", 30),
+            ("Info kernel", "command", "uname -a", 0)
+        ]
+        with self.rule_manager.get_schema().session_scope():
+            for rule_name, rule_type, data, frequency in default_rules:
+                # Other processes sharing the database may have created them already
+                try:
+                    self.rule_manager.create_rule(rule_name, rule_type, data, frequency)
+                except RuleExistsError:
+                    pass
+        self.rule_manager.add_change_listener(self.request_resync)
+        if leader_elector is not None:
+            leader_elector.add_listener(self.request_resync)
 
     def run(self):
         """ Runs the thread
         """
-        self.update_rule_list()
-        for rule in self.rules:
-            if rule.frequency != 0:
-                if rule.rule_name not in self.last_runs:
-                    self.last_runs[rule.rule_name] = datetime.now()
-                    self.rule_manager.run_rule(rule.rule_name, self.log_manager)
-                else:
-                    difference = datetime.now() - self.last_runs[rule.rule_name]
-                    if difference.total_seconds() > rule.frequency:
-                        self.last_runs[rule.rule_name] = datetime.now()
-                        self.rule_manager.run_rule(rule.rule_name, self.log_manager)
+        next_resync: float = 0.0
+        while not self.__stopping:
+            if self.__leader_elector is not None and not self.__leader_elector.is_leader():
+                # Another process schedules; wait to be elected, then start afresh
+                self.__schedule.sync({}, time.monotonic())
+                self.__metrics['standby_waits'] += 1
+                self.__wakeup.wait(self.__resync_interval)
+                self.__wakeup.clear()
+                next_resync = 0.0
+                continue
+            now: float = time.monotonic()
+            if self.__resync_requested or now >= next_resync:
+                self.__resync_requested = False
+                self.update_rule_list()
+                next_resync = time.monotonic() + self.__resync_interval
+            self.tick()
+            wake_at: float = next_resync
+            deadline: Optional[float] = self.__schedule.next_deadline()
+            if deadline is not None:
+                wake_at = min(wake_at, deadline)
+            self.__wakeup.wait(max(0.0, wake_at - time.monotonic()))
+            self.__wakeup.clear()
+
+    def tick(self):
+        """ Dispatches the rules that are due to the executor.
+        """
+        if self.__executor is None:
+            return
+        started: float = time.monotonic()
+        due: List[str] = self.__schedule.pop_due(started)
+        for rule_name in due:
+            self.__executor.submit(rule_name)
+        elapsed: float = time.monotonic() - started
+        self.__metrics['ticks'] += 1
+        self.__metrics['last_tick_seconds'] = elapsed
+        self.__metrics['total_tick_seconds'] += elapsed
+        self.__metrics['last_due_count'] = len(due)
+        self.__metrics['total_due_count'] += len(due)
 
     def update_rule_list(self):
         """ Updates the rule list
         """
-        self.rules = self.rule_manager.get_all_rules()
+        with self.rule_manager.get_schema().session_scope():
+            self.rules = self.rule_manager.get_all_rules()
+        frequencies: Dict[str, float] = {}
+        for rule in self.rules:
+            if int(rule.frequency) != 0:
+                frequencies[rule.rule_name] = float(rule.frequency)
+        self.__schedule.sync(frequencies, time.monotonic())
+        self.__metrics['resyncs'] += 1
+
+    def request_resync(self):
+        """ Requests the rule list to be reloaded as soon as possible.
+        """
+        self.__resync_requested = True
+        self.__wakeup.set()
+
+    def stop(self):
+        """ Requests the thread to stop.
+        """
+        self.__stopping = True
+        self.__wakeup.set()
+
+    def get_metrics(self) -> Dict[str, float]:
+        """ Gets the scheduler metrics.
+        ---
+        Returns:
+            A dictionary with the tick count and cost, the due rule counts and
+            the number of scheduled rules.
+        """
+        metrics: Dict[str, float] = dict(self.__metrics)
+        metrics['scheduled_rules'] = len(self.__schedule)
+        return metrics
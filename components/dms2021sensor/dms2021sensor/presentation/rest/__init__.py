@@ -3,3 +3,4 @@
 
 from .log import Log
 from .rule import Rule
+from .job import Job
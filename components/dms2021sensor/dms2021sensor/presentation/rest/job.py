@@ -0,0 +1,108 @@
+""" Job class module.
+"""
+
+import json
+from typing import Optional
+from dms2021core.data.rest import RestResponse
+from dms2021sensor.logic import JobManager
+from dms2021sensor.logic.exc import JobLimitError
+from dms2021sensor.data.db.exc import JobNotExistsError, RuleNotExistsError
+from dms2021sensor.data.rest.exc import NotFoundError
+from dms2021sensor.data.rest import AuthService
+
+class Job():
+    """ Class responsible of handling the rule run job REST requests.
+    """
+
+    def __init__(self, job_manager: JobManager, auth_service: AuthService):
+        """ Constructor method.
+
+        Initializes the job REST interface.
+        ---
+        Parameters:
+            - job_manager: Instance responsible of the job logic operations.
+            - auth_service: Instance responsible of the auth logic operations.
+        """
+        self.__set_job_manager(job_manager)
+        self.__set_auth_service(auth_service)
+
+    def get_job_manager(self) -> JobManager:
+        """ Gets the job manager object being used by this instance.
+        ---
+        Returns:
+            The job manager instance in use.
+        """
+        return self.__job_manager
+
+    def __set_job_manager(self, job_manager: JobManager):
+        """ Sets the new job manager object to be used by this instance.
+        ---
+        Parameters:
+            - job_manager: The new job manager instance.
+        """
+        self.__job_manager = job_manager
+
+    def get_auth_service(self) -> AuthService:
+        """ Gets the auth service object being used by this instance.
+        ---
+        Returns:
+            The auth service instance in use.
+        """
+        return self.__auth_service
+
+    def __set_auth_service(self, auth_service: AuthService):
+        """ Sets the new auth service object to be used by this instance.
+        ---
+        Parameters:
+            - auth_service: Instance responsible of the auth logic operations.
+        """
+        self.__auth_service = auth_service
+
+    def submit(self, rule_name: str, user: str, token: Optional[str] = None) -> RestResponse:
+        """ Requests a run of a rule in the background.
+        ---
+        Parameters:
+            - rule_name: The rule name string.
+            - user: The username string.
+            - token: The capability token sent by the requestor, if any.
+        Returns:
+            A RestResponse object holding the queued job, with a 202 code.
+        """
+        try:
+            if not self.get_auth_service().has_rights(user, ["AdminRules", "ViewReports"], token):
+                return RestResponse(code=401, mime_type="text/plain")
+            job = self.get_job_manager().submit(rule_name, user)
+            return RestResponse(json.dumps(job.to_dict()), code=202, mime_type="application/json")
+        except ValueError:
+            return RestResponse(code=400, mime_type="text/plain")
+        except RuleNotExistsError:
+            return RestResponse(code=404, mime_type="text/plain")
+        except JobLimitError:
+            return RestResponse(code=429, mime_type="text/plain")
+        except NotFoundError:
+            return RestResponse(code=401, mime_type="text/plain")
+
+    def get_job(self, job_id: str, user: str, wait: Optional[str] = None,
+                token: Optional[str] = None) -> RestResponse:
+        """ Gets a job requested by the user.
+        ---
+        Parameters:
+            - job_id: The job identifier string.
+            - user: The username string.
+            - wait: Number of seconds to wait for the job to finish, if any.
+            - token: The capability token sent by the requestor, if any.
+        Returns:
+            A RestResponse object holding the job, finished or not.
+        """
+        try:
+            if not self.get_auth_service().has_rights(user, ["AdminRules", "ViewReports"], token):
+                return RestResponse(code=401, mime_type="text/plain")
+            wait_seconds: float = float(wait) if wait else 0.0
+            job = self.get_job_manager().get_job(job_id, user, wait_seconds)
+            return RestResponse(json.dumps(job.to_dict()), mime_type="application/json")
+        except ValueError:
+            return RestResponse(code=400, mime_type="text/plain")
+        except JobNotExistsError:
+            return RestResponse(code=404, mime_type="text/plain")
+        except NotFoundError:
+            return RestResponse(code=401, mime_type="text/plain")
@@ -1,10 +1,14 @@
 """ Log class module.
 """
 
+import base64
 import json
+from datetime import datetime
+from typing import Iterator, Optional, Tuple
 from dms2021core.data.rest import RestResponse
 from dms2021sensor.logic import RuleManager, LogManager
 from dms2021sensor.data.db.exc import RuleNotExistsError
+from dms2021sensor.data.db.results import Log as LogRecord
 from dms2021sensor.logic.rulerunners.exc import RuleRunError
 from dms2021sensor.data.rest.exc import NotFoundError
 from dms2021sensor.data.rest import AuthService
@@ -12,8 +16,11 @@ from dms2021sensor.data.rest import AuthService
 class Log():
     """ Class responsible of handling the log-related REST requests.
     """
+    DEFAULT_PAGE_SIZE: int = 100
+    MAX_PAGE_SIZE: int = 1000
 
-    def __init__(self, rule_manager: RuleManager, log_manager: LogManager, auth_service: AuthService):
+    def __init__(self, rule_manager: RuleManager, log_manager: LogManager,
+                 auth_service: AuthService):
         """ Constructor method.
 
         Initializes the user REST interface.
@@ -75,19 +82,18 @@ class Log():
         """
         self.__auth_service = auth_service
 
-    def run_rule(self, rule_name: str, user: str) -> RestResponse:
+    def run_rule(self, rule_name: str, user: str, token: Optional[str] = None) -> RestResponse:
         """ Creates a new user.
         ---
         Parameters:
             - rulename: The rule name string.
             - user: The username string.
+            - token: The capability token sent by the requestor, if any.
         Returns:
             A RestResponse object holding the result of the operation.
         """
         try:
-            if not self.get_auth_service().has_right(user, "AdminRules"):
-                return RestResponse(code=401, mime_type="text/plain")
-            if not self.get_auth_service().has_right(user, "ViewReports"):
+            if not self.get_auth_service().has_rights(user, ["AdminRules", "ViewReports"], token):
                 return RestResponse(code=401, mime_type="text/plain")
             result = self.get_rule_manager().run_rule(rule_name, self.get_log_manager())
             json_content = {"result": result}
@@ -102,20 +108,115 @@ class Log():
         except NotFoundError:
             return RestResponse(code=401, mime_type="text/plain")
 
-    def get_log(self, user: str) -> RestResponse:
-        """ Gets the log.
+    def get_log(self, user: str, rule_name: Optional[str] = None, since: Optional[str] = None,
+                until: Optional[str] = None, limit: Optional[str] = None,
+                cursor: Optional[str] = None, token: Optional[str] = None) -> RestResponse:
+        """ Gets a page of the log.
         ---
         Parameters:
             - user: The username string.
+            - rule_name: Only return the logs of this rule.
+            - since: An ISO 8601 time string. Only return the logs at or after it.
+            - until: An ISO 8601 time string. Only return the logs before it.
+            - limit: The maximum number of logs to return.
+            - cursor: The cursor returned with the previous page.
+            - token: The capability token sent by the requestor, if any.
         Returns:
             A RestResponse object holding the result of the operation.
         """
         try:
-            if not self.get_auth_service().has_right(user, "ViewReports"):
+            if not self.get_auth_service().has_right(user, "ViewReports", token):
                 return RestResponse(code=401, mime_type="text/plain")
         except NotFoundError:
             return RestResponse(code=401, mime_type="text/plain")
-        result = self.get_log_manager().get_all_runs()
-        json_content = [str(log) for log in result]
+        try:
+            page_size: int = int(limit) if limit else self.DEFAULT_PAGE_SIZE
+            if not 0 < page_size <= self.MAX_PAGE_SIZE:
+                raise ValueError
+            result, has_more = self.get_log_manager().get_runs(
+                rule_name or None,
+                datetime.fromisoformat(since) if since else None,
+                datetime.fromisoformat(until) if until else None,
+                self.__decode_cursor(cursor) if cursor else None,
+                page_size
+            )
+        except ValueError:
+            return RestResponse(code=400, mime_type="text/plain")
+        json_content = {
+            "logs": [str(log) for log in result],
+            "next_cursor": self.__encode_cursor(result[-1]) if has_more else None
+        }
         json_response = json.dumps(json_content)
         return RestResponse(json_response, mime_type="application/json")
+
+    def stream_log(self, user: str, rule_name: Optional[str] = None, since: Optional[str] = None,
+                   until: Optional[str] = None, token: Optional[str] = None) -> RestResponse:
+        """ Streams the whole log as newline-delimited JSON.
+        ---
+        Parameters:
+            - user: The username string.
+            - rule_name: Only return the logs of this rule.
+            - since: An ISO 8601 time string. Only return the logs at or after it.
+            - until: An ISO 8601 time string. Only return the logs before it.
+            - token: The capability token sent by the requestor, if any.
+        Returns:
+            A RestResponse object holding the result of the operation. On success
+            its content is an iterator yielding one JSON object per line.
+        """
+        try:
+            if not self.get_auth_service().has_right(user, "ViewReports", token):
+                return RestResponse(code=401, mime_type="text/plain")
+        except NotFoundError:
+            return RestResponse(code=401, mime_type="text/plain")
+        try:
+            since_time: Optional[datetime] = datetime.fromisoformat(since) if since else None
+            until_time: Optional[datetime] = datetime.fromisoformat(until) if until else None
+        except ValueError:
+            return RestResponse(code=400, mime_type="text/plain")
+        return RestResponse(
+            self.__ndjson_lines(rule_name or None, since_time, until_time),
+            mime_type="application/x-ndjson"
+        )
+
+    def __ndjson_lines(self, rule_name: Optional[str], since: Optional[datetime],
+                       until: Optional[datetime]) -> Iterator[str]:
+        """ Encodes the logs as they are read, one JSON object per line.
+        ---
+        Parameters:
+            - rule_name: Only return the logs of this rule.
+            - since: Only return the logs at or after this time.
+            - until: Only return the logs before this time.
+        Returns:
+            An iterator over the lines.
+        """
+        for log in self.get_log_manager().iter_runs(rule_name, since, until):
+            yield json.dumps(log.to_dict()) + "\n"
+
+    @staticmethod
+    def __encode_cursor(log: LogRecord) -> str:
+        """ Builds the cursor pointing right after a log.
+        ---
+        Parameters:
+            - log: The last log of a page.
+        Returns:
+            An opaque URL-safe cursor string.
+        """
+        key: str = json.dumps([log.time.isoformat(), log.rule_name])
+        return base64.urlsafe_b64encode(key.encode("utf-8")).decode("ascii")
+
+    @staticmethod
+    def __decode_cursor(cursor: str) -> Tuple[datetime, str]:
+        """ Gets the log key a cursor points after.
+        ---
+        Parameters:
+            - cursor: A cursor built by `__encode_cursor`.
+        Returns:
+            A (time, rule name) tuple.
+        Throws:
+            - ValueError if the cursor is not valid.
+        """
+        try:
+            time, rule_name = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+            return (datetime.fromisoformat(time), str(rule_name))
+        except (ValueError, TypeError) as ex:
+            raise ValueError("Invalid cursor.") from ex
@@ -2,6 +2,7 @@
 """
 
 import json
+from typing import Iterator, Optional
 from dms2021core.data.rest import RestResponse
 from dms2021sensor.logic import RuleManager
 from dms2021sensor.data.db.exc import RuleNotExistsError, RuleExistsError
@@ -56,16 +57,17 @@ class Rule():
         """
         self.__auth_service = auth_service
 
-    def get_all_rules(self, user: str) -> RestResponse:
+    def get_all_rules(self, user: str, token: Optional[str] = None) -> RestResponse:
         """ Gets all rules.
         ---
         Parameters:
             - user: The username string.
+            - token: The capability token sent by the requestor, if any.
         Returns:
             A RestResponse object holding the result of the operation.
         """
         try:
-            if not self.get_auth_service().has_right(user, "AdminRules"):
+            if not self.get_auth_service().has_right(user, "AdminRules", token):
                 return RestResponse(code=401, mime_type="text/plain")
         except NotFoundError:
             return RestResponse(code=401, mime_type="text/plain")
@@ -74,17 +76,44 @@ class Rule():
         json_response = json.dumps(json_content)
         return RestResponse(json_response, mime_type="application/json")
 
-    def get_rule(self, rule_name: str, user: str) -> RestResponse:
+    def stream_all_rules(self, user: str, token: Optional[str] = None) -> RestResponse:
+        """ Streams all rules as newline-delimited JSON.
+        ---
+        Parameters:
+            - user: The username string.
+            - token: The capability token sent by the requestor, if any.
+        Returns:
+            A RestResponse object holding the result of the operation. On success
+            its content is an iterator yielding one JSON object per line.
+        """
+        try:
+            if not self.get_auth_service().has_right(user, "AdminRules", token):
+                return RestResponse(code=401, mime_type="text/plain")
+        except NotFoundError:
+            return RestResponse(code=401, mime_type="text/plain")
+        return RestResponse(self.__ndjson_lines(), mime_type="application/x-ndjson")
+
+    def __ndjson_lines(self) -> Iterator[str]:
+        """ Encodes the rules as they are read, one JSON object per line.
+        ---
+        Returns:
+            An iterator over the lines.
+        """
+        for rule in self.get_rule_manager().iter_all_rules():
+            yield json.dumps(rule.to_dict()) + "\n"
+
+    def get_rule(self, rule_name: str, user: str, token: Optional[str] = None) -> RestResponse:
         """ Gets a rule.
         ---
         Parameters:
             - rulename: The rule name string.
             - user: The username string.
+            - token: The capability token sent by the requestor, if any.
         Returns:
             A RestResponse object holding the result of the operation.
         """
         try:
-            if not self.get_auth_service().has_right(user, "AdminRules"):
+            if not self.get_auth_service().has_right(user, "AdminRules", token):
                 return RestResponse(code=401, mime_type="text/plain")
             result = self.get_rule_manager().get_rule(rule_name)
             json_response = json.dumps(str(result))
@@ -96,17 +125,19 @@ class Rule():
         except NotFoundError:
             return RestResponse(code=401, mime_type="text/plain")
 
-    def delete_rule(self, rule_name: str, user: str) -> RestResponse:
+    def delete_rule(self, rule_name: str, user: str,
+                    token: Optional[str] = None) -> RestResponse:
         """ Deletes a rule.
         ---
         Parameters:
             - rulename: The rule name string.
             - user: The username string.
+            - token: The capability token sent by the requestor, if any.
         Returns:
             A RestResponse object holding the result of the operation.
         """
         try:
-            if not self.get_auth_service().has_right(user, "AdminRules"):
+            if not self.get_auth_service().has_right(user, "AdminRules", token):
                 return RestResponse(code=401, mime_type="text/plain")
             self.get_rule_manager().delete_rule(rule_name)
         except ValueError:
@@ -118,7 +149,7 @@ class Rule():
         return RestResponse(mime_type="text/plain")
 
     def create_rule(self, rule_name:str, rule_type: str, data: str, frequency: int,
-        user: str) -> RestResponse:
+        user: str, token: Optional[str] = None) -> RestResponse:
         """ Creates a rule.
         ---
         Parameters:
@@ -127,11 +158,12 @@ class Rule():
             - ruleargs: A command or a file path.
             - frequency (seconds): 0 if it does not execute automatically.
             - user: The username string.
+            - token: The capability token sent by the requestor, if any.
         Returns:
             A RestResponse object holding the result of the operation.
         """
         try:
-            if not self.get_auth_service().has_right(user, "AdminRules"):
+            if not self.get_auth_service().has_right(user, "AdminRules", token):
                 return RestResponse(code=401, mime_type="text/plain")
             self.get_rule_manager().create_rule(rule_name, rule_type, data, frequency)
         except ValueError:
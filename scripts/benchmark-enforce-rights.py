@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+""" Micro-benchmark of UserRightValidator.enforce_rights.
+
+Counts the SQL statements and measures the time of a rights enforcement, both
+with the previous per-right lookups and with the current single query, on an
+in-memory database.
+"""
+
+import time
+from typing import List
+from sqlalchemy import event  # type: ignore
+from sqlalchemy.engine import Engine  # type: ignore
+from dms2021core.data import UserRightName
+from dms2021auth.data.config import AuthConfiguration
+from dms2021auth.data.db import Schema
+from dms2021auth.data.db.resultsets import UserSessions
+from dms2021auth.logic import UserManager, UserSessionManager, UserRightManager, UserRightValidator
+from dms2021auth.logic.exc import InsufficientRightsError
+
+ITERATIONS: int = 1000
+RIGHTS: List[UserRightName] = [UserRightName.AdminUsers, UserRightName.AdminRights]
+
+statements: List[int] = [0]
+
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def count_statement(*args):  # pylint: disable=unused-argument
+    """ Counts every statement sent to the database.
+    """
+    statements[0] += 1
+
+
+def enforce_rights_per_right(validator: UserRightValidator, session_token: str,
+                             rights: List[UserRightName]):
+    """ The previous enforcement: the session, then one lookup per right.
+    """
+    session = validator.get_schema().new_session()
+    user_session = UserSessions.get_active_user_session(session, session_token)
+    for right in rights:
+        if not validator.has_right(user_session.username, right):
+            raise InsufficientRightsError()
+
+
+def measure(name: str, function, validator: UserRightValidator, session_token: str):
+    """ Runs an enforcement function and prints its statements and time per call.
+    """
+    statements[0] = 0
+    started: float = time.perf_counter()
+    for _ in range(ITERATIONS):
+        function(validator, session_token, RIGHTS)
+    elapsed: float = time.perf_counter() - started
+    print('%-10s %6.2f queries/call %8.1f us/call'
+          % (name, statements[0] / ITERATIONS, elapsed / ITERATIONS * 1e6))
+
+
+def main():
+    """ Sets up an admin user with a session and runs both enforcements.
+    """
+    cfg: AuthConfiguration = AuthConfiguration()
+    cfg.set_value('db_connection_string', 'sqlite://')
+    # Served from memory otherwise, so neither enforcement would reach the database
+    cfg.set_value('session_cache', {'capacity': 0})
+    cfg.set_value('rights_snapshot', {'enabled': False})
+    db: Schema = Schema(cfg)
+    validator: UserRightValidator = UserRightValidator(db)
+    user_manager: UserManager = UserManager(cfg, db)
+    user_session_manager: UserSessionManager = UserSessionManager(cfg, db, user_manager)
+    user_right_manager: UserRightManager = UserRightManager(cfg, db, user_session_manager)
+    user_manager.create_user('admin', 'admin', '', validator, superuser=True)
+    for right in RIGHTS:
+        user_right_manager.grant('admin', right, '', validator, superuser=True)
+    session_token: str = user_session_manager.login('admin', 'admin')
+
+    measure('before', enforce_rights_per_right, validator, session_token)
+    measure('after', UserRightValidator.enforce_rights, validator, session_token)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+""" Check of the sensor service log pagination.
+
+Pages through the logs of an in-memory database, with and without a rule
+filter, and verifies that every page after the first one is looked up by
+seeking its key in an index instead of scanning the index from its start, so a
+page costs the same no matter how deep it is.
+"""
+
+import sys
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+from sqlalchemy import event  # type: ignore
+from sqlalchemy.engine import Engine  # type: ignore
+from dms2021sensor.data.config import SensorConfiguration
+from dms2021sensor.data.db import Schema
+from dms2021sensor.data.db.results import Log
+from dms2021sensor.data.db.resultsets import Logs, Rules
+
+RULES: int = 5
+LOGS_PER_RULE: int = 200
+PAGE_SIZE: int = 50
+
+plans: List[str] = []
+
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def explain_query(conn, cursor, statement, parameters, *args):  # pylint: disable=unused-argument
+    """ Records the query plan of every query on the logs.
+    """
+    if statement.lstrip().upper().startswith('SELECT') and 'FROM logs' in statement:
+        cursor.execute('EXPLAIN QUERY PLAN ' + statement, parameters)
+        plans.append(' / '.join(str(row[-1]) for row in cursor.fetchall()))
+
+
+def paginate(schema: Schema, rule_name: Optional[str]) -> int:
+    """ Reads every page of logs, checking the plan of the pages after the first one.
+    ---
+    Returns:
+        The number of pages whose plan scans an index or table.
+    """
+    session = schema.new_session()
+    after: Optional[Tuple[datetime, str]] = None
+    seen: int = 0
+    failures: int = 0
+    while True:
+        del plans[:]
+        page: List[Log] = Logs.get_runs(session, rule_name=rule_name, after=after,
+                                        limit=PAGE_SIZE)
+        if after is not None and any('SCAN' in plan for plan in plans):
+            failures += 1
+            print('Page after %s reads from the start: %s' % (after, plans))
+        if not page:
+            break
+        seen += len(page)
+        after = (page[-1].time, page[-1].rule_name)
+    expected: int = LOGS_PER_RULE * (1 if rule_name is not None else RULES)
+    if seen != expected:
+        failures += 1
+        print('Read %d logs instead of %d' % (seen, expected))
+    return failures
+
+
+def main():
+    """ Fills the database with logs and pages through them.
+    """
+    cfg: SensorConfiguration = SensorConfiguration()
+    cfg.set_value('db_connection_string', 'sqlite://')
+    schema: Schema = Schema(cfg)
+    session = schema.new_session()
+    started: datetime = datetime(2021, 1, 1)
+    for rule in range(RULES):
+        Rules.create(session, 'rule%d' % rule, 'command', 'true', 0)
+    # Several rules log at the same times, so pages also break between equal times
+    session.add_all([
+        Log('rule%d' % rule, started + timedelta(seconds=second), '')
+        for rule in range(RULES) for second in range(LOGS_PER_RULE)
+    ])
+    session.commit()
+
+    failures: int = paginate(schema, None) + paginate(schema, 'rule2')
+    print('OK' if failures == 0 else '%d failures' % failures)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()